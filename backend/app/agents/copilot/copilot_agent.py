@@ -1,7 +1,11 @@
+import logging
 import os
 import json
 import uuid
 from typing import Dict, Any, List
+
+logger = logging.getLogger(__name__)
+
 try:
     from openai import OpenAI
 except ImportError:
@@ -85,7 +89,7 @@ class CopilotAgent:
             content = response.choices[0].message.content
             return json.loads(content)
         except Exception as e:
-            print(f"Copilot generation error: {e}")
+            logger.error("Copilot generation error: %s", e)
             return self._mock_response(user_request)
 
     def _mock_response(self, user_request: str) -> Dict[str, Any]:
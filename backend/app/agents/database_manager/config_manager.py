@@ -1,8 +1,11 @@
+import logging
 import os
 import json
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
 load_dotenv()
 
 class ConfigManager:
@@ -48,7 +51,7 @@ class ConfigManager:
                 return res.data[0]
             return {}
         except Exception as e:
-            print(f"[ConfigManager] Error saving config for {chatbot_id}: {e}")
+            logger.error("[ConfigManager] Error saving config for %s: %s", chatbot_id, e)
             return None
 
     def get_config(self, chatbot_id: str) -> dict:
@@ -63,7 +66,7 @@ class ConfigManager:
                 return json.loads(item['env_value'])
             return {}
         except Exception as e:
-            print(f"[ConfigManager] Error retrieving config for {chatbot_id}: {e}")
+            logger.error("[ConfigManager] Error retrieving config for %s: %s", chatbot_id, e)
             return {}
 
     def list_agents(self):
@@ -74,7 +77,7 @@ class ConfigManager:
             response = self.supabase.table("chatbot_env_configs").select("chatbot_id").eq("env_key", "full_config").execute()
             return [item['chatbot_id'] for item in response.data]
         except Exception as e:
-            print(f"[ConfigManager] Error listing agents: {e}")
+            logger.error("[ConfigManager] Error listing agents: %s", e)
             return []
 
     def test_connection(self):
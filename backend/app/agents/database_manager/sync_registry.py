@@ -1,3 +1,4 @@
+import logging
 import os
 import json
 from database_manager.config_manager import get_config_manager
@@ -6,6 +7,8 @@ from agent_availability.prompt import AVAILABILITY_PROMPT
 from agent_patient.prompt import PATIENT_AGENT_PROMPT
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
 load_dotenv()
 
 def sync():
@@ -31,12 +34,12 @@ def sync():
     }
     
     for agent_name, config in agents.items():
-        print(f"Syncing {agent_name}...")
+        logger.debug("Syncing %s...", agent_name)
         res = manager.save_config(agent_name, config)
         if res:
-            print(f"✅ {agent_name} synced.")
+            logger.debug("✅ %s synced.", agent_name)
         else:
-            print(f"❌ Failed to sync {agent_name}.")
+            logger.error("❌ Failed to sync %s.", agent_name)
 
 if __name__ == "__main__":
     sync()
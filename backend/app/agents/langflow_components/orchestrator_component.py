@@ -1,3 +1,4 @@
+import logging
 from langflow.custom import Component
 from langflow.io import MessageInput, Output
 from langflow.schema import Message
@@ -5,6 +6,8 @@ import sys
 import os
 import traceback
 
+logger = logging.getLogger(__name__)
+
 class OrchestratorComponent(Component):
     display_name = "Core Strategy Orchestrator"
     description = "The central routing engine that analyzes user intent and dispatches to specialized domain agents (FAQ, Availability, Booking, Patient)."
@@ -72,5 +75,5 @@ class OrchestratorComponent(Component):
         except Exception as e:
             # Detailed error logging for premium debugging
             error_trace = traceback.format_exc()
-            print(f"Orchestrator Error:\n{error_trace}")
+            logger.error("Orchestrator Error:\n%s", error_trace)
             return Message(text=f"⚠️ Orchestration Error: {str(e)}")
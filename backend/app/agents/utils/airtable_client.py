@@ -1,9 +1,12 @@
 # utils/airtable_client.py - VERSION COMPLÈTE CORRIGÉE
 
+import logging
 import os
 import requests
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
 load_dotenv()
 
 # Configuration
@@ -12,12 +15,13 @@ AIRTABLE_API_KEY = os.getenv("AIRTABLE_API_KEY", "pat...")
 AIRTABLE_PATIENTS_TABLE = os.getenv("AIRTABLE_PATIENTS_TABLE", "tblW4LetJ1YeijS4i")
 AIRTABLE_APPOINTMENTS_TABLE = os.getenv("AIRTABLE_APPOINTMENTS_TABLE", "tbleZ3nzvr5VmQrAd")
 
-print(f"""[AIRTABLE] Configuration:
-  - BASE_ID: {'✓' if AIRTABLE_BASE_ID else '✗'}
-  - API_KEY: {'✓' if AIRTABLE_API_KEY else '✗'}
-  - Table Patients: {AIRTABLE_PATIENTS_TABLE}
-  - Table Appointments: {AIRTABLE_APPOINTMENTS_TABLE}
-""")
+logger.debug(
+    "[AIRTABLE] Configuration: BASE_ID=%s API_KEY=%s Table Patients=%s Table Appointments=%s",
+    '✓' if AIRTABLE_BASE_ID else '✗',
+    '✓' if AIRTABLE_API_KEY else '✗',
+    AIRTABLE_PATIENTS_TABLE,
+    AIRTABLE_APPOINTMENTS_TABLE,
+)
 
 class AirtableBase:
     def __init__(self, table_name: str):
@@ -35,9 +39,9 @@ class AirtableBase:
         url = f"{self.base_url}{endpoint}"
         
         try:
-            print(f"[AIRTABLE] Requête {method} vers: {url}")
+            logger.debug("[AIRTABLE] Requête %s vers: %s", method, url)
             if params:
-                print(f"[AIRTABLE] Params: {params}")
+                logger.debug("[AIRTABLE] Params: %s", params)
             
             if method == "GET":
                 response = requests.get(url, headers=self.headers, params=params)
@@ -54,20 +58,20 @@ class AirtableBase:
             return response.json()
             
         except requests.exceptions.RequestException as e:
-            print(f"[AIRTABLE] ❌ Erreur {method} {url}: {e}")
+            logger.error("[AIRTABLE] ❌ Erreur %s %s: %s", method, url, e)
             if hasattr(e, 'response') and e.response:
-                print(f"[AIRTABLE] Détails: {e.response.text}")
+                logger.error("[AIRTABLE] Détails: %s", e.response.text)
             return None
 
 class AirtablePatients(AirtableBase):
     def __init__(self):
         super().__init__(AIRTABLE_PATIENTS_TABLE)
-        print(f"[AIRTABLE PATIENTS] ✅ Connecté à la table: {self.table_name}")
+        logger.debug("[AIRTABLE PATIENTS] ✅ Connecté à la table: %s", self.table_name)
     
     def get_patient_by_email(self, email: str):
         """Trouve un patient par email"""
         try:
-            print(f"[PATIENTS] 🔍 Recherche par email: {email}")
+            logger.debug("[PATIENTS] 🔍 Recherche par email: %s", email)
             
             formula = f"{{email}} = '{email}'"
             params = {
@@ -80,7 +84,7 @@ class AirtablePatients(AirtableBase):
             if response and "records" in response and len(response["records"]) > 0:
                 record = response["records"][0]
                 fields = record.get("fields", {})
-                print(f"[PATIENTS] ✅ Patient trouvé: {fields.get('full_name')}")
+                logger.debug("[PATIENTS] ✅ Patient trouvé: %s", fields.get('full_name'))
                 return {
                     "id": record.get("id"),
                     "name": fields.get("full_name"),
@@ -88,11 +92,11 @@ class AirtablePatients(AirtableBase):
                     "phone": fields.get("phone", "")
                 }
             else:
-                print(f"[PATIENTS] ℹ️  Aucun patient pour email: {email}")
+                logger.debug("[PATIENTS] ℹ️  Aucun patient pour email: %s", email)
                 return None
                 
         except Exception as e:
-            print(f"[PATIENTS] ❌ Erreur recherche: {e}")
+            logger.error("[PATIENTS] ❌ Erreur recherche: %s", e)
             return None
     
     def get_patient_by_phone(self, phone: str):
@@ -100,7 +104,7 @@ class AirtablePatients(AirtableBase):
         try:
             # Nettoyer le numéro (enlever espaces, +, etc.)
             clean_phone = ''.join(filter(str.isdigit, phone))
-            print(f"[PATIENTS] 🔍 Recherche par téléphone: {clean_phone}")
+            logger.debug("[PATIENTS] 🔍 Recherche par téléphone: %s", clean_phone)
             
             formula = f"{{phone}} = '{clean_phone}'"
             params = {
@@ -113,7 +117,7 @@ class AirtablePatients(AirtableBase):
             if response and "records" in response and len(response["records"]) > 0:
                 record = response["records"][0]
                 fields = record.get("fields", {})
-                print(f"[PATIENTS] ✅ Patient trouvé par téléphone: {fields.get('full_name')}")
+                logger.debug("[PATIENTS] ✅ Patient trouvé par téléphone: %s", fields.get('full_name'))
                 return {
                     "id": record.get("id"),
                     "name": fields.get("full_name"),
@@ -121,17 +125,17 @@ class AirtablePatients(AirtableBase):
                     "phone": fields.get("phone", "")
                 }
             else:
-                print(f"[PATIENTS] ℹ️  Aucun patient pour téléphone: {clean_phone}")
+                logger.debug("[PATIENTS] ℹ️  Aucun patient pour téléphone: %s", clean_phone)
                 return None
                 
         except Exception as e:
-            print(f"[PATIENTS] ❌ Erreur recherche téléphone: {e}")
+            logger.error("[PATIENTS] ❌ Erreur recherche téléphone: %s", e)
             return None
     
     def create_patient(self, patient_data: dict):
         """Crée un nouveau patient"""
         try:
-            print(f"[PATIENTS] 📝 Création: {patient_data.get('name')}")
+            logger.debug("[PATIENTS] 📝 Création: %s", patient_data.get('name'))
             
             # Nettoyer le téléphone
             phone = patient_data.get("phone", "")
@@ -143,13 +147,13 @@ class AirtablePatients(AirtableBase):
                 "phone": clean_phone
             }
             
-            print(f"[PATIENTS] 📊 Champs envoyés: {fields}")
+            logger.debug("[PATIENTS] 📊 Champs envoyés: %s", fields)
             
             data = {"fields": fields}
             response = self._make_request("POST", data=data)
             
             if response:
-                print(f"[PATIENTS] ✅ Patient créé: {response.get('id')}")
+                logger.debug("[PATIENTS] ✅ Patient créé: %s", response.get('id'))
                 fields = response.get("fields", {})
                 return {
                     "id": response.get("id"),
@@ -158,22 +162,22 @@ class AirtablePatients(AirtableBase):
                     "phone": fields.get("phone", "")
                 }
             else:
-                print(f"[PATIENTS] ❌ Échec création")
+                logger.error("[PATIENTS] ❌ Échec création")
                 return None
                 
         except Exception as e:
-            print(f"[PATIENTS] ❌ Erreur création: {e}")
+            logger.error("[PATIENTS] ❌ Erreur création: %s", e)
             return None
 
 class AirtableAppointments(AirtableBase):
     def __init__(self):
         super().__init__(AIRTABLE_APPOINTMENTS_TABLE)
-        print(f"[AIRTABLE APPOINTMENTS] ✅ Connecté à la table: {self.table_name}")
+        logger.debug("[AIRTABLE APPOINTMENTS] ✅ Connecté à la table: %s", self.table_name)
     
     def create_appointment(self, data: dict):
         """Crée un nouveau rendez-vous"""
         try:
-            print(f"[APPOINTMENTS] 📝 Création RDV: {data.get('patient_name')}")
+            logger.debug("[APPOINTMENTS] 📝 Création RDV: %s", data.get('patient_name'))
             
             # STRUCTURE SIMPLE
             fields = {
@@ -198,31 +202,29 @@ class AirtableAppointments(AirtableBase):
             else:
                 fields["status"] = "confirmed"
             
-            print(f"[APPOINTMENTS] 📊 Données envoyées: {fields}")
+            logger.debug("[APPOINTMENTS] 📊 Données envoyées: %s", fields)
             
             response = self._make_request("POST", data={"fields": fields})
             
             if response:
                 appointment_id = response.get("id")
-                print(f"[APPOINTMENTS] ✅ Rendez-vous créé: {appointment_id}")
+                logger.debug("[APPOINTMENTS] ✅ Rendez-vous créé: %s", appointment_id)
                 return {
                     "id": appointment_id,
                     "fields": response.get("fields", {})
                 }
             else:
-                print(f"[APPOINTMENTS] ❌ Échec création")
+                logger.error("[APPOINTMENTS] ❌ Échec création")
                 return None
                 
         except Exception as e:
-            print(f"[APPOINTMENTS] ❌ Erreur création: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[APPOINTMENTS] ❌ Erreur création: %s", e)
             return None
     
     def get_all_appointments(self, max_records: int = 100):
         """Récupère tous les rendez-vous (pour filtrage local)"""
         try:
-            print(f"[APPOINTMENTS] 🔍 Récupération de tous les RDV (max: {max_records})")
+            logger.debug("[APPOINTMENTS] 🔍 Récupération de tous les RDV (max: %s)", max_records)
             
             params = {
                 "maxRecords": max_records
@@ -247,20 +249,20 @@ class AirtableAppointments(AirtableBase):
                         "email": fields.get("email") or fields.get("Email", "")
                     })
                 
-                print(f"[APPOINTMENTS] ✅ {len(appointments)} RDV récupérés")
+                logger.debug("[APPOINTMENTS] ✅ %s RDV récupérés", len(appointments))
                 return appointments
             else:
-                print(f"[APPOINTMENTS] ℹ️  Aucun RDV trouvé")
+                logger.debug("[APPOINTMENTS] ℹ️  Aucun RDV trouvé")
                 return []
                 
         except Exception as e:
-            print(f"[APPOINTMENTS] ❌ Erreur récupération: {e}")
+            logger.error("[APPOINTMENTS] ❌ Erreur récupération: %s", e)
             return []
     
     def get_appointments_by_email(self, email: str):
         """Récupère les rendez-vous par email - VERSION SIMPLE"""
         try:
-            print(f"[APPOINTMENTS] 🔍 Recherche RDV pour email: {email}")
+            logger.debug("[APPOINTMENTS] 🔍 Recherche RDV pour email: %s", email)
             
             # Récupérer tous les RDV et filtrer localement
             all_appointments = self.get_all_appointments()
@@ -284,11 +286,11 @@ class AirtableAppointments(AirtableBase):
                         "phone": appt.get("phone")
                     })
             
-            print(f"[APPOINTMENTS] ✅ {len(matching_appointments)} RDV trouvés pour {email}")
+            logger.debug("[APPOINTMENTS] ✅ %s RDV trouvés pour %s", len(matching_appointments), email)
             return matching_appointments
             
         except Exception as e:
-            print(f"[APPOINTMENTS] ❌ Erreur recherche email: {e}")
+            logger.error("[APPOINTMENTS] ❌ Erreur recherche email: %s", e)
             return []
     
     def get_appointments_by_phone(self, phone: str):
@@ -296,7 +298,7 @@ class AirtableAppointments(AirtableBase):
         try:
             # Nettoyer le téléphone
             clean_phone = ''.join(filter(str.isdigit, phone))
-            print(f"[APPOINTMENTS] 🔍 Recherche RDV pour téléphone: {clean_phone}")
+            logger.debug("[APPOINTMENTS] 🔍 Recherche RDV pour téléphone: %s", clean_phone)
             
             # Récupérer tous les RDV et filtrer localement
             all_appointments = self.get_all_appointments()
@@ -323,18 +325,18 @@ class AirtableAppointments(AirtableBase):
                         "email": appt.get("email", "")
                     })
             
-            print(f"[APPOINTMENTS] ✅ {len(matching_appointments)} RDV trouvés par téléphone")
+            logger.debug("[APPOINTMENTS] ✅ %s RDV trouvés par téléphone", len(matching_appointments))
             return matching_appointments
             
         except Exception as e:
-            print(f"[APPOINTMENTS] ❌ Erreur recherche téléphone: {e}")
+            logger.error("[APPOINTMENTS] ❌ Erreur recherche téléphone: %s", e)
             return []
     
     def update_appointment(self, appointment_id: str, data: dict):
         """Met à jour un rendez-vous"""
         try:
-            print(f"[APPOINTMENTS] 🔄 Mise à jour RDV: {appointment_id}")
-            print(f"[APPOINTMENTS] 📊 Données reçues: {data}")
+            logger.debug("[APPOINTMENTS] 🔄 Mise à jour RDV: %s", appointment_id)
+            logger.debug("[APPOINTMENTS] 📊 Données reçues: %s", data)
             
             fields = {}
             
@@ -364,10 +366,10 @@ class AirtableAppointments(AirtableBase):
                 fields["phone"] = clean_phone
             
             if not fields:
-                print(f"[APPOINTMENTS] ⚠️ Aucun champ à mettre à jour")
+                logger.warning("[APPOINTMENTS] ⚠️ Aucun champ à mettre à jour")
                 return False
             
-            print(f"[APPOINTMENTS] 📊 Mise à jour avec: {fields}")
+            logger.debug("[APPOINTMENTS] 📊 Mise à jour avec: %s", fields)
             
             # Utiliser la méthode _make_request pour PATCH
             response = self._make_request("PATCH", 
@@ -375,16 +377,14 @@ class AirtableAppointments(AirtableBase):
                                          data={"fields": fields})
             
             if response:
-                print(f"[APPOINTMENTS] ✅ RDV mis à jour")
+                logger.debug("[APPOINTMENTS] ✅ RDV mis à jour")
                 return True
             else:
-                print(f"[APPOINTMENTS] ❌ Échec mise à jour")
+                logger.error("[APPOINTMENTS] ❌ Échec mise à jour")
                 return False
                 
         except Exception as e:
-            print(f"[APPOINTMENTS] ❌ Erreur mise à jour: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("[APPOINTMENTS] ❌ Erreur mise à jour: %s", e)
             return False
     
     def find_appointment_by_phone_and_date(self, phone: str, date: str = None):
@@ -408,7 +408,7 @@ class AirtableAppointments(AirtableBase):
                     if date:
                         appt_date = appt.get("date", "")
                         if appt_date == date:
-                            print(f"[APPOINTMENTS] ✅ RDV trouvé pour {date}")
+                            logger.debug("[APPOINTMENTS] ✅ RDV trouvé pour %s", date)
                             return {
                                 "id": appt.get("id"),
                                 "fields": appt.get("record", {}).get("fields", {})
@@ -419,11 +419,11 @@ class AirtableAppointments(AirtableBase):
             if not date and matching_appointments:
                 return matching_appointments
             
-            print(f"[APPOINTMENTS] ℹ️  Aucun RDV pour téléphone: {clean_phone}")
+            logger.debug("[APPOINTMENTS] ℹ️  Aucun RDV pour téléphone: %s", clean_phone)
             return None
             
         except Exception as e:
-            print(f"[APPOINTMENTS] ❌ Erreur recherche: {e}")
+            logger.error("[APPOINTMENTS] ❌ Erreur recherche: %s", e)
             return None
 
 # Instances globales
@@ -1,8 +1,11 @@
+import logging
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 from utils.llms import LLMModel
 from database_manager.config_manager import get_config_manager
 
+logger = logging.getLogger(__name__)
+
 class BaseAgent(ABC):
     """
     Base abstract class for all AI agents in the Studio.
@@ -25,7 +28,7 @@ class BaseAgent(ABC):
         
         self.history = []
         source = "studio injection" if config else "database settings"
-        print(f"[{self.agent_name}] initialized via {source}.")
+        logger.debug("[%s] initialized via %s.", self.agent_name, source)
 
     @abstractmethod
     def run(self, user_input: str, state: Optional[Dict[str, Any]] = None) -> str:
@@ -43,7 +46,7 @@ class BaseAgent(ABC):
         Resets the agent's internal state and history.
         """
         self.history = []
-        print(f"[{self.agent_name}] state reset.")
+        logger.debug("[%s] state reset.", self.agent_name)
 
     def get_info(self) -> Dict[str, Any]:
         """
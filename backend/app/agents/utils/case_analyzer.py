@@ -3,11 +3,14 @@ Case Analyzer Module
 Analyzes complex cases using LLM
 """
 
+import logging
 from typing import Dict, Any, List, Optional, Tuple
 import json
 from datetime import datetime
 import re
 
+logger = logging.getLogger(__name__)
+
 class CaseAnalyzer:
     """
     Analyzes complex cases escalated to supervisor using LLM
@@ -43,7 +46,7 @@ class CaseAnalyzer:
         from supervisor.prompt import get_supervisor_prompt
         
         try:
-            print(f"🔍 Supervisor analyzing case: {case_data.get('description', 'Unknown')[:50]}...")
+            logger.debug("🔍 Supervisor analyzing case: %s...", case_data.get('description', 'Unknown')[:50])
             
             # Prepare prompt
             prompt = get_supervisor_prompt("case_analysis")
@@ -76,12 +79,12 @@ class CaseAnalyzer:
             # Log analysis
             self.case_log.append(analysis)
             
-            print(f"✅ Case analysis complete: {analysis.get('analysis_id')}")
+            logger.debug("✅ Case analysis complete: %s", analysis.get('analysis_id'))
             
             return analysis
             
         except Exception as e:
-            print(f"❌ Case analysis error: {e}")
+            logger.error("❌ Case analysis error: %s", e)
             return self._get_fallback_analysis(case_data)
     
     def _parse_analysis_response(self, response_text: str) -> Dict[str, Any]:
@@ -137,7 +140,7 @@ class CaseAnalyzer:
                 return sections
                 
         except Exception as e:
-            print(f"❌ Response parsing error: {e}")
+            logger.error("❌ Response parsing error: %s", e)
             return {
                 "raw_response": response_text,
                 "parsing_error": str(e),
@@ -3,12 +3,15 @@ Decision Maker Module
 Makes intelligent decisions using LLM
 """
 
+import logging
 from typing import Dict, Any, List, Optional, Tuple
 import json
 from datetime import datetime
 from enum import Enum
 import re
 
+logger = logging.getLogger(__name__)
+
 class DecisionType(Enum):
     """Types of decisions supervisor can make"""
     AUTO_RESOLVE = "AUTO_RESOLVE"
@@ -57,7 +60,7 @@ class DecisionMaker:
         from supervisor.prompt import get_supervisor_prompt
         
         try:
-            print(f"🤔 Supervisor making decision for: {issue_data.get('type', 'Unknown')}")
+            logger.debug("🤔 Supervisor making decision for: %s", issue_data.get('type', 'Unknown'))
             
             # Prepare decision prompt
             prompt = get_supervisor_prompt("escalation")
@@ -96,12 +99,12 @@ class DecisionMaker:
             # Log decision
             self.decision_log.append(decision)
             
-            print(f"✅ Decision made: {decision.get('decision_type', 'Unknown')}")
+            logger.debug("✅ Decision made: %s", decision.get('decision_type', 'Unknown'))
             
             return decision
             
         except Exception as e:
-            print(f"❌ Decision making error: {e}")
+            logger.error("❌ Decision making error: %s", e)
             return self._make_fallback_decision(issue_data)
     
     def _parse_decision_response(self, response_text: str) -> Dict[str, Any]:
@@ -139,7 +142,7 @@ class DecisionMaker:
                 }
                 
         except Exception as e:
-            print(f"❌ Decision parsing error: {e}")
+            logger.error("❌ Decision parsing error: %s", e)
             return {
                 "decision_type": DecisionType.ESCALATE_JUDGE.value,
                 "reason": f"Parsing error: {str(e)}",
@@ -305,7 +308,7 @@ class DecisionMaker:
             return evaluation
             
         except Exception as e:
-            print(f"❌ Performance evaluation error: {e}")
+            logger.error("❌ Performance evaluation error: %s", e)
             return self._fallback_performance_evaluation(agent_data)
     
     def _parse_evaluation_response(self, response_text: str) -> Dict[str, Any]:
@@ -7,6 +7,8 @@ from email.mime.multipart import MIMEMultipart
 import logging
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
 load_dotenv()
 
 # Configuration
@@ -22,7 +24,7 @@ SMTP_CONFIGURED = all([SMTP_SERVER, SMTP_PORT, SMTP_USERNAME, SMTP_PASSWORD, EMA
 
 if not SMTP_CONFIGURED:
     logging.warning("⚠️ SMTP credentials not configured. Email sending will be simulated.")
-    print("[EMAIL] ⚠️  SMTP non configuré. Simulation activée.")
+    logger.warning("[EMAIL] ⚠️  SMTP non configuré. Simulation activée.")
 
 def send_email(to_email: str, subject: str, html_body: str, text_body: str = None) -> dict:
     """
@@ -30,9 +32,9 @@ def send_email(to_email: str, subject: str, html_body: str, text_body: str = Non
     """
     if not SMTP_CONFIGURED:
         # Mode simulation
-        print(f"[EMAIL SIMULATION] ✉️  À: {to_email}")
-        print(f"[EMAIL SIMULATION] 📧 Sujet: {subject}")
-        print(f"[EMAIL SIMULATION] 📄 Contenu simulé (premières 100 chars): {html_body[:100]}...")
+        logger.debug("[EMAIL SIMULATION] ✉️  À: %s", to_email)
+        logger.debug("[EMAIL SIMULATION] 📧 Sujet: %s", subject)
+        logger.debug("[EMAIL SIMULATION] 📄 Contenu simulé (premières 100 chars): %s...", html_body[:100])
         return {"success": True, "message": "Email simulé (SMTP non configuré)"}
     
     try:
@@ -52,20 +54,20 @@ def send_email(to_email: str, subject: str, html_body: str, text_body: str = Non
         msg.attach(part2)
         
         # Connexion et envoi
-        print(f"[EMAIL] 🔗 Connexion à {SMTP_SERVER}:{SMTP_PORT}...")
+        logger.debug("[EMAIL] 🔗 Connexion à %s:%s...", SMTP_SERVER, SMTP_PORT)
         with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
             server.starttls()
-            print(f"[EMAIL] 🔐 Authentification avec {SMTP_USERNAME}...")
+            logger.debug("[EMAIL] 🔐 Authentification avec %s...", SMTP_USERNAME)
             server.login(SMTP_USERNAME, SMTP_PASSWORD)
-            print(f"[EMAIL] 📤 Envoi à {to_email}...")
+            logger.debug("[EMAIL] 📤 Envoi à %s...", to_email)
             server.send_message(msg)
         
-        print(f"[EMAIL] ✅ Email envoyé à {to_email}")
+        logger.debug("[EMAIL] ✅ Email envoyé à %s", to_email)
         return {"success": True, "message": "Email envoyé avec succès"}
         
     except Exception as e:
         error_msg = f"Erreur envoi email: {str(e)}"
-        print(f"[EMAIL] ❌ {error_msg}")
+        logger.error("[EMAIL] ❌ %s", error_msg)
         return {"success": False, "error": error_msg}
 
 def send_confirmation_email(to_email: str, subject: str, html_body: str) -> dict:
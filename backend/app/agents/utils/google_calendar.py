@@ -31,7 +31,7 @@ class GoogleCalendarClient:
             # Vérifier si les fichiers existent
             if not os.path.exists(credentials_path):
                 logger.warning(f"Fichier credentials.json introuvable: {credentials_path}")
-                print("[GOOGLE CALENDAR] ⚠️  Fichier credentials.json introuvable")
+                logger.warning("[GOOGLE CALENDAR] ⚠️  Fichier credentials.json introuvable")
                 return
 
             if os.path.exists(token_path):
@@ -52,14 +52,14 @@ class GoogleCalendarClient:
                 
                 if not creds:
                     try:
-                        print("[GOOGLE CALENDAR] 🔐 Authentification requise...")
+                        logger.debug("[GOOGLE CALENDAR] 🔐 Authentification requise...")
                         flow = InstalledAppFlow.from_client_secrets_file(
                             credentials_path, SCOPES
                         )
                         creds = flow.run_local_server(port=0)
                     except Exception as e:
                         logger.error(f"Erreur authentification Google: {e}")
-                        print(f"[GOOGLE CALENDAR] ❌ Erreur d'authentification: {e}")
+                        logger.error("[GOOGLE CALENDAR] ❌ Erreur d'authentification: %s", e)
                         return
 
                 try:
@@ -70,11 +70,11 @@ class GoogleCalendarClient:
 
             self.service = build("calendar", "v3", credentials=creds)
             self.connected = True
-            print("[GOOGLE CALENDAR] ✅ Connecté avec succès (lecture + écriture)")
+            logger.debug("[GOOGLE CALENDAR] ✅ Connecté avec succès (lecture + écriture)")
             
         except Exception as e:
             logger.error(f"Erreur initialisation Google Calendar: {e}")
-            print(f"[GOOGLE CALENDAR] ❌ Erreur d'initialisation: {e}")
+            logger.error("[GOOGLE CALENDAR] ❌ Erreur d'initialisation: %s", e)
             self.service = None
             self.connected = False
 
@@ -85,7 +85,7 @@ class GoogleCalendarClient:
         """
         # Si pas connecté, on considère le créneau comme disponible
         if not self.connected or not self.service:
-            print(f"[GOOGLE CALENDAR] ⚠️  Non connecté, on suppose disponible: {date} {time}")
+            logger.warning("[GOOGLE CALENDAR] ⚠️  Non connecté, on suppose disponible: %s %s", date, time)
             return True
         
         try:
@@ -98,7 +98,7 @@ class GoogleCalendarClient:
                 try:
                     start = datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M")
                 except:
-                    print(f"[GOOGLE CALENDAR] ❌ Format date/heure invalide: {date} {time}")
+                    logger.error("[GOOGLE CALENDAR] ❌ Format date/heure invalide: %s %s", date, time)
                     return True  # On assume disponible en cas d'erreur
             
             end = start + timedelta(minutes=30)  # Créneau de 30 minutes
@@ -107,7 +107,7 @@ class GoogleCalendarClient:
             time_min = start.isoformat() + "Z"
             time_max = end.isoformat() + "Z"
             
-            print(f"[GOOGLE CALENDAR] 🔍 Vérification: {time_min} à {time_max}")
+            logger.debug("[GOOGLE CALENDAR] 🔍 Vérification: %s à %s", time_min, time_max)
             
             # Requête à Google Calendar
             events_result = self.service.events().list(
@@ -121,17 +121,17 @@ class GoogleCalendarClient:
             events = events_result.get("items", [])
             
             if events:
-                print(f"[GOOGLE CALENDAR] ❌ Occupé: {len(events)} événement(s) trouvé(s)")
+                logger.debug("[GOOGLE CALENDAR] ❌ Occupé: %s événement(s) trouvé(s)", len(events))
                 for event in events:
-                    print(f"  - {event.get('summary', 'Sans titre')} ({event.get('start', {}).get('dateTime', 'N/A')})")
+                    logger.debug("  - %s (%s)", event.get('summary', 'Sans titre'), event.get('start', {}).get('dateTime', 'N/A'))
                 return False
             
-            print(f"[GOOGLE CALENDAR] ✅ Disponible: {date} à {time}")
+            logger.debug("[GOOGLE CALENDAR] ✅ Disponible: %s à %s", date, time)
             return True
             
         except Exception as e:
             logger.error(f"Erreur vérification créneau {date} {time}: {e}")
-            print(f"[GOOGLE CALENDAR] ⚠️  Erreur, on assume disponible: {e}")
+            logger.warning("[GOOGLE CALENDAR] ⚠️  Erreur, on assume disponible: %s", e)
             return True  # En cas d'erreur, on assume disponible
 
     # AJOUTE CES MÉTHODES POUR CRÉER/MODIFIER/SUPPRIMER DES ÉVÉNEMENTS:
@@ -141,20 +141,20 @@ class GoogleCalendarClient:
         Crée un événement dans Google Calendar
         """
         if not self.connected or not self.service:
-            print(f"[GOOGLE CALENDAR] ⚠️  Non connecté, impossible de créer l'événement")
+            logger.warning("[GOOGLE CALENDAR] ⚠️  Non connecté, impossible de créer l'événement")
             return None
         
         try:
-            print(f"[GOOGLE CALENDAR] 🗓️  Création événement...")
-            print(f"[GOOGLE CALENDAR] 📋 Données: {event_data.get('summary', 'Sans titre')}")
+            logger.debug("[GOOGLE CALENDAR] 🗓️  Création événement...")
+            logger.debug("[GOOGLE CALENDAR] 📋 Données: %s", event_data.get('summary', 'Sans titre'))
             
             event = self.service.events().insert(
                 calendarId=CALENDAR_ID,
                 body=event_data
             ).execute()
             
-            print(f"[GOOGLE CALENDAR] ✅ Événement créé: {event.get('id')}")
-            print(f"[GOOGLE CALENDAR] 🔗 Lien: {event.get('htmlLink')}")
+            logger.debug("[GOOGLE CALENDAR] ✅ Événement créé: %s", event.get('id'))
+            logger.debug("[GOOGLE CALENDAR] 🔗 Lien: %s", event.get('htmlLink'))
             
             return {
                 'id': event.get('id'),
@@ -166,7 +166,7 @@ class GoogleCalendarClient:
             
         except Exception as e:
             logger.error(f"Erreur création événement: {e}")
-            print(f"[GOOGLE CALENDAR] ❌ Erreur création: {e}")
+            logger.error("[GOOGLE CALENDAR] ❌ Erreur création: %s", e)
             return None
 
     def update_event(self, event_id: str, event_data: dict):
@@ -174,11 +174,11 @@ class GoogleCalendarClient:
         Met à jour un événement existant
         """
         if not self.connected or not self.service:
-            print(f"[GOOGLE CALENDAR] ⚠️  Non connecté, impossible de mettre à jour")
+            logger.warning("[GOOGLE CALENDAR] ⚠️  Non connecté, impossible de mettre à jour")
             return None
         
         try:
-            print(f"[GOOGLE CALENDAR] 🔄 Mise à jour événement: {event_id}")
+            logger.debug("[GOOGLE CALENDAR] 🔄 Mise à jour événement: %s", event_id)
             
             event = self.service.events().update(
                 calendarId=CALENDAR_ID,
@@ -186,12 +186,12 @@ class GoogleCalendarClient:
                 body=event_data
             ).execute()
             
-            print(f"[GOOGLE CALENDAR] ✅ Événement mis à jour: {event_id}")
+            logger.debug("[GOOGLE CALENDAR] ✅ Événement mis à jour: %s", event_id)
             return event
             
         except Exception as e:
             logger.error(f"Erreur mise à jour événement {event_id}: {e}")
-            print(f"[GOOGLE CALENDAR] ❌ Erreur mise à jour: {e}")
+            logger.error("[GOOGLE CALENDAR] ❌ Erreur mise à jour: %s", e)
             return None
 
     def delete_event(self, event_id: str):
@@ -199,49 +199,49 @@ class GoogleCalendarClient:
         Supprime un événement
         """
         if not self.connected or not self.service:
-            print(f"[GOOGLE CALENDAR] ⚠️  Non connecté, impossible de supprimer")
+            logger.warning("[GOOGLE CALENDAR] ⚠️  Non connecté, impossible de supprimer")
             return False
         
         try:
-            print(f"[GOOGLE CALENDAR] ❌ Suppression événement: {event_id}")
+            logger.debug("[GOOGLE CALENDAR] ❌ Suppression événement: %s", event_id)
             
             self.service.events().delete(
                 calendarId=CALENDAR_ID,
                 eventId=event_id
             ).execute()
             
-            print(f"[GOOGLE CALENDAR] ✅ Événement supprimé: {event_id}")
+            logger.debug("[GOOGLE CALENDAR] ✅ Événement supprimé: %s", event_id)
             return True
             
         except Exception as e:
             logger.error(f"Erreur suppression événement {event_id}: {e}")
-            print(f"[GOOGLE CALENDAR] ❌ Erreur suppression: {e}")
+            logger.error("[GOOGLE CALENDAR] ❌ Erreur suppression: %s", e)
             return False
 
 # Instance globale avec gestion d'erreur
 try:
     google_calendar = GoogleCalendarClient()
 except Exception as e:
-    print(f"[GOOGLE CALENDAR] ❌ Impossible de créer l'instance: {e}")
+    logger.error("[GOOGLE CALENDAR] ❌ Impossible de créer l'instance: %s", e)
     # Créer une instance vide avec les méthodes nécessaires
     class DummyCalendar:
         def __init__(self):
             self.connected = False
             
         def is_slot_available(self, date, time):
-            print(f"[GOOGLE CALENDAR DUMMY] ⚠️  Mode simulation: {date} {time} supposé disponible")
+            logger.warning("[GOOGLE CALENDAR DUMMY] ⚠️  Mode simulation: %s %s supposé disponible", date, time)
             return True
             
         def create_event(self, event_data):
-            print(f"[GOOGLE CALENDAR DUMMY] 🗓️  Simulation création: {event_data.get('summary', 'Sans titre')}")
+            logger.debug("[GOOGLE CALENDAR DUMMY] 🗓️  Simulation création: %s", event_data.get('summary', 'Sans titre'))
             return {'id': 'dummy_event_id', 'htmlLink': '#'}
             
         def update_event(self, event_id, event_data):
-            print(f"[GOOGLE CALENDAR DUMMY] 🔄 Simulation mise à jour: {event_id}")
+            logger.debug("[GOOGLE CALENDAR DUMMY] 🔄 Simulation mise à jour: %s", event_id)
             return {'id': event_id}
             
         def delete_event(self, event_id):
-            print(f"[GOOGLE CALENDAR DUMMY] ❌ Simulation suppression: {event_id}")
+            logger.debug("[GOOGLE CALENDAR DUMMY] ❌ Simulation suppression: %s", event_id)
             return True
     
     google_calendar = DummyCalendar()
\ No newline at end of file
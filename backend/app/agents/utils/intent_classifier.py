@@ -3,23 +3,29 @@ Intent Classification Module
 Classifies user intent using LLM
 """
 
+import logging
 from typing import Dict, Any, Optional, Tuple
 import json
 from language_detector import LanguageDetector  
+from app.core.classification_cache import get_classification_cache
+
+logger = logging.getLogger(__name__)
 
 class IntentClassifier:
     """
     Classifies user intent using LLM
     """
     
-    def __init__(self, llm):
+    def __init__(self, llm, cache=None):
         """
         Initialize intent classifier
         
         Args:
             llm: LangChain LLM instance
+            cache: Optional ClassificationCache (defaults to the shared one)
         """
         self.llm = llm
+        self.cache = cache or get_classification_cache()
         self.language_detector = LanguageDetector()
         
         # Intent categories with examples
@@ -59,6 +65,12 @@ class IntentClassifier:
             # Get appropriate system prompt
             system_prompt = get_system_prompt(language)
             
+            # Repeated messages ("bonjour", "rdv demain") skip the LLM call
+            scope = self.cache.scope_key("intent", system_prompt, language, self._model_name())
+            cached = self.cache.get(scope, message)
+            if cached is not None:
+                return cached
+            
             # Create messages for LLM
             messages = [
                 {"role": "system", "content": system_prompt},
@@ -75,16 +87,21 @@ class IntentClassifier:
             if agent_name in valid_agents:
                 # Calculate confidence based on response quality
                 confidence = self._calculate_confidence(message, agent_name, language)
+                self.cache.set(scope, message, (agent_name, confidence))
                 return agent_name, confidence
             else:
                 # Fallback to rule-based if LLM returns invalid response
                 return self.classify_with_rules(message), 0.6
         
         except Exception as e:
-            print(f"LLM classification error: {e}")
+            logger.error("LLM classification error: %s", e)
             # Fallback to rule-based classification
             return self.classify_with_rules(message), 0.5
     
+    def _model_name(self) -> str:
+        """Identifies the LLM so decisions of different models are cached apart."""
+        return str(getattr(self.llm, "model_name", None) or getattr(self.llm, "model", None) or type(self.llm).__name__)
+    
     def classify_with_rules(self, message: str) -> str:
         """
         Fallback rule-based intent classification
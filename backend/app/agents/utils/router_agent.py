@@ -1,8 +1,12 @@
+import logging
 from typing import Any, Dict, List, Optional
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from pydantic import BaseModel, Field
 from utils.base_agent import BaseAgent
+from app.core.classification_cache import get_classification_cache
+
+logger = logging.getLogger(__name__)
 
 class RouterDecision(BaseModel):
     """Schema for the router's decision."""
@@ -18,6 +22,7 @@ class RouterAgent(BaseAgent):
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(agent_name="Router Logic", config=config)
         self.routes = config.get("routes", []) if config else [] # List of {target_id: "description"}
+        self.cache = get_classification_cache()
 
     def set_routes(self, routes: List[Dict[str, str]]):
         """Called by the engine to inject the connected paths dynamically."""
@@ -41,6 +46,12 @@ class RouterAgent(BaseAgent):
             "If no condition matches well, pick the most generic one."
         )
         
+        # Routes are part of the prompt, so a changed route set gets a fresh scope
+        scope = self.cache.scope_key("router", system_prompt, self.settings.get("model_name"))
+        cached = self.cache.get(scope, user_input)
+        if cached is not None:
+            return f"__ROUTING_LEADER__{cached}"
+        
         try:
             parser = JsonOutputParser(pydantic_object=RouterDecision)
             chain = self.llm | parser
@@ -50,11 +61,15 @@ class RouterAgent(BaseAgent):
                 {"role": "user", "content": user_input}
             ])
             
+            next_node_id = response['next_node_id']
+            if any(r['target_id'] == next_node_id for r in self.routes):
+                self.cache.set(scope, user_input, next_node_id)
+            
             # We return a special signal that the Engine intercepts
-            return f"__ROUTING_LEADER__{response['next_node_id']}"
+            return f"__ROUTING_LEADER__{next_node_id}"
             
         except Exception as e:
-            print(f"Router Error: {e}")
+            logger.error("Router Error: %s", e)
             # Fallback to first route
             return f"__ROUTING_LEADER__{self.routes[0]['target_id']}"
 
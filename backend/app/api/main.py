@@ -1,14 +1,20 @@
 import os
 import sys
-import json
+import time
+import uuid
+import asyncio
+import logging
 from typing import Dict, List, Any, Optional
 
+logger = logging.getLogger(__name__)
+
 # Fix for Windows symlink permission error in HuggingFace Hub
 os.environ["HF_HUB_DISABLE_SYMLINKS"] = "1"
 os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "1"
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
@@ -32,15 +38,29 @@ if vendor_path not in sys.path:
 if project_root not in sys.path:
     sys.path.append(project_root)
 
+# Queued logging must be installed before the engine/nodes start logging
+from app.core.log import setup_logging
+setup_logging()
+
 # Correct module paths based on new structure
 try:
-    from ..models.schema import ExecutionRequest, WorkflowGraph
+    from ..models.schema import ExecutionRequest, WorkflowGraph, validate_graph
     from ..core.engine import engine
 except ImportError:
-    from backend.app.models.schema import ExecutionRequest, WorkflowGraph
+    from backend.app.models.schema import ExecutionRequest, WorkflowGraph, validate_graph
     from backend.app.core.engine import engine
 
-app = FastAPI(title="AI Agent Studio Engine")
+# Shared caches live under 'app.' (same module objects the nodes import)
+from app.core.agent_cache import get_agent_cache, graph_hash
+from app.core.run_queue import get_run_queue, QueueFullError, FINISHED
+from app.core.run_control import RunCancelled
+from app.core.shared_state import get_shared_state, worker_heartbeat, WORKER_ID
+from app.core.metrics import registry as metrics_registry, monitor_event_loop_lag
+from app.core.tracing import get_tracer
+from app.core.serialization import FastJSONResponse, dumps_str, loads
+from app.core.graph_compiler import get_plan_cache
+
+app = FastAPI(title="AI Agent Studio Engine", default_response_class=FastJSONResponse)
 
 # Mount static files for images/graphs
 app.mount("/outputs", StaticFiles(directory=outputs_dir), name="outputs")
@@ -57,6 +77,13 @@ app.add_middleware(
 # Force server reload: Supabase Tables fix
 
 class ConnectionManager:
+    """
+    Tracks this worker's WebSocket clients. Events are published through the
+    shared state and every worker relays them to its own clients, so progress
+    reaches editors connected to any worker.
+    """
+    EVENTS_CHANNEL = "run_events"
+
     def __init__(self):
         self.active_connections: List[WebSocket] = []
 
@@ -68,13 +95,64 @@ class ConnectionManager:
         self.active_connections.remove(websocket)
 
     async def broadcast(self, message: dict):
+        await get_shared_state().publish(self.EVENTS_CHANNEL, message)
+
+    async def send_local(self, message: dict):
+        # Encode once per event rather than once per connected client
+        text = dumps_str(message)
         for connection in self.active_connections:
             try:
-                await connection.send_json(message)
+                await connection.send_text(text)
             except Exception as e:
-                print(f"Error broadcasting to {connection}: {e}")
+                logger.error("Error broadcasting to %s: %s", connection, e)
+
+    async def relay(self):
+        """Forwards events published by any worker to the local clients."""
+        while True:
+            try:
+                async for message in get_shared_state().subscribe(self.EVENTS_CHANNEL):
+                    await self.send_local(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Event relay error, resubscribing: %s", e)
+                await asyncio.sleep(1)
                 
 manager = ConnectionManager()
+background_tasks: List[asyncio.Task] = []
+
+# Cancellation requests for runs that may be owned by another worker
+RUN_CONTROL_CHANNEL = "run_control"
+
+async def relay_run_control():
+    """Applies cancellations published by other workers to the runs owned here."""
+    while True:
+        try:
+            async for message in get_shared_state().subscribe(RUN_CONTROL_CHANNEL):
+                if message.get("action") != "cancel" or message.get("origin") == WORKER_ID:
+                    continue
+                run_id = message.get("run_id")
+                if not await run_queue.cancel(run_id):
+                    engine.cancel_run(run_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Run control relay error, resubscribing: %s", e)
+            await asyncio.sleep(1)
+
+@app.on_event("startup")
+async def start_shared_state():
+    background_tasks.append(asyncio.create_task(manager.relay()))
+    background_tasks.append(asyncio.create_task(relay_run_control()))
+    background_tasks.append(asyncio.create_task(worker_heartbeat({"pid": os.getpid(), "started_at": time.time()})))
+    background_tasks.append(asyncio.create_task(monitor_event_loop_lag()))
+
+@app.on_event("shutdown")
+async def stop_shared_state():
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await get_shared_state().close()
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
@@ -126,23 +204,28 @@ async def get_supabase_tables(supabase_url: str, supabase_key: str):
         tables = SupabaseStoreNode.fetch_tables(supabase_url, supabase_key)
         return {"tables": tables or []}
     except Exception as e:
-        print(f"Error fetching Supabase tables: {e}")
+        logger.error("Error fetching Supabase tables: %s", e)
         return {"tables": [], "error": str(e)}
 
+_library_cache: Dict[str, Any] = {"mtime": None, "body": b"{}"}
+
 @app.get("/nodes")
 def get_node_library():
     """Returns the JSON library for the sidebar. Optimized to ensure essential nodes exist."""
     try:
         lib_path = os.path.join(project_root, "backend", "data", "node_library.json")
         if os.path.exists(lib_path):
-            with open(lib_path, "r", encoding="utf-8") as f:
-                lib = json.load(f)
-                
-                # Check for critical missing categories if necessary
-                return lib
+            # The file already is the response: serve its bytes, re-reading only when it changes
+            mtime = os.path.getmtime(lib_path)
+            if _library_cache["mtime"] != mtime:
+                with open(lib_path, "rb") as f:
+                    body = f.read()
+                loads(body)
+                _library_cache.update(mtime=mtime, body=body)
+            return Response(content=_library_cache["body"], media_type="application/json")
         return {}
     except Exception as e:
-        print(f"Error loading nodes: {e}")
+        logger.error("Error loading nodes: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/library")
@@ -172,10 +255,37 @@ class SaveRequest(BaseModel):
     name: str
     graph: Dict[str, Any]
 
+class CompileRequest(BaseModel):
+    graph: Dict[str, Any]
+
+async def compile_workflow_graph(graph: Dict[str, Any]) -> Dict[str, Any]:
+    """Compiles (or reuses) the plan for `graph` and shares it with other workers."""
+    validate_graph(graph)
+    plan = get_plan_cache().compile(graph)
+    try:
+        await get_shared_state().set_plan(plan.plan_id, plan.graph_data)
+    except Exception as e:
+        logger.warning("Could not share plan %s: %s", plan.plan_id, e)
+    return plan.to_dict()
+
+@app.post("/workflows/compile")
+async def compile_workflow(request: CompileRequest):
+    try:
+        return await compile_workflow_graph(request.graph)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
 @app.post("/workflows/save")
 async def save_workflow(request: SaveRequest):
     if not workflow_store: return {"error": "Store not available"}
-    return workflow_store.save_workflow(request.name, request.graph)
+    # Agents assembled from the previous version of this graph must be rebuilt
+    get_agent_cache().invalidate_graph(request.graph)
+    result = workflow_store.save_workflow(request.name, request.graph)
+    try:
+        result["compile"] = await compile_workflow_graph(request.graph)
+    except ValueError as e:
+        result["compile"] = {"valid": False, "errors": [str(e)]}
+    return result
 
 @app.get("/workflows/list")
 async def list_workflows():
@@ -202,23 +312,124 @@ async def run_individual_node(request: Dict[str, Any]):
         result = await engine.execute_node(target_type, None, config=node_data, context={"graph_data": graph_data, "node_id": node_id, "engine": engine})
         return {"result": result, "status": "success"}
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Single node run failed")
         return {"error": str(e), "status": "failed"}
 
+def make_run_broadcaster(run_id: Optional[str] = None):
+    async def broadcast_event(event_type, node_id, data=None):
+        event = {"type": event_type, "nodeId": node_id, "data": data}
+        if run_id:
+            event["runId"] = run_id
+        await manager.broadcast(event)
+    return broadcast_event
+
+run_queue = get_run_queue()
+run_queue.configure(lambda graph_data, message, broadcaster, run_id, deadline, session_id: engine.process_workflow(
+    graph_data, message, broadcaster=broadcaster, run_id=run_id, deadline=deadline, session_id=session_id))
+metrics_registry.gauge("studio_run_queue_depth", "Job-mode runs waiting in the queue.", callback=lambda: run_queue.depth)
+metrics_registry.gauge("studio_run_queue_active", "Job-mode runs being executed by queue workers.", callback=lambda: run_queue.active)
+metrics_registry.gauge("studio_websocket_connections", "WebSocket clients connected to this worker.", callback=lambda: len(manager.active_connections))
+
 @app.post("/run")
 async def run_workflow(execution: ExecutionRequest):
     try:
-        graph_data = execution.graph.model_dump()
-        async def broadcast_event(event_type, node_id, data=None):
-            await manager.broadcast({"type": event_type, "nodeId": node_id, "data": data})
-        response_text = await engine.process_workflow(graph_data, execution.message, broadcaster=broadcast_event)
-        return {"response": response_text, "status": "success", "sender_name": "Studio Engine"}
+        plan = None
+        if execution.plan_id:
+            plan = get_plan_cache().get(execution.plan_id)
+            if plan is None:
+                # Compiled on another worker (or evicted here): rebuild from the shared copy
+                shared_graph = await get_shared_state().get_plan(execution.plan_id)
+                if shared_graph is None:
+                    raise HTTPException(status_code=404, detail=f"Unknown plan '{execution.plan_id}'. Compile the graph again.")
+                plan = get_plan_cache().compile(shared_graph, plan_id=execution.plan_id)
+            graph_data = plan.graph_data
+        elif execution.graph is not None:
+            graph_data = execution.graph
+        else:
+            raise HTTPException(status_code=422, detail="Either 'graph' or 'plan_id' is required.")
+
+        if execution.mode == "job":
+            flow_id = execution.flow_id or (plan.plan_id if plan else graph_hash(graph_data))
+            run_id = await run_queue.submit(
+                graph_data, execution.message, flow_id,
+                priority=execution.priority or 0, make_broadcaster=make_run_broadcaster,
+                deadline=execution.timeout, session_id=execution.session_id
+            )
+            return {"run_id": run_id, "status": "queued", "sender_name": "Studio Engine"}
+
+        run_id = uuid.uuid4().hex
+        try:
+            response_text = await engine.process_workflow(graph_data, execution.message, broadcaster=make_run_broadcaster(),
+                                                          run_id=run_id, plan=plan, deadline=execution.timeout,
+                                                          session_id=execution.session_id)
+        except RunCancelled as e:
+            if e.reason == "deadline":
+                raise HTTPException(status_code=504, detail=str(e))
+            return {"response": None, "status": "cancelled", "sender_name": "Studio Engine", "run_id": run_id}
+        return {"response": response_text, "status": "success", "sender_name": "Studio Engine", "run_id": run_id}
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Workflow run failed")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/runs/{run_id}")
+async def get_run(run_id: str):
+    record = await run_queue.get(run_id)
+    if not record: raise HTTPException(status_code=404)
+    return record
+
+@app.post("/runs/{run_id}/cancel")
+async def cancel_run(run_id: str):
+    """Cancels a queued or running run, whichever worker owns it."""
+    if await run_queue.cancel(run_id):
+        return {"run_id": run_id, "status": "cancelled"}
+    if engine.cancel_run(run_id):
+        return {"run_id": run_id, "status": "cancelling"}
+    record = await run_queue.get(run_id)
+    if record and record.get("status") in FINISHED:
+        raise HTTPException(status_code=409, detail=f"Run already {record['status']}.")
+    await get_shared_state().publish(RUN_CONTROL_CHANNEL, {"action": "cancel", "run_id": run_id, "origin": WORKER_ID})
+    return {"run_id": run_id, "status": "cancel_requested"}
+
+@app.get("/runs/{run_id}/trace")
+async def get_run_trace(run_id: str, format: str = "otlp"):
+    """Trace of a recent run: OTLP/JSON (default) or folded stacks (format=folded) for flame graphs."""
+    trace = get_tracer().get(run_id)
+    if not trace: raise HTTPException(status_code=404, detail="Trace not found (unknown run or evicted).")
+    if format == "folded":
+        return PlainTextResponse(get_tracer().to_folded(trace))
+    return get_tracer().to_otlp(trace)
+
+@app.get("/runs")
+async def get_run_queue_stats():
+    return {**run_queue.stats(), "worker_id": WORKER_ID}
+
+@app.get("/cache/stats")
+async def get_cache_stats():
+    """Hit/miss/eviction statistics of the in-process component caches."""
+    try:
+        from lfx.base.vectorstores.build_cache import built_stores
+        from lfx.services.deps import get_shared_component_cache_service
+    except ImportError as e:
+        raise HTTPException(status_code=503, detail=f"Component caches unavailable: {e}")
+    shared_cache = get_shared_component_cache_service()
+    return {
+        "shared_component_cache": shared_cache.stats() if hasattr(shared_cache, "stats") else None,
+        "vector_stores": built_stores.stats(),
+        "worker_id": WORKER_ID,
+    }
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def get_metrics():
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+@app.get("/workers")
+async def list_workers():
+    return {"workers": await get_shared_state().list_workers(), "current": WORKER_ID}
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8001)
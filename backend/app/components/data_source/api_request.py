@@ -1,4 +1,6 @@
+import asyncio
 import json
+import math
 import re
 import tempfile
 from datetime import datetime, timezone
@@ -18,6 +20,8 @@ from lfx.io import (
     BoolInput,
     DataInput,
     DropdownInput,
+    FloatInput,
+    HandleInput,
     IntInput,
     MessageTextInput,
     MultilineInput,
@@ -25,8 +29,10 @@ from lfx.io import (
     TableInput,
 )
 from lfx.schema.data import Data
+from lfx.schema.dataframe import DataFrame
 from lfx.schema.dotdict import dotdict
 from lfx.utils.component_utils import set_current_fields, set_field_advanced, set_field_display
+from lfx.utils.http_client import RateLimiter, get_http_client
 from lfx.utils.ssrf_protection import SSRFProtectionError, validate_url_for_ssrf
 
 # Define fields for each mode
@@ -41,6 +47,8 @@ MODE_FIELDS = {
 # Fields that should always be visible
 DEFAULT_FIELDS = ["mode"]
 
+SUPPORTED_METHODS = ("GET", "POST", "PATCH", "PUT", "DELETE")
+
 
 class APIRequestComponent(Component):
     display_name = "API Request"
@@ -72,7 +80,7 @@ class APIRequestComponent(Component):
         DropdownInput(
             name="method",
             display_name="Method",
-            options=["GET", "POST", "PATCH", "PUT", "DELETE"],
+            options=list(SUPPORTED_METHODS),
             value="GET",
             info="The HTTP method to use.",
             real_time_refresh=True,
@@ -172,10 +180,38 @@ class APIRequestComponent(Component):
             ),
             advanced=True,
         ),
+        HandleInput(
+            name="batch_params",
+            display_name="Batch Parameters",
+            info=(
+                "One request is made per row (DataFrame) or item (list of Data). Each parameter set may override "
+                "'url', 'method', 'headers', 'query_params' and 'body'; other keys become query parameters for "
+                "GET/DELETE and body fields otherwise. Used by the Batch Responses output."
+            ),
+            input_types=["DataFrame", "Data"],
+            is_list=True,
+            required=False,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrent Requests",
+            value=10,
+            info="Maximum number of batch requests in flight at once.",
+            advanced=True,
+        ),
+        FloatInput(
+            name="rate_limit",
+            display_name="Rate Limit",
+            value=0,
+            info="Maximum batch requests started per second (0 for no limit).",
+            advanced=True,
+        ),
     ]
 
     outputs = [
         Output(display_name="API Response", name="data", method="make_api_request"),
+        Output(display_name="Batch Responses", name="batch_results", method="make_batch_requests"),
     ]
 
     def _parse_json_value(self, value: Any) -> Any:
@@ -308,7 +344,7 @@ class APIRequestComponent(Component):
         include_httpx_metadata: bool = False,
     ) -> Data:
         method = method.upper()
-        if method not in {"GET", "POST", "PATCH", "PUT", "DELETE"}:
+        if method not in SUPPORTED_METHODS:
             msg = f"Unsupported method: {method}"
             raise ValueError(msg)
 
@@ -419,30 +455,8 @@ class APIRequestComponent(Component):
             return {item["key"]: item["value"] for item in headers if self._is_valid_key_value_item(item)}
         return {}
 
-    async def make_api_request(self) -> Data:
-        """Make HTTP request with optimized parameter handling."""
-        method = self.method
-        url = self.url_input.strip() if isinstance(self.url_input, str) else ""
-        headers = self.headers or {}
-        body = self.body or {}
-        timeout = self.timeout
-        follow_redirects = self.follow_redirects
-        save_to_file = self.save_to_file
-        include_httpx_metadata = self.include_httpx_metadata
-
-        # Security warning when redirects are enabled
-        if follow_redirects:
-            self.log(
-                "Security Warning: HTTP redirects are enabled. This may allow SSRF bypass attacks "
-                "where a public URL redirects to internal resources (e.g., cloud metadata endpoints). "
-                "Only enable this if you trust the target server."
-            )
-
-        # if self.mode == "cURL" and self.curl_input:
-        #     self._build_config = self.parse_curl(self.curl_input, dotdict())
-        #     # After parsing curl, get the normalized URL
-        #     url = self._build_config["url_input"]["value"]
-
+    def _prepare_url(self, url: str, query_params: dict) -> str:
+        """Normalize and validate `url`, then append `query_params`."""
         # Normalize URL before validation
         url = self._normalize_url(url)
 
@@ -460,32 +474,149 @@ class APIRequestComponent(Component):
             msg = f"SSRF Protection: {e}"
             raise ValueError(msg) from e
 
-        # Process query parameters
+        return self.add_query_params(url, query_params)
+
+    def _query_params(self) -> dict:
         if isinstance(self.query_params, str):
-            query_params = dict(parse_qsl(self.query_params))
-        else:
-            query_params = self.query_params.data if self.query_params else {}
+            return dict(parse_qsl(self.query_params))
+        return self.query_params.data if self.query_params else {}
+
+    def _warn_if_following_redirects(self) -> None:
+        # Security warning when redirects are enabled
+        if self.follow_redirects:
+            self.log(
+                "Security Warning: HTTP redirects are enabled. This may allow SSRF bypass attacks "
+                "where a public URL redirects to internal resources (e.g., cloud metadata endpoints). "
+                "Only enable this if you trust the target server."
+            )
+
+    async def make_api_request(self) -> Data:
+        """Make HTTP request with optimized parameter handling."""
+        method = self.method
+        url = self.url_input.strip() if isinstance(self.url_input, str) else ""
+        headers = self.headers or {}
+        body = self.body or {}
+        timeout = self.timeout
+        follow_redirects = self.follow_redirects
+        save_to_file = self.save_to_file
+        include_httpx_metadata = self.include_httpx_metadata
+
+        self._warn_if_following_redirects()
+
+        # if self.mode == "cURL" and self.curl_input:
+        #     self._build_config = self.parse_curl(self.curl_input, dotdict())
+        #     # After parsing curl, get the normalized URL
+        #     url = self._build_config["url_input"]["value"]
 
         # Process headers and body
         headers = self._process_headers(headers)
         body = self._process_body(body)
-        url = self.add_query_params(url, query_params)
-
-        async with httpx.AsyncClient() as client:
-            result = await self.make_request(
-                client,
-                method,
-                url,
-                headers,
-                body,
-                timeout,
-                follow_redirects=follow_redirects,
-                save_to_file=save_to_file,
-                include_httpx_metadata=include_httpx_metadata,
-            )
+        url = self._prepare_url(url, self._query_params())
+
+        # Requests share the pooled client of the running loop (keep-alive, HTTP/2 when available)
+        result = await self.make_request(
+            get_http_client(),
+            method,
+            url,
+            headers,
+            body,
+            timeout,
+            follow_redirects=follow_redirects,
+            save_to_file=save_to_file,
+            include_httpx_metadata=include_httpx_metadata,
+        )
         self.status = result
         return result
 
+    def _batch_param_sets(self) -> list[dict]:
+        """Flatten the batch input into one parameter dict per request, in input order."""
+        items = self.batch_params if isinstance(self.batch_params, list) else [self.batch_params]
+        param_sets: list[dict] = []
+        for item in items:
+            if item is None:
+                continue
+            if isinstance(item, DataFrame):
+                rows = item.to_dict(orient="records")
+            elif isinstance(item, str):
+                parsed = json.loads(item)
+                rows = parsed if isinstance(parsed, list) else [parsed]
+            else:
+                rows = [item]
+            for row in rows:
+                if hasattr(row, "data"):
+                    row = row.data
+                if not isinstance(row, dict):
+                    msg = f"Batch parameter sets must be dictionaries, got {type(row).__name__}"
+                    raise TypeError(msg)
+                # Missing cells of a DataFrame row come through as NaN
+                param_sets.append({k: v for k, v in row.items() if not (isinstance(v, float) and math.isnan(v))})
+        return param_sets
+
+    async def make_batch_requests(self) -> DataFrame:
+        """Make one request per batch parameter set, concurrently.
+
+        Requests share the pooled client, at most `max_concurrency` run at once
+        and at most `rate_limit` start per second. The returned DataFrame has
+        one row per parameter set, in input order (`index` is its position).
+        """
+        param_sets = self._batch_param_sets()
+        if not param_sets:
+            msg = "Batch mode needs at least one parameter set in 'Batch Parameters'."
+            raise ValueError(msg)
+
+        self._warn_if_following_redirects()
+        base_url = self.url_input.strip() if isinstance(self.url_input, str) else ""
+        base_headers = self._process_headers(self.headers or {})
+        base_body = self._process_body(self.body or {})
+        base_query = self._query_params()
+
+        client = get_http_client()
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency or 1))
+        limiter = RateLimiter(self.rate_limit) if self.rate_limit and self.rate_limit > 0 else None
+
+        async def send(params: dict) -> Data:
+            params = dict(params)
+            url = params.pop("url", None) or base_url
+            # A bad parameter set fails its own row, not the whole batch
+            try:
+                method = str(params.pop("method", None) or self.method).upper()
+                if method not in SUPPORTED_METHODS:
+                    msg = f"Unsupported method: {method}"
+                    raise ValueError(msg)
+                headers = {**base_headers, **self._process_headers(params.pop("headers", None))}
+                extra_query = params.pop("query_params", None)
+                if isinstance(extra_query, str):
+                    extra_query = dict(parse_qsl(extra_query))
+                query = {**base_query, **self._process_body(extra_query)}
+                body = {**base_body, **self._process_body(params.pop("body", None))}
+                if method in {"GET", "DELETE"}:
+                    query.update(params)
+                else:
+                    body.update(params)
+                url = self._prepare_url(str(url), query)
+            except (ValueError, TypeError, KeyError) as e:
+                return Data(data={"source": str(url), "status_code": 400, "error": str(e)})
+
+            async with semaphore:
+                if limiter is not None:
+                    await limiter.wait()
+                return await self.make_request(
+                    client,
+                    method,
+                    url,
+                    headers,
+                    body,
+                    self.timeout,
+                    follow_redirects=self.follow_redirects,
+                    include_httpx_metadata=self.include_httpx_metadata,
+                )
+
+        results = await asyncio.gather(*(send(params) for params in param_sets))
+        rows = [{"index": index, **result.data} for index, result in enumerate(results)]
+        failed = sum(1 for row in rows if row.get("error") or row.get("status_code", 0) >= 400)
+        self.status = f"{len(rows)} requests, {failed} failed"
+        return DataFrame(rows)
+
     def update_build_config(self, build_config: dotdict, field_value: Any, field_name: str | None = None) -> dotdict:
         """Update the build config based on the selected mode."""
         if field_name != "mode":
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import hashlib
 import json
 import re
 import uuid
@@ -17,6 +16,17 @@ from langchain_chroma import Chroma
 from langflow.services.auth.utils import decrypt_api_key, encrypt_api_key
 from langflow.services.database.models.user.crud import get_user_by_id
 
+from lfx.base.knowledge_bases.ingestion_manifest import (
+    content_hash,
+    embed_in_batches,
+    manifest_lock,
+    plan_ingestion,
+    read_manifest,
+    row_hash,
+    row_keys,
+    write_json_atomic,
+    write_manifest,
+)
 from lfx.base.knowledge_bases.knowledge_base_utils import get_knowledge_bases
 from lfx.base.models.openai_constants import OPENAI_EMBEDDING_MODEL_NAMES
 from lfx.components.processing.converter import convert_to_dataframe
@@ -200,10 +210,24 @@ class KnowledgeIngestionComponent(Component):
             advanced=True,
             required=False,
         ),
+        IntInput(
+            name="embedding_concurrency",
+            display_name="Embedding Concurrency",
+            info="Number of embedding batches requested at the same time.",
+            advanced=True,
+            value=4,
+        ),
         BoolInput(
             name="allow_duplicates",
             display_name="Allow Duplicates",
-            info="Allow duplicate rows in the knowledge base",
+            info="Keep every input row sharing an identifier instead of only the first one.",
+            advanced=True,
+            value=False,
+        ),
+        BoolInput(
+            name="remove_missing_rows",
+            display_name="Remove Missing Rows",
+            info="Delete rows ingested earlier that are not in this input, so the knowledge mirrors the latest export.",
             advanced=True,
             value=False,
         ),
@@ -317,8 +341,7 @@ class KnowledgeIngestionComponent(Component):
     def _save_embedding_metadata(self, kb_path: Path, embedding_model: str, api_key: str) -> None:
         """Save embedding model metadata."""
         embedding_metadata = self._build_embedding_metadata(embedding_model, api_key)
-        metadata_path = kb_path / "embedding_metadata.json"
-        metadata_path.write_text(json.dumps(embedding_metadata, indent=2))
+        write_json_atomic(kb_path / "embedding_metadata.json", embedding_metadata, indent=2)
 
     def _save_kb_files(
         self,
@@ -334,7 +357,7 @@ class KnowledgeIngestionComponent(Component):
             # Only do this if the file doesn't exist already
             cfg_path = kb_path / "schema.json"
             if not cfg_path.exists():
-                cfg_path.write_text(json.dumps(config_list, indent=2))
+                write_json_atomic(cfg_path, config_list, indent=2)
 
         except (OSError, TypeError, ValueError) as e:
             self.log(f"Error saving KB files: {e}")
@@ -378,7 +401,16 @@ class KnowledgeIngestionComponent(Component):
         embedding_model: str,
         api_key: str,
     ) -> None:
-        """Create vector store following Local DB component pattern."""
+        """Bring the knowledge base's Chroma collection up to date with the input rows.
+
+        Only rows that are new or changed since the last ingestion (per the
+        knowledge base manifest) are embedded, in concurrent batches, and
+        upserted under their row key. Rows missing from the input are deleted
+        when `remove_missing_rows` is set. Concurrent ingestions into the same
+        knowledge base run one at a time. The manifest is written after the
+        upserts, so an interrupted run re-embeds at most the rows it did not
+        record, and before the deletions, so it never lists a deleted row.
+        """
         try:
             # Set up vector store directory
             vector_store_dir = await self._kb_path()
@@ -399,41 +431,92 @@ class KnowledgeIngestionComponent(Component):
                 embedding_function=embedding_function,
                 collection_name=self.knowledge_base,
             )
+            collection = chroma._collection  # noqa: SLF001
+
+            async with manifest_lock(vector_store_dir):
+                manifest = read_manifest(vector_store_dir)
+                if manifest is None:
+                    manifest = self._rekey_unmanifested_collection(collection)
+
+                keys = row_keys(data_obj.data["_id"] for data_obj in data_objects)
+                plan = plan_ingestion(
+                    keys,
+                    [row_hash(data_obj.data) for data_obj in data_objects],
+                    manifest,
+                    remove_missing=self.remove_missing_rows,
+                )
 
-            # Convert Data objects to LangChain Documents
-            documents = []
-            for data_obj in data_objects:
-                doc = data_obj.to_lc_document()
-                documents.append(doc)
-
-            # Add documents to vector store
-            if documents:
-                chroma.add_documents(documents)
-                self.log(f"Added {len(documents)} documents to vector store '{self.knowledge_base}'")
+                # Embed and write only new or changed rows
+                if plan.upsert:
+                    documents = [data_objects[position].to_lc_document() for position in plan.upsert]
+                    embeddings = await embed_in_batches(
+                        embedding_function,
+                        [doc.page_content for doc in documents],
+                        batch_size=self.chunk_size,
+                        max_concurrency=self.embedding_concurrency,
+                    )
+                    batch_size = max(1, self.chunk_size)
+                    for start in range(0, len(documents), batch_size):
+                        end = start + batch_size
+                        collection.upsert(
+                            ids=[keys[position] for position in plan.upsert[start:end]],
+                            embeddings=embeddings[start:end],
+                            metadatas=[doc.metadata for doc in documents[start:end]],
+                            documents=[doc.page_content for doc in documents[start:end]],
+                        )
+
+                # The manifest stops listing removed rows before they are deleted
+                write_manifest(vector_store_dir, plan.rows)
+                if plan.delete:
+                    collection.delete(ids=plan.delete)
+
+            self.log(
+                f"Knowledge base '{self.knowledge_base}': {len(plan.upsert)} rows embedded, "
+                f"{plan.unchanged} unchanged, {len(plan.delete)} removed"
+            )
 
         except (OSError, ValueError, RuntimeError) as e:
             self.log(f"Error creating vector store: {e}")
 
+    def _rekey_unmanifested_collection(self, collection) -> dict[str, str]:
+        """Build the manifest of a collection ingested before manifests existed.
+
+        Its documents are moved, with their stored embeddings, under their row
+        keys, so they are recognized as already ingested without re-embedding.
+        """
+        stored = collection.get(include=["embeddings", "metadatas", "documents"])
+        if not stored["ids"]:
+            return {}
+        metadatas = [metadata or {} for metadata in stored["metadatas"]]
+        keys = row_keys(
+            metadata.get("_id") or content_hash(document)
+            for metadata, document in zip(metadatas, stored["documents"], strict=True)
+        )
+        batch_size = max(1, self.chunk_size)
+        for start in range(0, len(keys), batch_size):
+            end = start + batch_size
+            collection.upsert(
+                ids=keys[start:end],
+                embeddings=stored["embeddings"][start:end],
+                metadatas=metadatas[start:end],
+                documents=stored["documents"][start:end],
+            )
+        rekeyed = set(keys)
+        stale_ids = [doc_id for doc_id in stored["ids"] if doc_id not in rekeyed]
+        if stale_ids:
+            collection.delete(ids=stale_ids)
+        self.log(f"Recorded {len(keys)} existing documents in the manifest of '{self.knowledge_base}'")
+        return {
+            key: row_hash({"text": document, **metadata})
+            for key, document, metadata in zip(keys, stored["documents"], metadatas, strict=True)
+        }
+
     async def _convert_df_to_data_objects(
         self, df_source: pd.DataFrame, config_list: list[dict[str, Any]]
     ) -> list[Data]:
         """Convert DataFrame to Data objects for vector store."""
         data_objects: list[Data] = []
-
-        # Set up vector store directory
-        kb_path = await self._kb_path()
-
-        # If we don't allow duplicates, we need to get the existing hashes
-        chroma = Chroma(
-            persist_directory=str(kb_path),
-            collection_name=self.knowledge_base,
-        )
-
-        # Get all documents and their metadata
-        all_docs = chroma.get()
-
-        # Extract all _id values from metadata
-        id_list = [metadata.get("_id") for metadata in all_docs["metadatas"] if metadata.get("_id")]
+        seen_hashes: set[str] = set()
 
         # Get column roles
         content_cols = []
@@ -475,13 +558,14 @@ class KnowledgeIngestionComponent(Component):
                     data_dict[col] = str(value)  # Convert complex types to string
 
             # Hash the page_content for unique ID
-            page_content_hash = hashlib.sha256(page_content.encode()).hexdigest()
+            page_content_hash = content_hash(page_content)
             data_dict["_id"] = page_content_hash
 
-            # If duplicates are disallowed, and hash exists, prevent adding this row
-            if not self.allow_duplicates and page_content_hash in id_list:
+            # If duplicates are disallowed, only the first row with this hash is ingested
+            if not self.allow_duplicates and page_content_hash in seen_hashes:
                 self.log(f"Skipping duplicate row with hash {page_content_hash}")
                 continue
+            seen_hashes.add(page_content_hash)
 
             # Create Data object - everything except "text" becomes metadata
             data_obj = Data(data=data_dict)
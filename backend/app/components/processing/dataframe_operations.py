@@ -1,5 +1,4 @@
-import pandas as pd
-
+from lfx.base.processing.dataframe_plan import DataFramePlan, DeferredDataFrame, filter_mask
 from lfx.custom.custom_component.component import Component
 from lfx.inputs import SortableListInput
 from lfx.io import BoolInput, DataFrameInput, DropdownInput, IntInput, MessageTextInput, Output, StrInput
@@ -138,6 +137,27 @@ class DataFrameOperationsComponent(Component):
             dynamic=True,
             show=False,
         ),
+        BoolInput(
+            name="lazy",
+            display_name="Lazy Execution",
+            info=(
+                "Defer the operation when this node only feeds other DataFrame Operations nodes: the chain is "
+                "optimized and run once by its last node instead of copying the table at every node."
+            ),
+            value=False,
+            advanced=True,
+        ),
+        DropdownInput(
+            name="engine",
+            display_name="Execution Engine",
+            options=["pandas", "Auto", "Polars"],
+            value="pandas",
+            info=(
+                "Engine that runs a lazy chain. Polars (when installed) is multi-threaded and Arrow-backed; "
+                "Auto uses it for large tables. Steps Polars cannot run with pandas semantics fall back to pandas."
+            ),
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -205,8 +225,6 @@ class DataFrameOperationsComponent(Component):
         return build_config
 
     def perform_operation(self) -> DataFrame:
-        df_copy = self.df.copy()
-
         # Handle SortableListInput format for operation
         operation_input = getattr(self, "operation", [])
         if isinstance(operation_input, list) and len(operation_input) > 0:
@@ -214,6 +232,11 @@ class DataFrameOperationsComponent(Component):
         else:
             op = ""
 
+        if getattr(self, "lazy", False) or isinstance(self.df, DeferredDataFrame):
+            return self.perform_lazily(op)
+
+        df_copy = self.df.copy()
+
         # If no operation selected, return original DataFrame
         if not op:
             return df_copy
@@ -242,44 +265,59 @@ class DataFrameOperationsComponent(Component):
         logger.error(msg)
         raise ValueError(msg)
 
-    def filter_rows_by_value(self, df: DataFrame) -> DataFrame:
-        column = df[self.column_name]
-        filter_value = self.filter_value
+    def perform_lazily(self, op: str) -> DataFrame:
+        """Append the operation to the incoming plan; run it unless a DataFrame Operations node continues it."""
+        plan = self.df.plan if isinstance(self.df, DeferredDataFrame) else DataFramePlan(self.df)
+        if op:
+            plan = plan.then(op, **self._plan_params(op))
 
-        # Handle regular DropdownInput format (just a string value)
-        operator = getattr(self, "filter_operator", "equals")  # Default to equals for backward compatibility
+        if getattr(self, "lazy", False) and self._feeds_only_dataframe_operations():
+            self.status = f"Deferred: {plan.explain()}"
+            return DeferredDataFrame(plan)
+        return plan.collect(getattr(self, "engine", "pandas"))
 
-        if operator == "equals":
-            mask = column == filter_value
-        elif operator == "not equals":
-            mask = column != filter_value
-        elif operator == "contains":
-            mask = column.astype(str).str.contains(str(filter_value), na=False)
-        elif operator == "not contains":
-            mask = ~column.astype(str).str.contains(str(filter_value), na=False)
-        elif operator == "starts with":
-            mask = column.astype(str).str.startswith(str(filter_value), na=False)
-        elif operator == "ends with":
-            mask = column.astype(str).str.endswith(str(filter_value), na=False)
-        elif operator == "greater than":
-            try:
-                # Try to convert filter_value to numeric for comparison
-                numeric_value = pd.to_numeric(filter_value)
-                mask = column > numeric_value
-            except (ValueError, TypeError):
-                # If conversion fails, compare as strings
-                mask = column.astype(str) > str(filter_value)
-        elif operator == "less than":
-            try:
-                # Try to convert filter_value to numeric for comparison
-                numeric_value = pd.to_numeric(filter_value)
-                mask = column < numeric_value
-            except (ValueError, TypeError):
-                # If conversion fails, compare as strings
-                mask = column.astype(str) < str(filter_value)
-        else:
-            mask = column == filter_value  # Fallback to equals
+    def _plan_params(self, op: str) -> dict:
+        if op == "Filter":
+            return {
+                "column": self.column_name,
+                "operator": getattr(self, "filter_operator", "equals"),
+                "value": self.filter_value,
+            }
+        if op == "Sort":
+            return {"column": self.column_name, "ascending": self.ascending}
+        if op in {"Drop Column", "Drop Duplicates"}:
+            return {"column": self.column_name}
+        if op == "Rename Column":
+            return {"column": self.column_name, "new": self.new_column_name}
+        if op == "Add Column":
+            return {"column": self.new_column_name, "value": self.new_column_value}
+        if op == "Select Columns":
+            return {"columns": [col.strip() for col in self.columns_to_select]}
+        if op in {"Head", "Tail"}:
+            return {"n": self.num_rows}
+        if op == "Replace Value":
+            return {"column": self.column_name, "old": self.replace_value, "new": self.replacement_value}
+        msg = f"Unsupported operation: {op}"
+        logger.error(msg)
+        raise ValueError(msg)
+
+    def _feeds_only_dataframe_operations(self) -> bool:
+        vertex = self.get_vertex()
+        if vertex is None:
+            return False
+        targets = [vertex.graph.get_vertex(edge.target_id) for edge in vertex.outgoing_edges]
+        return bool(targets) and all(self._is_dataframe_operations(target) for target in targets)
+
+    def _is_dataframe_operations(self, vertex) -> bool:
+        # The component of a vertex that has not been built yet is not instantiated
+        if vertex.custom_component is not None:
+            return isinstance(vertex.custom_component, DataFrameOperationsComponent)
+        return vertex.vertex_type == self.name
 
+    def filter_rows_by_value(self, df: DataFrame) -> DataFrame:
+        # Handle regular DropdownInput format (just a string value)
+        operator = getattr(self, "filter_operator", "equals")  # Default to equals for backward compatibility
+        mask = filter_mask(df[self.column_name], operator, self.filter_value)
         return DataFrame(df[mask])
 
     def sort_by_column(self, df: DataFrame) -> DataFrame:
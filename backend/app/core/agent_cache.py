@@ -0,0 +1,78 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .serialization import dumps
+
+
+def graph_hash(graph_data: Dict[str, Any]) -> str:
+    """Stable content hash of a workflow graph (nodes + edges, UI positions ignored)."""
+    nodes = [{k: v for k, v in n.items() if k not in ("position", "positionAbsolute", "selected", "dragging")}
+             for n in graph_data.get("nodes", [])]
+    raw = dumps({"nodes": nodes, "edges": graph_data.get("edges", [])}, sort_keys=True)
+    return hashlib.sha256(raw).hexdigest()[:32]
+
+
+def config_hash(config: Dict[str, Any]) -> str:
+    raw = dumps(config, sort_keys=True)
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+class AgentCache:
+    """
+    LRU cache of assembled agents (resolved LLM/tools/memory plus the built
+    chain or AgentExecutor), keyed by (graph hash, agent node id, config hash).
+
+    A graph edit changes the graph hash, so stale agents are never reused;
+    `invalidate_nodes` drops them eagerly when a workflow is saved.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str, str], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(graph_data_hash: str, node_id: str, config: Dict[str, Any]) -> Tuple[str, str, str]:
+        return (graph_data_hash, str(node_id), config_hash(config))
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: Tuple[str, str, str], entry: Dict[str, Any]):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_nodes(self, node_ids: Iterable[str]):
+        """Drops every cached agent whose node id is in `node_ids`."""
+        ids = {str(n) for n in node_ids}
+        with self._lock:
+            for key in [k for k in self._entries if k[1] in ids]:
+                del self._entries[key]
+
+    def invalidate_graph(self, graph_data: Dict[str, Any]):
+        self.invalidate_nodes(n.get("id") for n in graph_data.get("nodes", []))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared process-wide instance used by agent nodes
+agent_cache = AgentCache(max_entries=int(os.getenv("AGENT_CACHE_MAX_ENTRIES", "256")))
+
+
+def get_agent_cache() -> AgentCache:
+    return agent_cache
@@ -0,0 +1,297 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_PUNCT_RE = re.compile(r"[^\w\s]", re.UNICODE)
+_SPACE_RE = re.compile(r"\s+")
+
+_MISS = object()
+
+# Query vectors of recent misses, awaiting the `set` of their decision
+_MAX_PENDING_VECTORS = 256
+
+
+class ClassificationCache:
+    """
+    Cache for LLM classification and routing decisions.
+
+    Exact tier: messages are normalized (casefold, punctuation and extra
+    whitespace stripped) and looked up per scope, where the scope is a hash
+    of the prompt/config that produced the decision. Entries expire after
+    `ttl` seconds and the least recently used ones are evicted past
+    `max_entries`.
+
+    Semantic tier (optional): when an `embedder` is set, a miss on the exact
+    tier falls back to the closest previously seen message of the same scope
+    whose cosine similarity is above `similarity_threshold`. Vectors are
+    kept unit-length and stacked per scope, so a lookup is one matrix-vector
+    product. The query vector of a miss is reused by the `set` that follows.
+    Code running on the event loop uses `aget`/`aset`, which embed in a
+    worker thread.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl: float = 3600,
+        embedder: Optional[Callable[[str], Sequence[float]]] = None,
+        similarity_threshold: float = 0.92,
+        max_semantic_entries: int = 2000,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self.max_semantic_entries = max_semantic_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._vectors: "OrderedDict[Tuple[str, str], Tuple[float, np.ndarray]]" = OrderedDict()
+        self._pending: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+        self._matrices: Dict[str, Tuple[List[Tuple[str, str]], np.ndarray, np.ndarray]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize(text: Any) -> str:
+        """Casefolds and strips punctuation/whitespace so trivial variants share a key."""
+        text = unicodedata.normalize("NFKC", str(text)).casefold()
+        text = _PUNCT_RE.sub(" ", text)
+        return _SPACE_RE.sub(" ", text).strip()
+
+    @staticmethod
+    def scope_key(*parts: Any) -> str:
+        """Stable hash of the prompt/config that a decision depends on."""
+        raw = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+    def set_embedder(self, embedder: Optional[Callable[[str], Sequence[float]]], similarity_threshold: Optional[float] = None):
+        """Enables (or disables with None) the semantic tier."""
+        self.embedder = embedder
+        if similarity_threshold is not None:
+            self.similarity_threshold = similarity_threshold
+        with self._lock:
+            self._vectors.clear()
+            self._pending.clear()
+            self._matrices.clear()
+
+    def get(self, scope: str, text: Any, default: Any = None) -> Any:
+        norm = self.normalize(text)
+        if not norm:
+            return default
+        key = (scope, norm)
+        now = time.monotonic()
+        decision = self._exact_lookup(key, now)
+        if decision is _MISS and self._has_candidates(scope):
+            decision = self._semantic_lookup(key, self._embed(norm), now)
+        return self._count(decision, default)
+
+    async def aget(self, scope: str, text: Any, default: Any = None) -> Any:
+        """`get` for the event loop: the embedding call runs in a worker thread."""
+        norm = self.normalize(text)
+        if not norm:
+            return default
+        key = (scope, norm)
+        now = time.monotonic()
+        decision = self._exact_lookup(key, now)
+        if decision is _MISS and self._has_candidates(scope):
+            decision = self._semantic_lookup(key, await asyncio.to_thread(self._embed, norm), now)
+        return self._count(decision, default)
+
+    def set(self, scope: str, text: Any, decision: Any):
+        norm = self.normalize(text)
+        if not norm:
+            return
+        key = (scope, norm)
+        expires_at = self._store(key, decision)
+        if self.embedder is not None:
+            vector = self._take_pending(key)
+            self._store_vector(key, expires_at, vector if vector is not None else self._embed(norm))
+
+    async def aset(self, scope: str, text: Any, decision: Any):
+        """`set` for the event loop: the embedding call runs in a worker thread."""
+        norm = self.normalize(text)
+        if not norm:
+            return
+        key = (scope, norm)
+        expires_at = self._store(key, decision)
+        if self.embedder is not None:
+            vector = self._take_pending(key)
+            if vector is None:
+                vector = await asyncio.to_thread(self._embed, norm)
+            self._store_vector(key, expires_at, vector)
+
+    def invalidate(self, scope: Optional[str] = None):
+        """Drops every entry, or only those of one scope."""
+        with self._lock:
+            if scope is None:
+                self._entries.clear()
+                self._vectors.clear()
+                self._pending.clear()
+                self._matrices.clear()
+                return
+            for store in (self._entries, self._vectors, self._pending):
+                for key in [k for k in store if k[0] == scope]:
+                    del store[key]
+            self._matrices.pop(scope, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "semantic_entries": len(self._vectors),
+                "hits": self.hits,
+                "semantic_hits": self.semantic_hits,
+                "misses": self.misses,
+            }
+
+    def _exact_lookup(self, key: Tuple[str, str], now: float) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, decision = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return decision
+                del self._entries[key]
+        return _MISS
+
+    def _count(self, decision: Any, default: Any) -> Any:
+        if decision is not _MISS:
+            return decision
+        with self._lock:
+            self.misses += 1
+        return default
+
+    def _store(self, key: Tuple[str, str], decision: Any) -> float:
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires_at, decision)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return expires_at
+
+    def _store_vector(self, key: Tuple[str, str], expires_at: float, vector: Optional[np.ndarray]):
+        if vector is None:
+            return
+        with self._lock:
+            self._vectors[key] = (expires_at, vector)
+            self._vectors.move_to_end(key)
+            self._matrices.pop(key[0], None)
+            while len(self._vectors) > self.max_semantic_entries:
+                evicted, _ = self._vectors.popitem(last=False)
+                self._matrices.pop(evicted[0], None)
+
+    def _take_pending(self, key: Tuple[str, str]) -> Optional[np.ndarray]:
+        with self._lock:
+            return self._pending.pop(key, None)
+
+    def _has_candidates(self, scope: str) -> bool:
+        if self.embedder is None:
+            return False
+        with self._lock:
+            return scope in self._matrices or any(k[0] == scope for k in self._vectors)
+
+    def _embed(self, norm: str) -> Optional[np.ndarray]:
+        """Unit-length embedding of a normalized message, None on failure."""
+        try:
+            vector = np.asarray(self.embedder(norm), dtype=np.float32)
+        except Exception as e:
+            logger.error("ClassificationCache: embedding failed, semantic tier skipped: %s", e)
+            return None
+        length = float(np.linalg.norm(vector))
+        return vector / length if length else None
+
+    def _scope_matrix(self, scope: str) -> Optional[Tuple[List[Tuple[str, str]], np.ndarray, np.ndarray]]:
+        """Keys, expiry times and stacked unit vectors of a scope, rebuilt after it changes. Call with the lock held."""
+        matrix = self._matrices.get(scope)
+        if matrix is None:
+            items = [(k, v) for k, v in self._vectors.items() if k[0] == scope]
+            if not items:
+                return None
+            dims = len(items[-1][1][1])
+            items = [(k, v) for k, v in items if len(v[1]) == dims]
+            matrix = (
+                [k for k, _ in items],
+                np.array([v[0] for _, v in items]),
+                np.stack([v[1] for _, v in items]),
+            )
+            self._matrices[scope] = matrix
+        return matrix
+
+    def _semantic_lookup(self, key: Tuple[str, str], query: Optional[np.ndarray], now: float) -> Any:
+        if query is None:
+            return _MISS
+        with self._lock:
+            matrix = self._scope_matrix(key[0])
+        if matrix is not None and matrix[2].shape[1] == len(query):
+            keys, expires, vectors = matrix
+            scores = vectors @ query
+            scores[expires <= now] = -1.0
+            best = int(np.argmax(scores))
+            if scores[best] >= self.similarity_threshold:
+                with self._lock:
+                    entry = self._entries.get(keys[best])
+                    if entry is not None and entry[0] > now:
+                        self._entries.move_to_end(keys[best])
+                        self.semantic_hits += 1
+                        return entry[1]
+
+        # Kept for the `set` that usually follows a miss, so the message is embedded once
+        with self._lock:
+            self._pending[key] = query
+            while len(self._pending) > _MAX_PENDING_VECTORS:
+                self._pending.popitem(last=False)
+        return _MISS
+
+
+def embedder_from_env() -> Optional[Callable[[str], Sequence[float]]]:
+    """
+    Embedder for the semantic tier, from CLASSIFICATION_CACHE_EMBEDDING_MODEL
+    (an OpenAI-compatible embeddings model; the tier stays off when unset).
+    The key and endpoint come from CLASSIFICATION_CACHE_EMBEDDING_API_KEY /
+    CLASSIFICATION_CACHE_EMBEDDING_BASE_URL, falling back to OPENAI_API_KEY /
+    OPENAI_BASE_URL.
+    """
+    model = os.getenv("CLASSIFICATION_CACHE_EMBEDDING_MODEL", "").strip()
+    if not model:
+        return None
+    try:
+        from langchain_openai import OpenAIEmbeddings
+
+        embeddings = OpenAIEmbeddings(
+            model=model,
+            api_key=os.getenv("CLASSIFICATION_CACHE_EMBEDDING_API_KEY") or os.getenv("OPENAI_API_KEY"),
+            base_url=os.getenv("CLASSIFICATION_CACHE_EMBEDDING_BASE_URL") or os.getenv("OPENAI_BASE_URL") or None,
+        )
+    except Exception as e:
+        logger.error("ClassificationCache: could not build embedder %s, semantic tier disabled: %s", model, e)
+        return None
+    return embeddings.embed_query
+
+
+# Shared process-wide instance used by classifiers and routers
+classification_cache = ClassificationCache(
+    max_entries=int(os.getenv("CLASSIFICATION_CACHE_MAX_ENTRIES", "10000")),
+    ttl=float(os.getenv("CLASSIFICATION_CACHE_TTL", "3600")),
+    embedder=embedder_from_env(),
+    similarity_threshold=float(os.getenv("CLASSIFICATION_CACHE_SIMILARITY", "0.92")),
+)
+
+
+def get_classification_cache() -> ClassificationCache:
+    return classification_cache
@@ -1,8 +1,21 @@
 import sys
 import os
 from typing import Dict, Any, List, Optional
-import traceback
+import time
+import uuid
+import asyncio
+import logging
 from app.nodes.factory import NodeFactory
+from app.core.graph_compiler import ExecutionPlan, get_plan_cache
+from app.core.log import HOT_PATH
+from app.core.metrics import NODE_LATENCY, NODE_ERRORS, RUNS_ACTIVE, RUNS_TOTAL
+from app.core.tracing import get_tracer
+from app.core.run_control import DEFAULT_RUN_DEADLINE, RunCancelled, current_run, get_run_registry, node_timeout, with_timeout
+
+logger = logging.getLogger(__name__)
+
+# Nodes report most failures as returned strings rather than exceptions
+ERROR_PREFIXES = ("Error:", "Execution Error:", "Agent Error:")
 
 # Root path setup
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -32,49 +45,136 @@ class AgentEngine:
     async def execute_node(self, node_type: str, input_text: Any, config: Dict[str, Any] = None, context: Dict[str, Any] = None) -> Any:
         """
         Loads and executes a node based on its type.
+        Every node execution (including nested pulls) is timed here and bounded
+        by the node's timeout (see `run_control.node_timeout`).
+        `config` is copied: cached plans share each node's data across runs,
+        and nodes may write to their config.
         """
-        node = self.node_factory.get_node(node_type, config)
-        if not node:
-             return f"Error: Node type '{node_type}' not found in registry."
-        
-        try:
-            return await node.execute(input_text, context)
-        except Exception as e:
-            print(f"Node Execution Error ({node_type}): {e}")
-            traceback.print_exc()
-            return f"Execution Error: {str(e)}"
+        config = dict(config) if config is not None else None
+        handle = current_run.get()
+        if handle is not None:
+            handle.check()
+        node_id = (context or {}).get("node_id")
+        with get_tracer().span(f"node:{node_type}", kind="node", node_type=node_type, node_id=node_id or "") as span:
+            started = time.perf_counter()
+            node = self.node_factory.get_node(node_type, config)
+            if not node:
+                 NODE_ERRORS.inc(node_type=node_type)
+                 return f"Error: Node type '{node_type}' not found in registry."
+            
+            timeout = node_timeout(node, config)
+            try:
+                if timeout:
+                    result = await with_timeout(node.execute(input_text, context), timeout)
+                else:
+                    result = await node.execute(input_text, context)
+                if isinstance(result, str) and result.startswith(ERROR_PREFIXES):
+                    NODE_ERRORS.inc(node_type=node_type)
+                    if span: span.status, span.error = "error", result[:200]
+                return result
+            except asyncio.TimeoutError:
+                NODE_ERRORS.inc(node_type=node_type)
+                if span: span.status, span.error = "error", f"timed out after {timeout:g}s"
+                logger.warning("Node '%s' timed out after %gs", node_type, timeout)
+                return f"Execution Error: Node '{node_type}' timed out after {timeout:g}s"
+            except Exception as e:
+                NODE_ERRORS.inc(node_type=node_type)
+                if span: span.status, span.error = "error", f"{type(e).__name__}: {e}"
+                logger.exception("Node Execution Error (%s): %s", node_type, e)
+                return f"Execution Error: {str(e)}"
+            finally:
+                NODE_LATENCY.observe(time.perf_counter() - started, node_type=node_type)
 
-    async def process_workflow(self, graph_data: Dict[str, Any], message: str, broadcaster=None) -> str:
+    async def process_workflow(self, graph_data: Dict[str, Any], message: str, broadcaster=None, run_id: Optional[str] = None,
+                               plan: Optional[ExecutionPlan] = None, deadline: Optional[float] = None,
+                               session_id: Optional[str] = None) -> str:
         """
         Core workflow execution engine.
         Traverses the graph and invokes nodes.
+        The run is traced under `run_id` (generated when not given).
+        `plan` is a compiled ExecutionPlan; without one the graph is compiled
+        (or its cached plan reused).
+        `deadline` bounds the whole run in seconds (RUN_DEADLINE_SECONDS by
+        default, 0 disables). Raises RunCancelled when the run is cancelled
+        through `cancel_run` or its deadline passes.
+        `session_id` identifies the conversation the run belongs to; nodes
+        see it (and `run_id`) in their context.
         """
-        nodes = graph_data.get("nodes", [])
-        edges = graph_data.get("edges", [])
-        
-        if not nodes: return "Graph is empty."
+        run_id = run_id or uuid.uuid4().hex
+        deadline = DEFAULT_RUN_DEADLINE if deadline is None else deadline
+        registry = get_run_registry()
+        RUNS_ACTIVE.inc()
+        status = "failed"
+        try:
+            with get_tracer().trace_run(run_id, nodes=len(graph_data.get("nodes", []))):
+                plan = plan or get_plan_cache().compile(graph_data)
+                handle = registry.start(run_id, deadline)
+                # The walk runs as its own task so cancel_run can interrupt the
+                # node call in flight (including upstream pulls it awaits)
+                token = current_run.set(handle)
+                try:
+                    handle.task = asyncio.ensure_future(self._process_workflow(plan, message, broadcaster, run_id, session_id))
+                finally:
+                    current_run.reset(token)
+                deadline_timer = asyncio.get_running_loop().call_later(deadline, handle.cancel, "deadline") if deadline else None
+                try:
+                    # Cancelling this coroutine cancels the awaited run task too
+                    result = await handle.task
+                except asyncio.CancelledError:
+                    # Our own caller being cancelled wins over a run cancellation
+                    current = asyncio.current_task()
+                    caller_cancelled = hasattr(current, "cancelling") and current.cancelling()
+                    if handle.cancel_reason is None or caller_cancelled:
+                        raise
+                    raise RunCancelled(run_id, handle.cancel_reason)
+                finally:
+                    if deadline_timer is not None:
+                        deadline_timer.cancel()
+                    registry.finish(run_id)
+            status = "completed"
+            return result
+        except RunCancelled as e:
+            status = e.status
+            raise
+        finally:
+            RUNS_ACTIVE.dec()
+            RUNS_TOTAL.inc(status=status)
+
+    def cancel_run(self, run_id: str, reason: str = "cancelled") -> bool:
+        """Cancels a run executing in this process; False when it is not here."""
+        return get_run_registry().cancel(run_id, reason)
+
+    async def _process_workflow(self, plan: ExecutionPlan, message: str, broadcaster=None,
+                                run_id: Optional[str] = None, session_id: Optional[str] = None) -> str:
+        graph_data = plan.graph_data
+        if not plan.nodes_by_id: return "Graph is empty."
 
         # 1. Identify Entry Point (Chat Input)
-        current_node = next((n for n in nodes if n.get('data', {}).get('id') == 'chatInput'), nodes[0] if nodes else None)
+        current_node = plan.entry
         if not current_node: return "No valid entry point found."
         
         current_input = message
         visited = set()
         
         # Max hops to prevent infinite loops
+        handle = current_run.get()
         for _ in range(20):
+            if handle is not None:
+                handle.check()
             node_id = current_node['id']
             if node_id in visited: break
             visited.add(node_id)
             
-            node_type = current_node.get('type')
             node_data = current_node.get('data', {})
             reg_id = node_data.get('id')
             
             # Prepare execution context
             context = {
                 "graph_data": graph_data,
+                "graph_hash": plan.plan_id,
                 "node_id": node_id,
+                "run_id": run_id,
+                "session_id": session_id,
                 "visited": list(visited),
                 "engine": self
             }
@@ -83,14 +183,13 @@ class AgentEngine:
             if broadcaster: await broadcaster("node_start", node_id)
             
             # Execute Node Logic
-            target_type = reg_id if reg_id and reg_id != 'chatInput' else node_type
+            target_type = plan.target_type(current_node)
             
             if reg_id == 'chatInput':
                 result = current_input
             else:
                 # Add routes for branching nodes (like Router)
-                outgoing = [e for e in edges if e['source'] == node_id]
-                context["routes"] = [{"target_id": e['target'], "condition": e.get('label', 'Default')} for e in outgoing]
+                context["routes"] = list(plan.routes.get(node_id, []))
                 
                 # Dynamic Execution via Factory
                 result = await self.execute_node(target_type, current_input, config=node_data, context=context)
@@ -99,24 +198,23 @@ class AgentEngine:
             if broadcaster: await broadcaster("node_end", node_id, {"output": str(result)[:200]})
             
             # 2. Determine Next Node (Traversal)
-            all_node_ids = [n.get('id') for n in nodes]
             next_node_id = None
+            routed = isinstance(result, str) and result in plan.node_ids
             
             # Use result if it's a specific node ID (Explicit Routing)
-            if result in all_node_ids:
-                print(f"🔀 Engine: Branching to node {result}")
+            if routed:
+                logger.debug("🔀 Engine: Branching to node %s", result, extra=HOT_PATH)
                 next_node_id = result
             else:
                 # Fallback to standard sequential traversal
-                next_edge = next((e for e in edges if e['source'] == node_id), None)
-                next_node_id = next_edge['target'] if next_edge else None
+                next_node_id = plan.next_node_id(node_id)
             
             if not next_node_id: break
             
             # PREPARE INPUT FOR NEXT NODE (Handle-Aware Mapping)
-            edge_to_next = next((e for e in edges if e['source'] == node_id and e['target'] == next_node_id), None)
+            edge_to_next = plan.edge_between.get((node_id, next_node_id))
             
-            if result in all_node_ids:
+            if routed:
                 # Coming from a Router/Jump: Keep original input (propagate the trigger)
                 pass 
             else:
@@ -131,11 +229,11 @@ class AgentEngine:
                     
                     # Structure as a dict for the target node
                     current_input = {t_handle: mapped_value}
-                    print(f"🧬 Engine: Mapped handle '{s_handle}' -> '{t_handle}'")
+                    logger.debug("🧬 Engine: Mapped handle '%s' -> '%s'", s_handle, t_handle, extra=HOT_PATH)
                 else:
                     current_input = result
             
-            current_node = next((n for n in nodes if n['id'] == next_node_id), None)
+            current_node = plan.nodes_by_id.get(next_node_id)
             if not current_node: break
             
         return str(result)
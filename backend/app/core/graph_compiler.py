@@ -0,0 +1,192 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.agent_cache import graph_hash
+from app.nodes.factory import NodeFactory
+
+
+def _handle_names(ports: Any) -> Dict[str, List[str]]:
+    """{handle name: accepted types} for a node's declared inputs/outputs."""
+    names = {}
+    for port in ports or []:
+        if isinstance(port, dict) and port.get("name"):
+            names[port["name"]] = [str(t) for t in port.get("types") or []]
+    return names
+
+
+class ExecutionPlan:
+    """
+    A workflow graph analysed once: entry point, per-node outgoing edges and
+    routes, node classes, and the problems found while compiling. The engine
+    walks the plan instead of re-scanning the raw node/edge lists on every hop.
+    """
+
+    def __init__(self, plan_id: str, graph_data: Dict[str, Any]):
+        self.plan_id = plan_id
+        self.graph_data = graph_data
+        nodes = graph_data.get("nodes", [])
+        edges = graph_data.get("edges", [])
+
+        self.nodes_by_id: Dict[str, Dict[str, Any]] = {}
+        for node in nodes:
+            self.nodes_by_id.setdefault(node.get("id"), node)
+        self.node_ids = frozenset(self.nodes_by_id)
+        self.entry = next((n for n in nodes if n.get("data", {}).get("id") == "chatInput"), nodes[0] if nodes else None)
+
+        self.outgoing: Dict[str, List[Dict[str, Any]]] = {}
+        self.edge_between: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for edge in edges:
+            self.outgoing.setdefault(edge.get("source"), []).append(edge)
+            self.edge_between.setdefault((edge.get("source"), edge.get("target")), edge)
+        self.routes = {
+            node_id: [{"target_id": e["target"], "condition": e.get("label", "Default")} for e in out]
+            for node_id, out in self.outgoing.items()
+        }
+
+        self.resolution: Dict[str, Dict[str, str]] = {}
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self.cycles: List[List[str]] = []
+
+    @staticmethod
+    def target_type(node: Dict[str, Any]) -> str:
+        reg_id = node.get("data", {}).get("id")
+        return reg_id if reg_id and reg_id != "chatInput" else node.get("type")
+
+    def next_node_id(self, node_id: str) -> Optional[str]:
+        out = self.outgoing.get(node_id)
+        return out[0]["target"] if out else None
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "plan_id": self.plan_id,
+            "valid": self.valid,
+            "entry": self.entry.get("id") if self.entry else None,
+            "nodes": self.resolution,
+            "cycles": self.cycles,
+            "errors": self.errors,
+            "warnings": self.warnings,
+        }
+
+
+def compile_graph(graph_data: Dict[str, Any], plan_id: Optional[str] = None) -> ExecutionPlan:
+    """Builds an ExecutionPlan, resolving node classes and checking edges, handles and cycles."""
+    plan = ExecutionPlan(plan_id or graph_hash(graph_data), graph_data)
+    if plan.entry is None:
+        plan.errors.append("Graph is empty.")
+        return plan
+
+    # Node classes
+    for node_id, node in plan.nodes_by_id.items():
+        target = plan.target_type(node)
+        if node.get("data", {}).get("id") == "chatInput":
+            plan.resolution[node_id] = {"type": "chatInput", "source": "engine", "class": "-"}
+            continue
+        node_class, source = NodeFactory.resolve_node_class(target)
+        plan.resolution[node_id] = {"type": target, "source": source, "class": node_class.__name__ if node_class else "-"}
+        if source == "generic":
+            plan.errors.append(f"Node '{node_id}': unknown node type '{target}' (would run as a GenericNode pass-through).")
+        elif source == "unavailable":
+            plan.errors.append(f"Node '{node_id}': '{target}' failed to load (missing dependency?) and would run as a GenericNode pass-through.")
+        elif source == "auto":
+            plan.warnings.append(f"Node '{node_id}': '{target}' has no dedicated class, auto-routed to {node_class.__name__}.")
+
+    # Edges and handles
+    for edge in plan.graph_data.get("edges", []):
+        source, target = plan.nodes_by_id.get(edge.get("source")), plan.nodes_by_id.get(edge.get("target"))
+        label = edge.get("id") or f"{edge.get('source')}->{edge.get('target')}"
+        if source is None or target is None:
+            plan.errors.append(f"Edge '{label}': references a missing node.")
+            continue
+        outputs = _handle_names(source.get("data", {}).get("outputs"))
+        inputs = _handle_names(target.get("data", {}).get("inputs"))
+        s_handle, t_handle = edge.get("sourceHandle"), edge.get("targetHandle")
+        if s_handle and outputs and s_handle not in outputs:
+            plan.errors.append(f"Edge '{label}': '{edge['source']}' has no output handle '{s_handle}'.")
+            continue
+        if t_handle and inputs and t_handle not in inputs:
+            plan.errors.append(f"Edge '{label}': '{edge['target']}' has no input handle '{t_handle}'.")
+            continue
+        out_types, in_types = outputs.get(s_handle) or [], inputs.get(t_handle) or []
+        if out_types and in_types and not set(out_types) & set(in_types) and "Any" not in in_types:
+            plan.warnings.append(f"Edge '{label}': output types {out_types} do not match input types {in_types}.")
+
+    # Cycles (the engine never revisits a node, so a cycle silently ends the run)
+    plan.cycles = _find_cycles(plan)
+    for cycle in plan.cycles:
+        plan.errors.append("Cycle: " + " -> ".join(cycle + [cycle[0]]))
+    return plan
+
+
+def _find_cycles(plan: ExecutionPlan, limit: int = 10) -> List[List[str]]:
+    """Iterative DFS; returns up to `limit` cycles found through back edges."""
+    WHITE, GREY, BLACK = 0, 1, 2
+    colour = {node_id: WHITE for node_id in plan.nodes_by_id}
+    cycles: List[List[str]] = []
+    for root in plan.nodes_by_id:
+        if colour[root] != WHITE:
+            continue
+        path: List[str] = [root]
+        stack = [(root, iter(plan.outgoing.get(root, [])))]
+        colour[root] = GREY
+        while stack and len(cycles) < limit:
+            node_id, edges = stack[-1]
+            edge = next(edges, None)
+            if edge is None:
+                colour[node_id] = BLACK
+                stack.pop()
+                path.pop()
+                continue
+            nxt = edge.get("target")
+            if nxt not in colour:
+                continue
+            if colour[nxt] == GREY:
+                cycles.append(path[path.index(nxt):])
+            elif colour[nxt] == WHITE:
+                colour[nxt] = GREY
+                path.append(nxt)
+                stack.append((nxt, iter(plan.outgoing.get(nxt, []))))
+    return cycles
+
+
+class PlanCache:
+    """LRU cache of compiled plans keyed by graph hash (the plan id)."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._plans: "OrderedDict[str, ExecutionPlan]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, plan_id: str) -> Optional[ExecutionPlan]:
+        with self._lock:
+            plan = self._plans.get(plan_id)
+            if plan is not None:
+                self._plans.move_to_end(plan_id)
+            return plan
+
+    def put(self, plan: ExecutionPlan) -> ExecutionPlan:
+        with self._lock:
+            self._plans[plan.plan_id] = plan
+            self._plans.move_to_end(plan.plan_id)
+            while len(self._plans) > self.max_entries:
+                self._plans.popitem(last=False)
+        return plan
+
+    def compile(self, graph_data: Dict[str, Any], plan_id: Optional[str] = None) -> ExecutionPlan:
+        """Returns the cached plan for this graph, compiling it on a miss."""
+        plan_id = plan_id or graph_hash(graph_data)
+        return self.get(plan_id) or self.put(compile_graph(graph_data, plan_id))
+
+
+# Shared process-wide instance used by the engine and the API
+plan_cache = PlanCache(max_entries=int(os.getenv("GRAPH_PLAN_CACHE_SIZE", "256")))
+
+
+def get_plan_cache() -> PlanCache:
+    return plan_cache
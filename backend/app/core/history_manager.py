@@ -0,0 +1,178 @@
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.messages import BaseMessage, SystemMessage
+
+logger = logging.getLogger(__name__)
+
+_encoding = None
+_encoding_loaded = False
+
+
+def count_tokens(text: str) -> int:
+    """Counts tokens with tiktoken when available, else a ~4 chars/token estimate."""
+    global _encoding, _encoding_loaded
+    if not _encoding_loaded:
+        _encoding_loaded = True
+        try:
+            import tiktoken
+            _encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            _encoding = None
+    if _encoding is not None:
+        return len(_encoding.encode(text, disallowed_special=()))
+    return max(1, len(text) // 4)
+
+
+def _message_key(message: BaseMessage) -> str:
+    raw = f"{message.type}\x00{message.content}"
+    return hashlib.blake2b(raw.encode("utf-8", "ignore"), digest_size=12).hexdigest()
+
+
+class _SessionState:
+    __slots__ = ("token_cache", "summary", "summary_tokens", "summarized_keys", "pending")
+
+    def __init__(self):
+        self.token_cache: Dict[str, int] = {}
+        self.summary: Optional[str] = None
+        self.summary_tokens = 0
+        self.summarized_keys: Tuple[str, ...] = ()
+        self.pending: Optional[asyncio.Task] = None
+
+
+class HistoryManager:
+    """
+    Keeps agent chat history inside a token budget.
+
+    Token counts are cached per message, so only newly appended messages are
+    counted on each turn. When a history exceeds the budget, the most recent
+    messages that fit are kept verbatim and older turns are folded into a
+    running summary. Summarization runs as a background task: the current
+    turn uses the last cached summary (if any) and the next turn picks up the
+    refreshed one, so the LLM call never sits on the critical path.
+    """
+
+    SUMMARY_PROMPT = (
+        "Progressively summarize the conversation below, adding onto the previous summary. "
+        "Keep names, dates, identifiers, decisions and open questions. Reply with the summary only.\n\n"
+        "Previous summary:\n{summary}\n\nNew lines of conversation:\n{lines}\n\nNew summary:"
+    )
+
+    def __init__(self, max_sessions: int = 5000):
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[Tuple[str, str], _SessionState]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._tasks: set = set()
+
+    def _state(self, agent_id: str, session_id: str) -> _SessionState:
+        key = (agent_id, session_id)
+        with self._lock:
+            state = self._sessions.get(key)
+            if state is None:
+                state = _SessionState()
+                self._sessions[key] = state
+                while len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+            self._sessions.move_to_end(key)
+            return state
+
+    def _tokens(self, state: _SessionState, message: BaseMessage) -> Tuple[str, int]:
+        key = _message_key(message)
+        tokens = state.token_cache.get(key)
+        if tokens is None:
+            content = message.content if isinstance(message.content, str) else str(message.content)
+            tokens = count_tokens(content) + 4  # role/framing overhead
+            state.token_cache[key] = tokens
+        return key, tokens
+
+    def compact(self, agent_id: str, session_id: str, messages: Sequence[BaseMessage],
+                token_budget: int, llm: Any = None) -> List[BaseMessage]:
+        """Returns a history that fits `token_budget`, scheduling summarization of overflow."""
+        messages = list(messages or [])
+        if token_budget <= 0 or not messages:
+            return messages
+        state = self._state(agent_id, session_id)
+
+        counted = [self._tokens(state, m) for m in messages]
+        live_keys = {k for k, _ in counted}
+        if len(state.token_cache) > 4 * len(live_keys) + 64:
+            state.token_cache = {k: v for k, v in state.token_cache.items() if k in live_keys}
+
+        total = sum(t for _, t in counted)
+        if total <= token_budget:
+            return messages
+
+        # Keep the newest messages that fit next to the current summary
+        available = token_budget - state.summary_tokens
+        split = len(messages)
+        used = 0
+        while split > 0 and used + counted[split - 1][1] <= available:
+            split -= 1
+            used += counted[split][1]
+
+        older_keys = tuple(k for k, _ in counted[:split])
+        if llm is not None and older_keys != state.summarized_keys and (state.pending is None or state.pending.done()):
+            new_messages = self._unsummarized(state, messages[:split], older_keys)
+            self._schedule(state, llm, new_messages, older_keys)
+
+        recent = messages[split:]
+        if state.summary:
+            return [SystemMessage(content=f"Summary of the earlier conversation:\n{state.summary}")] + recent
+        return recent
+
+    @staticmethod
+    def _unsummarized(state: _SessionState, older: List[BaseMessage], older_keys: Tuple[str, ...]) -> List[BaseMessage]:
+        """Messages of `older` not yet folded into the summary."""
+        done = set(state.summarized_keys)
+        return [m for m, k in zip(older, older_keys) if k not in done]
+
+    def _schedule(self, state: _SessionState, llm: Any, new_messages: List[BaseMessage], older_keys: Tuple[str, ...]):
+        if not new_messages:
+            state.summarized_keys = older_keys
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self._summarize(state, llm, new_messages, older_keys))
+        state.pending = task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _summarize(self, state: _SessionState, llm: Any, new_messages: List[BaseMessage], older_keys: Tuple[str, ...]):
+        lines = "\n".join(f"{m.type}: {m.content}" for m in new_messages)
+        prompt = self.SUMMARY_PROMPT.format(summary=state.summary or "(none)", lines=lines)
+        try:
+            response = await llm.ainvoke(prompt)
+            summary = str(getattr(response, "content", response)).strip()
+        except Exception as e:
+            logger.error("HistoryManager: background summarization failed: %s", e)
+            return
+        if summary:
+            state.summary = summary
+            state.summary_tokens = count_tokens(summary) + 12
+            state.summarized_keys = older_keys
+
+    def get_summary(self, agent_id: str, session_id: str) -> Optional[str]:
+        return self._state(agent_id, session_id).summary
+
+    def reset(self, agent_id: Optional[str] = None, session_id: Optional[str] = None):
+        with self._lock:
+            if agent_id is None:
+                self._sessions.clear()
+                return
+            for key in [k for k in self._sessions if k[0] == agent_id and (session_id is None or k[1] == session_id)]:
+                del self._sessions[key]
+
+
+# Shared process-wide instance used by agent nodes
+history_manager = HistoryManager(max_sessions=int(os.getenv("HISTORY_MANAGER_MAX_SESSIONS", "5000")))
+
+
+def get_history_manager() -> HistoryManager:
+    return history_manager
@@ -0,0 +1,172 @@
+"""
+Leveled, asynchronous logging for the engine and nodes.
+
+Modules log through the standard library (`logging.getLogger(__name__)`).
+`setup_logging()` installs a single QueueHandler on the root logger: callers
+only enqueue the record, and a background QueueListener thread does the
+formatting and the blocking stdout writes. Configuration (environment):
+
+- LOG_LEVEL:   root level (default INFO)
+- LOG_LEVELS:  per-module levels, e.g. "app.nodes=WARNING,app.core.engine=DEBUG"
+- LOG_FORMAT:  "text" (default) or "json"
+- LOG_QUEUE_SIZE: bounded queue size; records are dropped (and counted) when full
+
+High-frequency messages can be sampled with `extra={"sample_every": N}`:
+only one record in N per (logger, message template) is emitted. Per-node
+and per-edge messages pass `extra=HOT_PATH`, which samples one in
+LOG_SAMPLE_EVERY (default 100).
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Dict, Optional
+
+_STANDARD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "sample_every"}
+
+# `extra` for messages logged once per node or edge of every run
+HOT_PATH = {"sample_every": int(os.getenv("LOG_SAMPLE_EVERY", "100"))}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_setup_lock = threading.Lock()
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; `extra` fields are included as top-level keys."""
+
+    def __init__(self):
+        super().__init__()
+        try:
+            import orjson
+            self._dumps = lambda obj: orjson.dumps(obj, default=str).decode()
+        except ImportError:
+            self._dumps = lambda obj: json.dumps(obj, default=str, ensure_ascii=False)
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return self._dumps(entry)
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps one record in `sample_every` per (logger, template); others are dropped early."""
+
+    def __init__(self):
+        super().__init__()
+        self._counts: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        every = getattr(record, "sample_every", None)
+        if not every or every <= 1:
+            return True
+        key = (record.name, record.msg)
+        with self._lock:
+            count = self._counts.get(key, 0)
+            self._counts[key] = count + 1
+            if len(self._counts) > 10000:
+                self._counts.clear()
+        if count % every:
+            return False
+        record.sampled = every
+        return True
+
+
+class AsyncQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueues records without formatting them (formatting happens on the
+    listener thread). Captures the current run id while still in the caller's
+    context and drops records instead of blocking when the queue is full.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        if not hasattr(record, "run_id"):
+            try:
+                from .tracing import _current_trace
+                trace = _current_trace.get()
+                if trace is not None:
+                    record.run_id = trace.run_id
+            except Exception:
+                pass
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _parse_levels(spec: str) -> Dict[str, str]:
+    levels = {}
+    for item in spec.split(","):
+        if "=" in item:
+            name, level = item.split("=", 1)
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def setup_logging(force: bool = False):
+    """Installs the queue handler and background writer (idempotent)."""
+    global _listener
+    with _setup_lock:
+        if _listener is not None and not force:
+            return
+        if _listener is not None:
+            _listener.stop()
+
+        stream = logging.StreamHandler(sys.stdout)
+        if os.getenv("LOG_FORMAT", "text").lower() == "json":
+            stream.setFormatter(JsonFormatter())
+        else:
+            stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s %(name)s: %(message)s"))
+
+        log_queue: queue.Queue = queue.Queue(maxsize=int(os.getenv("LOG_QUEUE_SIZE", "10000")))
+        handler = AsyncQueueHandler(log_queue)
+        handler.addFilter(SamplingFilter())
+
+        root = logging.getLogger()
+        for existing in [h for h in root.handlers if isinstance(h, AsyncQueueHandler)]:
+            root.removeHandler(existing)
+        root.addHandler(handler)
+        root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+        for name, level in _parse_levels(os.getenv("LOG_LEVELS", "")).items():
+            logging.getLogger(name).setLevel(level)
+
+        _listener = logging.handlers.QueueListener(log_queue, stream, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """Flushes queued records and stops the writer thread."""
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
@@ -0,0 +1,166 @@
+import asyncio
+import os
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Dict, Optional
+
+# Seconds a whole run may take (0 disables); overridable per request
+DEFAULT_RUN_DEADLINE = float(os.getenv("RUN_DEADLINE_SECONDS", "600"))
+
+# Per-node timeouts by category are opt-in: set NODE_TIMEOUT_<CATEGORY> or the
+# `node_timeout` config key of a node (0 disables). Ingests, crawls and large
+# DataFrame jobs legitimately run for minutes, so by default only the run
+# deadline bounds them.
+NODE_TIMEOUT_DEFAULTS = {
+    "agent": 0.0,
+    "model": 0.0,
+    "integration": 0.0,
+    "storage": 0.0,
+    "processing": 0.0,
+    "default": 0.0,
+}
+NODE_TIMEOUTS = {
+    category: float(os.getenv(f"NODE_TIMEOUT_{category.upper()}", str(seconds)))
+    for category, seconds in NODE_TIMEOUT_DEFAULTS.items()
+}
+
+# Package of a node class -> timeout category
+_CATEGORY_PACKAGES = (
+    ("agents", "agent"),
+    ("models", "model"),
+    ("integrations", "integration"),
+    ("google", "integration"),
+    ("data_source", "integration"),
+    ("storage", "storage"),
+    ("FAISS", "storage"),
+    ("files_and_knowledge", "storage"),
+    ("processing", "processing"),
+    ("flow_controls", "processing"),
+    ("core", "processing"),
+)
+
+
+class RunCancelled(Exception):
+    """Raised by the engine when a run is cancelled or exceeds its deadline."""
+
+    def __init__(self, run_id: str, reason: str):
+        self.run_id = run_id
+        self.reason = reason
+        super().__init__(f"Run {run_id} {'exceeded its deadline' if reason == 'deadline' else 'was cancelled'}.")
+
+    @property
+    def status(self) -> str:
+        return "timed_out" if self.reason == "deadline" else "cancelled"
+
+
+class RunHandle:
+    """An in-flight run: its task, deadline and any pending cancellation."""
+
+    def __init__(self, run_id: str, deadline: Optional[float] = None):
+        self.run_id = run_id
+        self.started_at = time.monotonic()
+        self.deadline_at = self.started_at + deadline if deadline else None
+        self.task: Optional[asyncio.Task] = None
+        self.cancel_reason: Optional[str] = None
+
+    def remaining(self) -> Optional[float]:
+        if self.deadline_at is None:
+            return None
+        return max(0.0, self.deadline_at - time.monotonic())
+
+    def cancel(self, reason: str = "cancelled") -> bool:
+        if self.cancel_reason is None:
+            self.cancel_reason = reason
+        if self.task is None or self.task.done():
+            return False
+        # Task.cancel is not thread-safe; hop onto the task's loop
+        self.task.get_loop().call_soon_threadsafe(self.task.cancel)
+        return True
+
+    def check(self):
+        """Raises CancelledError at a hop boundary if the run should stop.
+
+        Covers nodes that swallow CancelledError with a bare `except:`.
+        """
+        if self.cancel_reason is not None:
+            raise asyncio.CancelledError()
+        if self.deadline_at is not None and time.monotonic() >= self.deadline_at:
+            self.cancel_reason = "deadline"
+            raise asyncio.CancelledError()
+
+
+current_run: ContextVar[Optional[RunHandle]] = ContextVar("current_run", default=None)
+
+
+class RunRegistry:
+    """Runs executing in this process, by run id."""
+
+    def __init__(self):
+        self._runs: Dict[str, RunHandle] = {}
+        self._lock = threading.Lock()
+
+    def start(self, run_id: str, deadline: Optional[float] = None) -> RunHandle:
+        handle = RunHandle(run_id, deadline)
+        with self._lock:
+            self._runs[run_id] = handle
+        return handle
+
+    def finish(self, run_id: str):
+        with self._lock:
+            self._runs.pop(run_id, None)
+
+    def get(self, run_id: str) -> Optional[RunHandle]:
+        with self._lock:
+            return self._runs.get(run_id)
+
+    def cancel(self, run_id: str, reason: str = "cancelled") -> bool:
+        """Cancels a local run; False when it is not running in this process."""
+        handle = self.get(run_id)
+        return handle.cancel(reason) if handle else False
+
+    def active(self) -> Dict[str, float]:
+        now = time.monotonic()
+        with self._lock:
+            return {run_id: round(now - h.started_at, 3) for run_id, h in self._runs.items()}
+
+
+_categories: Dict[type, str] = {}
+
+
+def node_category(node: Any) -> str:
+    node_class = type(node)
+    category = _categories.get(node_class)
+    if category is None:
+        module = f".{node_class.__module__}."
+        category = next((c for package, c in _CATEGORY_PACKAGES if f".{package}." in module), "default")
+        _categories[node_class] = category
+    return category
+
+
+def node_timeout(node: Any, config: Optional[Dict[str, Any]] = None) -> Optional[float]:
+    """Timeout for one node execution (None = unbounded)."""
+    override = (config or {}).get("node_timeout")
+    if override not in (None, ""):
+        try:
+            seconds = float(override)
+        except (TypeError, ValueError):
+            seconds = NODE_TIMEOUTS["default"]
+    else:
+        seconds = NODE_TIMEOUTS.get(node_category(node), NODE_TIMEOUTS["default"])
+    return seconds if seconds > 0 else None
+
+
+async def with_timeout(awaitable: Awaitable[Any], timeout: float) -> Any:
+    """`wait_for` without its per-call task where `asyncio.timeout` exists (3.11+)."""
+    if hasattr(asyncio, "timeout"):
+        async with asyncio.timeout(timeout):
+            return await awaitable
+    return await asyncio.wait_for(awaitable, timeout)
+
+
+run_registry = RunRegistry()
+
+
+def get_run_registry() -> RunRegistry:
+    return run_registry
@@ -0,0 +1,235 @@
+import asyncio
+import itertools
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from .run_control import RunCancelled
+from .shared_state import get_shared_state
+
+logger = logging.getLogger(__name__)
+
+Broadcaster = Callable[..., Awaitable[None]]
+
+
+# Statuses of runs that will not change again
+FINISHED = ("completed", "failed", "cancelled", "timed_out")
+
+
+class QueueFullError(Exception):
+    """Raised when a run is submitted while the queue is at capacity."""
+
+
+class RunQueue:
+    """
+    Job queue for workflow runs.
+
+    Submitted runs wait in a priority queue (higher `priority` first, FIFO
+    within a priority) and are drained by `workers` asyncio worker tasks.
+    At most `per_flow_limit` runs of the same flow execute at once: a worker
+    that pulls a run of a saturated flow parks it until a slot of that flow
+    frees up, so one busy flow cannot starve the others. Finished run records
+    are kept for `/runs/{id}` up to `max_history` entries, and every status
+    change is mirrored to the shared state so any worker can answer for a run.
+    A queued run can be cancelled before it starts; a running one is cancelled
+    by the engine and ends as `cancelled` or `timed_out`.
+    """
+
+    def __init__(self, workers: int = 4, per_flow_limit: int = 2, max_queued: int = 1000, max_history: int = 1000):
+        self.workers = workers
+        self.per_flow_limit = per_flow_limit
+        self.max_queued = max_queued
+        self.max_history = max_history
+        self.runs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._parked: Dict[str, Deque[tuple]] = {}
+        self._active: Dict[str, int] = {}
+        self._seq = itertools.count()
+        self._tasks = []
+        self._executor: Optional[Callable[..., Awaitable[Any]]] = None
+
+    def configure(self, executor: Callable[..., Awaitable[Any]]):
+        """Sets the coroutine that runs a job: executor(graph_data, message, broadcaster, run_id, deadline, session_id)."""
+        self._executor = executor
+
+    def _ensure_started(self):
+        if self._queue is None:
+            self._queue = asyncio.PriorityQueue()
+        self._tasks = [t for t in self._tasks if not t.done()]
+        loop = asyncio.get_running_loop()
+        while len(self._tasks) < self.workers:
+            self._tasks.append(loop.create_task(self._worker(len(self._tasks))))
+
+    @property
+    def depth(self) -> int:
+        parked = sum(len(q) for q in self._parked.values())
+        return (self._queue.qsize() if self._queue else 0) + parked
+
+    @property
+    def active(self) -> int:
+        return sum(self._active.values())
+
+    async def submit(self, graph_data: Dict[str, Any], message: str, flow_id: str,
+               priority: int = 0, make_broadcaster: Optional[Callable[[str], Broadcaster]] = None,
+               deadline: Optional[float] = None, session_id: Optional[str] = None) -> str:
+        """Enqueues a run; `make_broadcaster(run_id)` builds its event broadcaster.
+
+        `deadline` (seconds) is counted from when the run starts, not from submission.
+        """
+        self._ensure_started()
+        if self.depth >= self.max_queued:
+            raise QueueFullError(f"Run queue is full ({self.max_queued} queued runs).")
+
+        run_id = uuid.uuid4().hex
+        self.runs[run_id] = {
+            "run_id": run_id,
+            "flow_id": flow_id,
+            "status": "queued",
+            "priority": priority,
+            "created_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+            "response": None,
+            "error": None,
+        }
+        broadcaster = make_broadcaster(run_id) if make_broadcaster else None
+        self._jobs[run_id] = {"graph_data": graph_data, "message": message, "broadcaster": broadcaster, "deadline": deadline,
+                              "session_id": session_id}
+        self._queue.put_nowait((-priority, next(self._seq), run_id, flow_id))
+        self._trim_history()
+        await self._persist(self.runs[run_id])
+        return run_id
+
+    async def cancel(self, run_id: str) -> bool:
+        """Cancels a run still waiting in this worker's queue; False otherwise."""
+        record = self.runs.get(run_id)
+        if record is None or record["status"] != "queued":
+            return False
+        job = self._jobs.pop(run_id, {})
+        record["status"] = "cancelled"
+        record["finished_at"] = time.time()
+        self._unpark(record["flow_id"], run_id)
+        await self._persist(record)
+        broadcaster = job.get("broadcaster")
+        if broadcaster:
+            try:
+                await broadcaster("run_end", None, {"status": "cancelled", "response": None, "error": None})
+            except Exception as e:
+                logger.error("RunQueue: failed to broadcast end of run %s: %s", run_id, e)
+        return True
+
+    async def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Local record first, then the shared state (run owned by another worker)."""
+        record = self.runs.get(run_id)
+        if record is not None:
+            return record
+        try:
+            return await get_shared_state().get_run(run_id)
+        except Exception as e:
+            logger.error("RunQueue: shared state lookup failed for run %s: %s", run_id, e)
+            return None
+
+    async def _persist(self, record: Dict[str, Any]):
+        try:
+            await get_shared_state().set_run(record["run_id"], record)
+        except Exception as e:
+            logger.error("RunQueue: failed to persist run %s: %s", record['run_id'], e)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"queued": self.depth, "active": self.active, "workers": self.workers}
+
+    def _trim_history(self):
+        if len(self.runs) <= self.max_history:
+            return
+        for run_id in list(self.runs):
+            if len(self.runs) <= self.max_history:
+                break
+            if self.runs[run_id]["status"] in FINISHED:
+                del self.runs[run_id]
+
+    async def _worker(self, index: int):
+        while True:
+            item = await self._queue.get()
+            try:
+                run_id, flow_id = item[2], item[3]
+                record = self.runs.get(run_id)
+                if record is None or record["status"] != "queued":
+                    # A cancelled run may have been the one released for a free slot
+                    self._release_parked(flow_id)
+                    continue
+                if self._active.get(flow_id, 0) >= self.per_flow_limit:
+                    self._parked.setdefault(flow_id, deque()).append(item)
+                    continue
+                await self._run(run_id, record)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, run_id: str, record: Dict[str, Any]):
+        flow_id = record["flow_id"]
+        job = self._jobs.pop(run_id, {})
+        broadcaster = job.get("broadcaster")
+        self._active[flow_id] = self._active.get(flow_id, 0) + 1
+        record["status"] = "running"
+        record["started_at"] = time.time()
+        await self._persist(record)
+        try:
+            record["response"] = await self._executor(job.get("graph_data", {}), job.get("message", ""), broadcaster, run_id,
+                                                      job.get("deadline"), job.get("session_id"))
+            record["status"] = "completed"
+        except RunCancelled as e:
+            logger.info("RunQueue: run %s %s", run_id, e.status)
+            record["status"] = e.status
+            record["error"] = str(e)
+        except Exception as e:
+            logger.exception("RunQueue: run %s failed", run_id)
+            record["status"] = "failed"
+            record["error"] = str(e)
+        finally:
+            record["finished_at"] = time.time()
+            self._active[flow_id] -= 1
+            if not self._active[flow_id]:
+                del self._active[flow_id]
+            self._release_parked(flow_id)
+            await self._persist(record)
+            if broadcaster:
+                try:
+                    await broadcaster("run_end", None, {"status": record["status"], "response": record["response"], "error": record["error"]})
+                except Exception as e:
+                    logger.error("RunQueue: failed to broadcast end of run %s: %s", run_id, e)
+
+    def _release_parked(self, flow_id: str):
+        """Requeues the next parked run of a flow that has a free slot."""
+        if self._active.get(flow_id, 0) >= self.per_flow_limit:
+            return
+        parked = self._parked.get(flow_id)
+        if parked:
+            self._queue.put_nowait(parked.popleft())
+            if not parked:
+                del self._parked[flow_id]
+
+    def _unpark(self, flow_id: str, run_id: str):
+        parked = self._parked.get(flow_id)
+        if not parked:
+            return
+        for item in parked:
+            if item[2] == run_id:
+                parked.remove(item)
+                break
+        if not parked:
+            del self._parked[flow_id]
+
+
+run_queue = RunQueue(
+    workers=int(os.getenv("RUN_QUEUE_WORKERS", "4")),
+    per_flow_limit=int(os.getenv("RUN_QUEUE_PER_FLOW", "2")),
+    max_queued=int(os.getenv("RUN_QUEUE_MAX_QUEUED", "1000")),
+    max_history=int(os.getenv("RUN_QUEUE_MAX_HISTORY", "1000")),
+)
+
+
+def get_run_queue() -> RunQueue:
+    return run_queue
@@ -0,0 +1,62 @@
+"""
+JSON encoding for API responses, WebSocket events and stores.
+
+Uses orjson when it is installed (several times faster than the stdlib and
+encodes straight to bytes) and falls back to `json` otherwise. Values orjson
+cannot encode natively (pydantic models, sets, arbitrary objects) go through
+`_default`, matching the `default=str` behaviour used elsewhere.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    from fastapi.responses import JSONResponse
+except ImportError:  # pragma: no cover - only needed by the API
+    JSONResponse = object
+
+
+def _default(value: Any) -> Any:
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "replace")
+    return str(value)
+
+
+def dumps(obj: Any, sort_keys: bool = False, indent: bool = False) -> bytes:
+    """Encodes `obj` to UTF-8 JSON bytes."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+    return json.dumps(obj, default=_default, sort_keys=sort_keys, indent=2 if indent else None,
+                      ensure_ascii=False).encode("utf-8")
+
+
+def dumps_str(obj: Any, sort_keys: bool = False) -> str:
+    """Like `dumps` but returns text (WebSocket text frames, Redis strings)."""
+    return dumps(obj, sort_keys=sort_keys).decode("utf-8")
+
+
+def loads(data: Any) -> Any:
+    """Decodes JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with `dumps` (the API's default response class)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,222 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Sequence
+
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+
+
+class SessionStore:
+    """
+    Process-level conversation store keyed by session_id.
+
+    Each session holds a bounded ring buffer of messages (oldest messages drop
+    off once `max_messages` is reached). Sessions are kept in LRU order and the
+    least recently used ones are evicted past `max_sessions` or after being
+    idle for `idle_ttl` seconds.
+    """
+
+    def __init__(self, max_sessions: int = 5000, max_messages: int = 200, idle_ttl: float = 6 * 3600):
+        self.max_sessions = max_sessions
+        self.max_messages = max_messages
+        self.idle_ttl = idle_ttl
+        self._sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def _touch(self, session_id: str, create: bool = True) -> Optional[Dict[str, Any]]:
+        now = time.monotonic()
+        session = self._sessions.get(session_id)
+        if session is not None and now - session["last_access"] > self.idle_ttl:
+            del self._sessions[session_id]
+            session = None
+        if session is None:
+            if not create:
+                return None
+            session = {"messages": deque(maxlen=self.max_messages), "last_access": now, "loaded": False, "version": None}
+            self._sessions[session_id] = session
+            self._evict(now)
+        session["last_access"] = now
+        self._sessions.move_to_end(session_id)
+        return session
+
+    def _evict(self, now: float):
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+        # Oldest entries come first, so stop at the first non-idle session
+        for sid in list(self._sessions):
+            if now - self._sessions[sid]["last_access"] <= self.idle_ttl:
+                break
+            del self._sessions[sid]
+
+    def get_messages(self, session_id: str) -> List[BaseMessage]:
+        with self._lock:
+            session = self._touch(session_id, create=False)
+            return list(session["messages"]) if session else []
+
+    def append(self, session_id: str, messages: Sequence[BaseMessage]):
+        with self._lock:
+            self._touch(session_id)["messages"].extend(messages)
+
+    def replace(self, session_id: str, messages: Sequence[BaseMessage], loaded: bool = True, version: Any = None):
+        with self._lock:
+            session = self._touch(session_id)
+            session["messages"].clear()
+            session["messages"].extend(messages)
+            session["loaded"] = loaded
+            session["version"] = version
+
+    def version(self, session_id: str) -> Any:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            return session["version"] if session else None
+
+    def set_version(self, session_id: str, version: Any):
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session:
+                session["version"] = version
+
+    def is_loaded(self, session_id: str) -> bool:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            return bool(session and session["loaded"])
+
+    def clear(self, session_id: str):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+class SessionChatHistory(BaseChatMessageHistory):
+    """In-process chat history backed by the shared SessionStore."""
+
+    def __init__(self, session_id: str, store: Optional[SessionStore] = None):
+        self.session_id = session_id
+        self.store = store or session_store
+
+    @property
+    def messages(self) -> List[BaseMessage]:
+        return self.store.get_messages(self.session_id)
+
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        self.store.append(self.session_id, messages)
+
+    def add_message(self, message: BaseMessage) -> None:
+        self.add_messages([message])
+
+    # The store is in-process and never blocks: skip the executor hop of the default async methods
+    async def aget_messages(self) -> List[BaseMessage]:
+        return self.messages
+
+    async def aadd_messages(self, messages: Sequence[BaseMessage]) -> None:
+        self.add_messages(messages)
+
+    def clear(self) -> None:
+        self.store.clear(self.session_id)
+
+
+_redis_pools: Dict[str, Any] = {}
+_redis_lock = threading.Lock()
+
+
+def get_redis_client(url: str):
+    """Returns a Redis client sharing one connection pool per URL."""
+    import redis
+
+    with _redis_lock:
+        pool = _redis_pools.get(url)
+        if pool is None:
+            pool = redis.ConnectionPool.from_url(url, max_connections=int(os.getenv("REDIS_POOL_SIZE", "50")))
+            _redis_pools[url] = pool
+    return redis.Redis(connection_pool=pool)
+
+
+class RedisSessionChatHistory(BaseChatMessageHistory):
+    """
+    Redis-backed chat history using a pooled client.
+
+    Uses the same key layout as LangChain's RedisChatMessageHistory
+    (LPUSH of JSON messages under `message_store:<session_id>`), so existing
+    histories stay readable. The stored list is never trimmed; only the last
+    `max_messages` are read (a single bounded LRANGE) and mirrored in the
+    SessionStore, and appends are written with one pipelined LPUSH + EXPIRE.
+    The client is synchronous: async callers go through `aget_messages` /
+    `aadd_messages`, which run it in a thread.
+
+    Every write also bumps a `<key>:ver` counter. Reads compare it with the
+    mirrored version (one GET) and reload only when another worker wrote to
+    the session in the meantime.
+    """
+
+    def __init__(self, session_id: str, url: str, ttl: Optional[int] = None,
+                 key_prefix: str = "message_store:", store: Optional[SessionStore] = None):
+        self.session_id = session_id
+        self.url = url
+        self.ttl = int(ttl) if ttl else None
+        self.key = f"{key_prefix}{session_id}"
+        self.version_key = f"{self.key}:ver"
+        self.store = store or session_store
+        self.client = get_redis_client(url)
+
+    @property
+    def _cache_id(self) -> str:
+        return f"redis:{self.url}:{self.key}"
+
+    @property
+    def messages(self) -> List[BaseMessage]:
+        self._sync()
+        return self.store.get_messages(self._cache_id)
+
+    def _sync(self):
+        """Reloads the mirror when it is missing or stale."""
+        if self.store.is_loaded(self._cache_id) and self.client.get(self.version_key) == self.store.version(self._cache_id):
+            return
+        self._load()
+
+    def _load(self):
+        pipe = self.client.pipeline(transaction=True)
+        pipe.lrange(self.key, 0, self.store.max_messages - 1)
+        pipe.get(self.version_key)
+        items, version = pipe.execute()
+        messages = messages_from_dict([json.loads(m) for m in reversed(items)])
+        self.store.replace(self._cache_id, messages, version=version)
+
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        if not messages:
+            return
+        self._sync()
+        previous = int(self.store.version(self._cache_id) or 0)
+        pipe = self.client.pipeline(transaction=True)
+        pipe.lpush(self.key, *[json.dumps(message_to_dict(m)) for m in messages])
+        pipe.incr(self.version_key)
+        if self.ttl:
+            pipe.expire(self.key, self.ttl)
+            pipe.expire(self.version_key, self.ttl)
+        version = pipe.execute()[1]
+        self.store.append(self._cache_id, messages)
+        # A gap means another worker wrote concurrently: leave the mirror stale so the next read reloads
+        self.store.set_version(self._cache_id, str(version).encode() if version == previous + 1 else None)
+
+    def add_message(self, message: BaseMessage) -> None:
+        self.add_messages([message])
+
+    def clear(self) -> None:
+        self.client.delete(self.key, self.version_key)
+        self.store.clear(self._cache_id)
+
+
+# Shared process-wide store used by MemoryNode
+session_store = SessionStore(
+    max_sessions=int(os.getenv("SESSION_STORE_MAX_SESSIONS", "5000")),
+    max_messages=int(os.getenv("SESSION_STORE_MAX_MESSAGES", "200")),
+    idle_ttl=float(os.getenv("SESSION_STORE_IDLE_TTL", str(6 * 3600))),
+)
+
+
+def get_session_store() -> SessionStore:
+    return session_store
@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from .serialization import dumps_str, loads
+from .session_store import RedisSessionChatHistory, SessionChatHistory
+
+logger = logging.getLogger(__name__)
+
+WORKER_ID = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+
+class SharedState(ABC):
+    """
+    State shared by all workers serving the Studio API.
+
+    Carries run events between workers (pub/sub), stores run records and
+    conversation memory, and keeps a registry of live workers. The in-process
+    backend serves a single worker and tests; the Redis backend lets N
+    uvicorn workers per box, and several boxes, serve the same users.
+    """
+
+    @abstractmethod
+    async def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        pass
+
+    @abstractmethod
+    def subscribe(self, channel: str) -> AsyncIterator[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def set_run(self, run_id: str, record: Dict[str, Any], ttl: int = 86400) -> None:
+        pass
+
+    @abstractmethod
+    async def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def register_worker(self, worker_id: str, info: Dict[str, Any], ttl: int = 30) -> None:
+        pass
+
+    @abstractmethod
+    async def unregister_worker(self, worker_id: str) -> None:
+        pass
+
+    @abstractmethod
+    async def list_workers(self) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def chat_history(self, session_id: str) -> Any:
+        """Returns a BaseChatMessageHistory for `session_id` visible to every worker."""
+        pass
+
+    @abstractmethod
+    async def set_plan(self, plan_id: str, graph_data: Dict[str, Any], ttl: int = 7 * 86400) -> None:
+        """Stores a compiled graph so any worker can run it by plan id."""
+        pass
+
+    @abstractmethod
+    async def get_plan(self, plan_id: str) -> Optional[Dict[str, Any]]:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class InProcessSharedState(SharedState):
+    """Single-process backend: plain dicts and asyncio queues."""
+
+    def __init__(self):
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+        self._runs: Dict[str, tuple] = {}
+        self._workers: Dict[str, tuple] = {}
+        self._plans: Dict[str, tuple] = {}
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        for queue in self._subscribers.get(channel, []):
+            queue.put_nowait(message)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[Dict[str, Any]]:
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(channel, []).append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._subscribers[channel].remove(queue)
+
+    async def set_run(self, run_id: str, record: Dict[str, Any], ttl: int = 86400) -> None:
+        self._runs[run_id] = (time.time() + ttl, dict(record))
+        if len(self._runs) > 10000:
+            now = time.time()
+            self._runs = {k: v for k, v in self._runs.items() if v[0] > now}
+
+    async def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        entry = self._runs.get(run_id)
+        if not entry or entry[0] <= time.time():
+            return None
+        return entry[1]
+
+    async def register_worker(self, worker_id: str, info: Dict[str, Any], ttl: int = 30) -> None:
+        self._workers[worker_id] = (time.time() + ttl, {**info, "worker_id": worker_id})
+
+    async def unregister_worker(self, worker_id: str) -> None:
+        self._workers.pop(worker_id, None)
+
+    async def list_workers(self) -> List[Dict[str, Any]]:
+        now = time.time()
+        return [info for expires_at, info in self._workers.values() if expires_at > now]
+
+    def chat_history(self, session_id: str) -> Any:
+        return SessionChatHistory(session_id)
+
+    async def set_plan(self, plan_id: str, graph_data: Dict[str, Any], ttl: int = 7 * 86400) -> None:
+        self._plans[plan_id] = (time.time() + ttl, graph_data)
+        if len(self._plans) > 1000:
+            now = time.time()
+            self._plans = {k: v for k, v in self._plans.items() if v[0] > now}
+
+    async def get_plan(self, plan_id: str) -> Optional[Dict[str, Any]]:
+        entry = self._plans.get(plan_id)
+        if not entry or entry[0] <= time.time():
+            return None
+        return entry[1]
+
+
+class RedisSharedState(SharedState):
+    """Redis backend: pub/sub for events, keys with TTL for runs and workers."""
+
+    def __init__(self, url: str, prefix: str = "studio:"):
+        import redis.asyncio as aioredis
+        self.url = url
+        self.prefix = prefix
+        self.client = aioredis.from_url(url)
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        await self.client.publish(f"{self.prefix}{channel}", dumps_str(message))
+
+    async def subscribe(self, channel: str) -> AsyncIterator[Dict[str, Any]]:
+        pubsub = self.client.pubsub()
+        await pubsub.subscribe(f"{self.prefix}{channel}")
+        try:
+            async for item in pubsub.listen():
+                if item.get("type") != "message":
+                    continue
+                try:
+                    yield loads(item["data"])
+                except ValueError:
+                    continue
+        finally:
+            await pubsub.unsubscribe()
+            await pubsub.aclose()
+
+    async def set_run(self, run_id: str, record: Dict[str, Any], ttl: int = 86400) -> None:
+        await self.client.set(f"{self.prefix}run:{run_id}", dumps_str(record), ex=ttl)
+
+    async def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        raw = await self.client.get(f"{self.prefix}run:{run_id}")
+        return loads(raw) if raw else None
+
+    async def register_worker(self, worker_id: str, info: Dict[str, Any], ttl: int = 30) -> None:
+        pipe = self.client.pipeline(transaction=False)
+        pipe.set(f"{self.prefix}worker:{worker_id}", dumps_str({**info, "worker_id": worker_id}), ex=ttl)
+        pipe.sadd(f"{self.prefix}workers", worker_id)
+        await pipe.execute()
+
+    async def unregister_worker(self, worker_id: str) -> None:
+        pipe = self.client.pipeline(transaction=False)
+        pipe.delete(f"{self.prefix}worker:{worker_id}")
+        pipe.srem(f"{self.prefix}workers", worker_id)
+        await pipe.execute()
+
+    async def list_workers(self) -> List[Dict[str, Any]]:
+        ids = [i.decode() if isinstance(i, bytes) else i for i in await self.client.smembers(f"{self.prefix}workers")]
+        if not ids:
+            return []
+        raws = await self.client.mget([f"{self.prefix}worker:{i}" for i in ids])
+        # Workers whose heartbeat key expired are dropped from the set
+        dead = [i for i, raw in zip(ids, raws) if raw is None]
+        if dead:
+            await self.client.srem(f"{self.prefix}workers", *dead)
+        return [loads(raw) for raw in raws if raw is not None]
+
+    async def set_plan(self, plan_id: str, graph_data: Dict[str, Any], ttl: int = 7 * 86400) -> None:
+        await self.client.set(f"{self.prefix}plan:{plan_id}", dumps_str(graph_data), ex=ttl)
+
+    async def get_plan(self, plan_id: str) -> Optional[Dict[str, Any]]:
+        raw = await self.client.get(f"{self.prefix}plan:{plan_id}")
+        return loads(raw) if raw else None
+
+    def chat_history(self, session_id: str) -> Any:
+        return RedisSessionChatHistory(session_id, url=self.url, key_prefix=f"{self.prefix}messages:")
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+_shared_state: Optional[SharedState] = None
+
+
+def get_shared_state() -> SharedState:
+    """Backend chosen by SHARED_STATE_BACKEND ("memory" or "redis", URL in SHARED_STATE_URL)."""
+    global _shared_state
+    if _shared_state is None:
+        backend = os.getenv("SHARED_STATE_BACKEND", "memory").lower()
+        if backend == "redis":
+            _shared_state = RedisSharedState(os.getenv("SHARED_STATE_URL", "redis://localhost:6379/0"))
+        else:
+            _shared_state = InProcessSharedState()
+    return _shared_state
+
+
+def set_shared_state(state: SharedState) -> None:
+    """Swaps the backend (e.g. an InProcessSharedState in tests)."""
+    global _shared_state
+    _shared_state = state
+
+
+async def worker_heartbeat(info: Dict[str, Any], interval: float = 10.0) -> None:
+    """Keeps this worker registered until cancelled."""
+    state = get_shared_state()
+    try:
+        while True:
+            try:
+                await state.register_worker(WORKER_ID, {**info, "heartbeat": time.time()}, ttl=int(interval * 3))
+            except Exception as e:
+                logger.error("SharedState: worker heartbeat failed: %s", e)
+            await asyncio.sleep(interval)
+    finally:
+        try:
+            await state.unregister_worker(WORKER_ID)
+        except Exception:
+            pass
@@ -0,0 +1,84 @@
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_tool_pool() -> ThreadPoolExecutor:
+    """Bounded thread pool shared by all sync tools (TOOL_THREAD_POOL_SIZE, default 16)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=int(os.getenv("TOOL_THREAD_POOL_SIZE", "16")),
+                thread_name_prefix="studio-tool",
+            )
+    return _pool
+
+
+def _timeout_message(name: str, timeout: float) -> str:
+    return f"Error: tool '{name}' timed out after {timeout:g}s."
+
+
+def _wrap_sync(name: str, func: Any, timeout: Optional[float]):
+    async def coroutine(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        # Copy the context so trace spans opened inside the tool nest under the agent
+        ctx = contextvars.copy_context()
+        future = loop.run_in_executor(get_tool_pool(), functools.partial(ctx.run, func, *args, **kwargs))
+        try:
+            return await asyncio.wait_for(future, timeout) if timeout else await future
+        except asyncio.TimeoutError:
+            # The worker thread cannot be interrupted; it frees its slot when the call returns
+            return _timeout_message(name, timeout)
+    return coroutine
+
+
+def _wrap_async(name: str, coro_func: Any, timeout: Optional[float]):
+    async def coroutine(*args, **kwargs):
+        try:
+            return await asyncio.wait_for(coro_func(*args, **kwargs), timeout)
+        except asyncio.TimeoutError:
+            return _timeout_message(name, timeout)
+    return coroutine
+
+
+def prepare_parallel_tools(tools: List[Any], default_timeout: Optional[float] = 30,
+                           timeouts: Optional[Dict[str, float]] = None) -> List[Any]:
+    """
+    Returns copies of `tools` ready for concurrent dispatch.
+
+    AgentExecutor's async path already gathers all tool calls of one model
+    step; what blocks it is sync tools (plain `func` closures), which LangChain
+    sends to the loop's default executor with no bound and no deadline. Tools
+    exposing `func`/`coroutine` (Tool, StructuredTool) get a coroutine that runs
+    sync functions on the shared bounded pool and enforces a per-tool timeout
+    (`timeouts[name]`, else `default_timeout`). A timeout is returned to the
+    agent as an error observation. Other tool classes are returned unchanged.
+    """
+    timeouts = timeouts or {}
+    prepared = []
+    for tool in tools:
+        fields = getattr(type(tool), "model_fields", {})
+        if "coroutine" not in fields or "func" not in fields:
+            prepared.append(tool)
+            continue
+
+        name = getattr(tool, "name", "tool")
+        timeout = timeouts.get(name, default_timeout)
+        timeout = float(timeout) if timeout else None
+        if tool.coroutine is not None:
+            coroutine = _wrap_async(name, tool.coroutine, timeout) if timeout else tool.coroutine
+        elif tool.func is not None:
+            coroutine = _wrap_sync(name, tool.func, timeout)
+        else:
+            prepared.append(tool)
+            continue
+        prepared.append(tool.model_copy(update={"coroutine": coroutine}))
+    return prepared
@@ -0,0 +1,232 @@
+import contextvars
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+_current_trace: contextvars.ContextVar = contextvars.ContextVar("studio_trace", default=None)
+_current_span: contextvars.ContextVar = contextvars.ContextVar("studio_span", default=None)
+
+
+class Span:
+    __slots__ = ("span_id", "parent_id", "name", "kind", "start_ns", "end_ns", "attributes", "status", "error")
+
+    def __init__(self, name: str, kind: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes
+        self.status = "ok"
+        self.error: Optional[str] = None
+
+    def finish(self, error: Optional[BaseException] = None):
+        self.end_ns = time.time_ns()
+        if error is not None:
+            self.status = "error"
+            self.error = f"{type(error).__name__}: {error}"
+
+    @property
+    def duration_ns(self) -> int:
+        return (self.end_ns or time.time_ns()) - self.start_ns
+
+
+class Trace:
+    def __init__(self, run_id: str, max_spans: int):
+        self.run_id = run_id
+        self.trace_id = secrets.token_hex(16)
+        self.spans: List[Span] = []
+        self.dropped = 0
+        self.max_spans = max_spans
+        self._lock = threading.Lock()
+
+    def add(self, span: Span) -> bool:
+        with self._lock:
+            if len(self.spans) >= self.max_spans:
+                self.dropped += 1
+                return False
+            self.spans.append(span)
+            return True
+
+
+class Tracer:
+    """
+    Per-run tracing: one span per node execution (nested pulls become child
+    spans) plus child spans for LLM, embedding and HTTP calls. The current
+    trace/span travel in contextvars, so spans nest across awaits and into
+    tool threads started with a copied context. Finished traces are kept in a
+    ring buffer of `max_traces` runs.
+    """
+
+    def __init__(self, max_traces: int = 200, max_spans: int = 5000):
+        self.max_traces = max_traces
+        self.max_spans = max_spans
+        self._traces: "OrderedDict[str, Trace]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def trace_run(self, run_id: str, **attributes) -> Iterator[Trace]:
+        trace = Trace(run_id, self.max_spans)
+        with self._lock:
+            self._traces[run_id] = trace
+            while len(self._traces) > self.max_traces:
+                self._traces.popitem(last=False)
+        trace_token = _current_trace.set(trace)
+        try:
+            with self.span("run", kind="run", run_id=run_id, **attributes):
+                yield trace
+        finally:
+            _current_trace.reset(trace_token)
+
+    @contextmanager
+    def span(self, name: str, kind: str = "internal", **attributes) -> Iterator[Optional[Span]]:
+        """Child span of the current one; a no-op outside a traced run."""
+        trace = _current_trace.get()
+        if trace is None:
+            yield None
+            return
+        parent = _current_span.get()
+        span = Span(name, kind, parent.span_id if parent else None, attributes)
+        if not trace.add(span):
+            yield None
+            return
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.finish(e)
+            raise
+        else:
+            span.finish()
+        finally:
+            _current_span.reset(token)
+
+    def start_span(self, name: str, kind: str = "internal", parent: Optional[Span] = None, **attributes) -> Optional[Span]:
+        """Detached span for callback-style APIs; the caller must call span.finish()."""
+        trace = _current_trace.get()
+        if trace is None:
+            return None
+        parent = parent or _current_span.get()
+        span = Span(name, kind, parent.span_id if parent else None, attributes)
+        return span if trace.add(span) else None
+
+    def get(self, run_id: str) -> Optional[Trace]:
+        with self._lock:
+            return self._traces.get(run_id)
+
+    @staticmethod
+    def to_otlp(trace: Trace) -> Dict[str, Any]:
+        """OTLP/JSON (ExportTraceServiceRequest) representation of a trace."""
+        def attr(key, value):
+            if isinstance(value, bool):
+                return {"key": key, "value": {"boolValue": value}}
+            if isinstance(value, int):
+                return {"key": key, "value": {"intValue": str(value)}}
+            if isinstance(value, float):
+                return {"key": key, "value": {"doubleValue": value}}
+            return {"key": key, "value": {"stringValue": str(value)}}
+
+        spans = []
+        for s in list(trace.spans):
+            attributes = [attr(k, v) for k, v in s.attributes.items()] + [attr("studio.kind", s.kind)]
+            item = {
+                "traceId": trace.trace_id,
+                "spanId": s.span_id,
+                "name": s.name,
+                "kind": 3 if s.kind in ("llm", "embedding", "http") else 1,
+                "startTimeUnixNano": str(s.start_ns),
+                "endTimeUnixNano": str(s.end_ns or time.time_ns()),
+                "attributes": attributes,
+                "status": {"code": 2, "message": s.error} if s.status == "error" else {"code": 1},
+            }
+            if s.parent_id:
+                item["parentSpanId"] = s.parent_id
+            spans.append(item)
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [attr("service.name", "studio-engine"), attr("studio.run_id", trace.run_id)]},
+                "scopeSpans": [{"scope": {"name": "app.core.tracing"}, "spans": spans}],
+            }]
+        }
+
+    @staticmethod
+    def to_folded(trace: Trace) -> str:
+        """Folded stacks ("run;node:x;llm:y <self-time µs>") for flamegraph.pl / speedscope."""
+        spans = list(trace.spans)
+        by_id = {s.span_id: s for s in spans}
+        child_time: Dict[str, int] = {}
+        for s in spans:
+            if s.parent_id in by_id:
+                child_time[s.parent_id] = child_time.get(s.parent_id, 0) + s.duration_ns
+
+        totals: "OrderedDict[str, int]" = OrderedDict()
+        for s in spans:
+            frames = []
+            node: Optional[Span] = s
+            while node is not None:
+                frames.append(node.name.replace(";", ":").replace(" ", "_"))
+                node = by_id.get(node.parent_id)
+            stack = ";".join(reversed(frames))
+            self_us = max(0, s.duration_ns - child_time.get(s.span_id, 0)) // 1000
+            totals[stack] = totals.get(stack, 0) + self_us
+        return "\n".join(f"{stack} {us}" for stack, us in totals.items() if us > 0) + "\n"
+
+
+tracer = Tracer(
+    max_traces=int(os.getenv("TRACE_BUFFER_SIZE", "200")),
+    max_spans=int(os.getenv("TRACE_MAX_SPANS", "5000")),
+)
+
+
+def get_tracer() -> Tracer:
+    return tracer
+
+
+_tracing_callback = None
+
+
+def get_tracing_callback():
+    """LangChain callback handler creating `llm` child spans (None if LangChain is missing)."""
+    global _tracing_callback
+    if _tracing_callback is not None:
+        return _tracing_callback
+    try:
+        from langchain_core.callbacks import BaseCallbackHandler
+    except ImportError:
+        return None
+
+    class TracingCallback(BaseCallbackHandler):
+        run_inline = True
+
+        def __init__(self):
+            self._spans: Dict[Any, Span] = {}
+
+        def _start(self, serialized, run_id, **kwargs):
+            name = (serialized or {}).get("name") or ((serialized or {}).get("id") or ["llm"])[-1]
+            span = tracer.start_span(f"llm:{name}", kind="llm")
+            if span is not None:
+                self._spans[run_id] = span
+
+        def on_llm_start(self, serialized, prompts, *, run_id, **kwargs):
+            self._start(serialized, run_id)
+
+        def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+            self._start(serialized, run_id)
+
+        def on_llm_end(self, response, *, run_id, **kwargs):
+            span = self._spans.pop(run_id, None)
+            if span is not None:
+                span.finish()
+
+        def on_llm_error(self, error, *, run_id, **kwargs):
+            span = self._spans.pop(run_id, None)
+            if span is not None:
+                span.finish(error)
+
+    _tracing_callback = TracingCallback()
+    return _tracing_callback
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Dict, Any, Optional
 
 class NodeData(BaseModel):
@@ -37,8 +37,69 @@ class WorkflowGraph(BaseModel):
     class Config:
         extra = "allow"
 
+# NodeData field defaults; list defaults are factories so nodes never share a list
+_NODE_DATA_DEFAULTS: Dict[str, Any] = {
+    "id": "unknown",
+    "label": "Node",
+    "description": None,
+    "color": None,
+    "inputs": list,
+    "outputs": list,
+    "fields": list,
+}
+
+def validate_graph(graph: Any) -> Dict[str, Any]:
+    """
+    Structural checks equivalent to WorkflowGraph, done in place.
+    The engine consumes plain dicts, so validating into models and dumping
+    them back would copy every node of a large graph twice per run.
+    """
+    if not isinstance(graph, dict):
+        raise ValueError("graph must be an object")
+    nodes, edges = graph.get("nodes"), graph.get("edges")
+    if not isinstance(nodes, list) or not isinstance(edges, list):
+        raise ValueError("graph needs 'nodes' and 'edges' lists")
+    for i, node in enumerate(nodes):
+        if not isinstance(node, dict) or not isinstance(node.get("id"), str) or not isinstance(node.get("type"), str):
+            raise ValueError(f"nodes[{i}] needs string 'id' and 'type'")
+        if not isinstance(node.get("position"), (dict, type(None))):
+            raise ValueError(f"nodes[{i}].position must be an object")
+        data = node.get("data")
+        if data is None:
+            data = node["data"] = {}
+        elif not isinstance(data, dict):
+            raise ValueError(f"nodes[{i}].data must be an object")
+        # NodeData defaults, so nodes resolve as they did through the model
+        for key, default in _NODE_DATA_DEFAULTS.items():
+            value = data.setdefault(key, default() if callable(default) else default)
+            expected = list if callable(default) else str
+            if value is not None and not isinstance(value, expected):
+                raise ValueError(f"nodes[{i}].data.{key} must be a {'list' if expected is list else 'string'}")
+    for i, edge in enumerate(edges):
+        if not isinstance(edge, dict) or not all(isinstance(edge.get(k), str) for k in ("id", "source", "target")):
+            raise ValueError(f"edges[{i}] needs string 'id', 'source' and 'target'")
+        if not all(isinstance(edge.get(k), (str, type(None))) for k in ("sourceHandle", "targetHandle")):
+            raise ValueError(f"edges[{i}].sourceHandle and targetHandle must be strings")
+    return graph
+
 class ExecutionRequest(BaseModel):
     message: str
-    graph: WorkflowGraph
+    # Plain dict checked by validate_graph (see WorkflowGraph for the shape)
+    graph: Optional[Dict[str, Any]] = None
+    # Id returned by /workflows/compile; replaces `graph` when given
+    plan_id: Optional[str] = None
+    # "sync" runs inside the request; "job" enqueues and returns a run id
+    mode: Optional[str] = "sync"
+    priority: Optional[int] = 0
+    flow_id: Optional[str] = None
+    # Run deadline in seconds (server default RUN_DEADLINE_SECONDS, 0 disables)
+    timeout: Optional[float] = None
+    # Conversation id: memory nodes keep history across runs of the same session only
+    session_id: Optional[str] = None
     class Config:
         extra = "allow"
+
+    @field_validator("graph")
+    @classmethod
+    def _check_graph(cls, graph: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        return validate_graph(graph) if graph is not None else None
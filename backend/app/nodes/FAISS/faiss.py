@@ -2,10 +2,12 @@ from pathlib import Path
 
 from langchain_community.vectorstores import FAISS
 
+from lfx.base.vectorstores.faiss_registry import faiss_index_exists, faiss_indexes, load_faiss, save_faiss
 from lfx.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
 from lfx.helpers.data import docs_to_data
 from lfx.io import BoolInput, HandleInput, IntInput, StrInput
 from lfx.schema.data import Data
+from lfx.services.cache.service import estimate_size
 
 
 class FaissVectorStoreComponent(LCVectorStoreComponent):
@@ -31,7 +33,7 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
         BoolInput(
             name="allow_dangerous_deserialization",
             display_name="Allow Dangerous Deserialization",
-            info="Set to True to allow loading pickle files from untrusted sources. "
+            info="Set to True to allow loading indexes saved in the legacy pickle format. "
             "Only enable this if you trust the source of the data.",
             advanced=True,
             value=True,
@@ -79,16 +81,37 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             else:
                 documents.append(_input)
 
-        faiss = FAISS.from_documents(documents=documents, embedding=self.embedding)
-        faiss.save_local(str(path), self.index_name)
+        faiss = self.build_from_cache(documents)
+        self.persist_vector_store(faiss)
         return faiss
 
+    def persist_vector_store(self, vector_store: FAISS) -> None:
+        path = self.get_persist_directory()
+        path.mkdir(parents=True, exist_ok=True)
+        save_faiss(vector_store, path, self.index_name)
+
+    def vector_store_size(self, vector_store: FAISS) -> int:
+        index = vector_store.index
+        return index.ntotal * index.d * 4 + estimate_size(getattr(vector_store.docstore, "_dict", {}))
+
+    def create_vector_store(self, documents: list, ids: list[str]) -> FAISS:
+        return FAISS.from_documents(documents=documents, embedding=self.embedding, ids=ids)
+
+    def save_vector_store(self, vector_store: FAISS, directory: Path) -> None:
+        save_faiss(vector_store, directory)
+
+    def load_vector_store(self, directory: Path) -> FAISS:
+        return load_faiss(directory, self.embedding)
+
     def search_documents(self) -> list[Data]:
         """Search for documents in the FAISS vector store."""
         path = self.get_persist_directory()
         index_path = path / f"{self.index_name}.faiss"
 
-        if not index_path.exists():
+        if faiss_index_exists(path, self.index_name):
+            # Memory-mapped and shared with the other components reading this index
+            vector_store = faiss_indexes.open(path, self.embedding, self.index_name)
+        elif not index_path.exists():
             vector_store = self.build_vector_store()
         else:
             vector_store = FAISS.load_local(
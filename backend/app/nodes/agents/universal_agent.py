@@ -1,12 +1,21 @@
 import json
+import logging
 from ..base import BaseNode
 from ..registry import register_node
+from ...core.classification_cache import get_classification_cache
+from ...core.history_manager import get_history_manager
+from ...core.agent_cache import get_agent_cache, graph_hash
+from ...core.tool_executor import prepare_parallel_tools
+from ...core.metrics import get_token_usage_callback
+from ...core.tracing import get_tracer, get_tracing_callback
 from typing import Any, Dict, Optional, List
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_classic.memory import ConversationBufferMemory
 
+logger = logging.getLogger(__name__)
+
 @register_node("universalAgent")
 class UniversalAgentNode(BaseNode):
     """
@@ -22,6 +31,23 @@ class UniversalAgentNode(BaseNode):
         precursor_ids = [e["source"] for e in edges if e["target"] == node_id]
         return [n for n in nodes if n["id"] in precursor_ids]
 
+    async def _prepare_history(self, context: Dict[str, Any], memory_obj: Any, llm: Any) -> List[Any]:
+        """Loads chat history (memory first, then context) and fits it to the agent's token budget."""
+        history = context.get("chat_history", [])
+        session_id = context.get("session_id")
+        if memory_obj is not None:
+            # Async API: Redis-backed histories do their I/O off the event loop
+            loaded = (await memory_obj.aload_memory_variables({})).get(getattr(memory_obj, "memory_key", "chat_history"))
+            if isinstance(loaded, list):
+                history = loaded
+            session_id = session_id or getattr(getattr(memory_obj, "chat_memory", None), "session_id", None)
+        
+        budget = int(self.config.get("history_token_budget", 3000) or 0)
+        # Without a conversation id the history (and its summary) belongs to this run only
+        return get_history_manager().compact(
+            str(context.get("node_id")), str(session_id or f"run:{context.get('run_id')}"), history, budget, llm=llm
+        )
+
     async def execute(self, input_data: Any, context: Optional[Dict[str, Any]] = None) -> str:
         if not context:
             return "Error: Context required for agent composition."
@@ -37,109 +63,236 @@ class UniversalAgentNode(BaseNode):
                 json.dumps(input_data)
             )
         clean_input = str(input_data)
-            
-        try:
-            from ..factory import NodeFactory
-            factory = NodeFactory()
+        
+        # Routing decisions (result is one of the outgoing targets) can be cached per input.
+        # Off by default: the scope includes the connected nodes (LLM, prompt, memory) and the
+        # conversation, so it only pays off for stateless routers.
+        route_ids = {r.get("target_id") for r in context.get("routes") or []}
+        route_scope = None
+        if route_ids and self.config.get("cache_routing", False):
+            cache = get_classification_cache()
             precursors = await self._get_connected_nodes(context)
+            route_scope = cache.scope_key(
+                "agent_route",
+                context.get("node_id"),
+                self.config,
+                sorted(route_ids),
+                [(n.get("id"), n.get("data")) for n in sorted(precursors, key=lambda n: str(n.get("id")))],
+                context.get("session_id"),
+                context.get("chat_history") or [],
+            )
+            cached = await cache.aget(route_scope, clean_input)
+            if cached in route_ids:
+                return cached
+        
+        result = await self._run_agent(clean_input, context)
+        if route_scope and isinstance(result, str) and result in route_ids:
+            await get_classification_cache().aset(route_scope, clean_input, result)
+        return result
+
+    async def _run_agent(self, clean_input: str, context: Dict[str, Any]) -> str:
+        try:
+            cache_key = None
+            assembled = None
+            if self.config.get("cache_executor", True):
+                ghash = context.get("graph_hash") or graph_hash(context.get("graph_data", {}))
+                cache_key = get_agent_cache().key(ghash, context.get("node_id"), self.config)
+                assembled = get_agent_cache().get(cache_key)
             
-            llm = None
-            tools = []
-            memory_obj = None
-            dynamic_prompt = None
-            
-            # 1. Resolve Dependencies
-            for p_node in precursors:
-                p_type_orig = str(p_node.get("data", {}).get("id") or p_node.get("type"))
-                p_type_check = p_type_orig.lower()
-                
-                # SKIP Flow Control nodes (Engine handles these, not Agent dependencies)
-                if any(x in p_type_check for x in ["router", "conditional", "logic", "flow"]):
-                    continue
-                
-                p_instance = factory.get_node(p_type_orig, p_node.get("data", {}))
-                if not p_instance: continue
-                
-                child_context = {**context, "node_id": p_node["id"]}
-                obj = await p_instance.get_langchain_object(child_context)
-                
-                if not obj:
-                    if hasattr(p_instance, "execute"):
-                        obj = await p_instance.execute(clean_input, child_context)
-                
-                if not obj: continue
-                
-                if isinstance(obj, list) and obj:
-                     if hasattr(obj[0], "run"): tools.extend(obj)
-                     continue
-                
-                if hasattr(obj, "run"): tools.append(obj)
-                elif hasattr(obj, "invoke") and hasattr(obj, "generate"): llm = obj
-                elif hasattr(obj, "save_context"): memory_obj = obj
-                elif isinstance(obj, BaseChatMessageHistory):
-                    memory_obj = ConversationBufferMemory(chat_memory=obj, return_messages=True, memory_key="chat_history", output_key="output")
-                elif isinstance(obj, str): dynamic_prompt = obj
-
-            if not llm:
-                return "Error: No LLM connected."
-
-            agent_pattern = self.config.get("agent_pattern", "standard").lower()
-            system_prompt = dynamic_prompt or self.config.get("system_prompt") or "You are a professional assistant."
+            if assembled is None:
+                with get_tracer().span("agent.setup", kind="internal", node_id=str(context.get("node_id"))):
+                    assembled = await self._assemble(clean_input, context)
+                if isinstance(assembled, str):
+                    return assembled
+                if cache_key and assembled["cacheable"]:
+                    get_agent_cache().set(cache_key, {**assembled, "memory": None})
+                memory_obj = assembled["memory"]
+            else:
+                # Memory belongs to the run's conversation, not to the cached executor
+                memory_obj = await self._resolve_memory(assembled.get("memory_node"), context)
+
+            llm = assembled["llm"]
+            chat_history = await self._prepare_history(context, memory_obj, llm)
+            callbacks = [cb for cb in (get_token_usage_callback(), get_tracing_callback()) if cb]
+            run_config = {"callbacks": callbacks} if callbacks else None
             
             # Tier 1: SIMPLE
-            if agent_pattern == "simple" or not tools:
-                from langchain_core.output_parsers import StrOutputParser
-                lc_prompt = ChatPromptTemplate.from_messages([
-                    ("system", system_prompt),
-                    MessagesPlaceholder(variable_name="chat_history"),
-                    ("human", "{input}")
-                ])
-                chain = lc_prompt | llm | StrOutputParser()
-                return await chain.ainvoke({"input": clean_input, "chat_history": context.get("chat_history", [])})
+            if assembled["kind"] == "chain":
+                output = await assembled["runnable"].ainvoke({"input": clean_input, "chat_history": chat_history}, config=run_config)
+                if memory_obj is not None:
+                    await memory_obj.asave_context({"input": clean_input}, {"output": output})
+                return output
 
             # Tier 2 & 3: TOOL-BASED
             try:
-                if agent_pattern == "planner":
-                    from langchain_classic.agents import create_react_agent, AgentExecutor
-                    react_prompt = None
-                    try:
-                        from langchain import hub
-                        react_prompt = hub.pull("hwchase17/react")
-                    except:
-                        pass
-                    
-                    if not react_prompt:
-                         react_prompt = ChatPromptTemplate.from_template(
-                             "Answer the following questions as best you can. You have access to the following tools:\n\n{tools}\n\n"
-                             "Use the following format:\n\nQuestion: {input}\nThought: you should always think about what to do\n"
-                             "Action: the action to take, one of [{tool_names}]\nAction Input: input to the action\n"
-                             "Observation: result of the action\n... (Thought/Action/Action Input/Observation repeats)\n"
-                             "Thought: I now know the final answer\nFinal Answer: final answer\n\nBegin!\n\nQuestion: {input}\nThought:{agent_scratchpad}"
-                         )
-                    agent = create_react_agent(llm=llm, tools=tools, prompt=react_prompt)
-                else:
-                    from langchain_classic.agents import create_tool_calling_agent, AgentExecutor
-                    lc_prompt = ChatPromptTemplate.from_messages([
-                        ("system", system_prompt),
-                        MessagesPlaceholder(variable_name="chat_history"),
-                        ("human", "{input}"),
-                        MessagesPlaceholder(variable_name="agent_scratchpad"),
-                    ])
-                    agent = create_tool_calling_agent(llm=llm, tools=tools, prompt=lc_prompt)
-
-                executor = AgentExecutor(agent=agent, tools=tools, memory=memory_obj, verbose=True, handle_parsing_errors=True)
-                res = await executor.ainvoke({"input": clean_input, "chat_history": context.get("chat_history", [])})
-                return res.get("output", "No response.")
+                res = await assembled["runnable"].ainvoke({"input": clean_input, "chat_history": chat_history}, config=run_config)
+                output = res.get("output", "No response.")
+                if memory_obj is not None:
+                    await memory_obj.asave_context({"input": clean_input}, {"output": output})
+                return output
 
             except Exception as e:
-                print(f"[Universal Agent] Fallback triggered: {e}")
-                return await llm.ainvoke(clean_input)
+                logger.warning("[Universal Agent] Fallback triggered: %s", e)
+                result = await llm.ainvoke(clean_input)
+                return getattr(result, "content", result)
 
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            logger.exception("[Universal Agent] Execution failed")
             return f"Agent Error: {str(e)}"
 
+    async def _assemble(self, clean_input: str, context: Dict[str, Any]):
+        """
+        Resolves connected LLM/tools/memory/prompt and builds the chain or executor.
+        Returns an error string when no LLM is connected.
+        """
+        from ..factory import NodeFactory
+        factory = NodeFactory()
+        precursors = await self._get_connected_nodes(context)
+        
+        llm = None
+        tools = []
+        memory_obj = None
+        memory_node = None
+        dynamic_prompt = None
+        # Objects produced by execute() may depend on the current input
+        cacheable = True
+        
+        # 1. Resolve Dependencies
+        for p_node in precursors:
+            p_type_orig = str(p_node.get("data", {}).get("id") or p_node.get("type"))
+            p_type_check = p_type_orig.lower()
+            
+            # SKIP Flow Control nodes (Engine handles these, not Agent dependencies)
+            if any(x in p_type_check for x in ["router", "conditional", "logic", "flow"]):
+                continue
+            
+            p_instance = factory.get_node(p_type_orig, p_node.get("data", {}))
+            if not p_instance: continue
+            
+            child_context = {**context, "node_id": p_node["id"]}
+            obj = await p_instance.get_langchain_object(child_context)
+            
+            if not obj:
+                if hasattr(p_instance, "execute"):
+                    obj = await p_instance.execute(clean_input, child_context)
+                    cacheable = False
+            
+            if not obj: continue
+            
+            if isinstance(obj, list) and obj:
+                 if hasattr(obj[0], "run"): tools.extend(obj)
+                 continue
+            
+            if hasattr(obj, "run"): tools.append(obj)
+            elif hasattr(obj, "invoke") and hasattr(obj, "generate"): llm = obj
+            elif hasattr(obj, "save_context") or isinstance(obj, BaseChatMessageHistory):
+                memory_obj, memory_node = _as_memory(obj), p_node
+            elif isinstance(obj, str): dynamic_prompt = obj
+
+        if not llm:
+            return "Error: No LLM connected."
+
+        agent_pattern = self.config.get("agent_pattern", "standard").lower()
+        system_prompt = dynamic_prompt or self.config.get("system_prompt") or "You are a professional assistant."
+        assembled = {"llm": llm, "tools": tools, "memory": memory_obj, "memory_node": memory_node, "cacheable": cacheable}
+        
+        # Tier 1: SIMPLE
+        if agent_pattern == "simple" or not tools:
+            from langchain_core.output_parsers import StrOutputParser
+            lc_prompt = ChatPromptTemplate.from_messages([
+                ("system", system_prompt),
+                MessagesPlaceholder(variable_name="chat_history"),
+                ("human", "{input}")
+            ])
+            return {**assembled, "kind": "chain", "runnable": lc_prompt | llm | StrOutputParser()}
+
+        # Tier 2 & 3: TOOL-BASED
+        # Tool calls of one model step run concurrently; sync tools go to a bounded pool with timeouts
+        if self.config.get("parallel_tools", True):
+            tools = prepare_parallel_tools(
+                tools,
+                default_timeout=self.config.get("tool_timeout", 30),
+                timeouts=self.config.get("tool_timeouts") or {},
+            )
+            assembled["tools"] = tools
+        
+        try:
+            if agent_pattern == "planner":
+                from langchain_classic.agents import create_react_agent, AgentExecutor
+                agent = create_react_agent(llm=llm, tools=tools, prompt=_get_react_prompt())
+            else:
+                from langchain_classic.agents import create_tool_calling_agent, AgentExecutor
+                lc_prompt = ChatPromptTemplate.from_messages([
+                    ("system", system_prompt),
+                    MessagesPlaceholder(variable_name="chat_history"),
+                    ("human", "{input}"),
+                    MessagesPlaceholder(variable_name="agent_scratchpad"),
+                ])
+                agent = create_tool_calling_agent(llm=llm, tools=tools, prompt=lc_prompt)
+
+            # Memory is saved explicitly: letting the executor load it would bypass the token budget
+            executor = AgentExecutor(agent=agent, tools=tools, verbose=True, handle_parsing_errors=True)
+            return {**assembled, "kind": "executor", "runnable": executor}
+
+        except Exception as e:
+            logger.warning("[Universal Agent] Fallback triggered: %s", e)
+            return {**assembled, "kind": "chain", "cacheable": False, "runnable": _FallbackRunnable(llm)}
+
+
+    async def _resolve_memory(self, memory_node: Optional[Dict[str, Any]], context: Dict[str, Any]) -> Any:
+        """Builds the connected memory node's memory for the current run."""
+        if memory_node is None:
+            return None
+        from ..factory import NodeFactory
+        p_instance = NodeFactory().get_node(str(memory_node.get("data", {}).get("id") or memory_node.get("type")), memory_node.get("data", {}))
+        if not p_instance:
+            return None
+        return _as_memory(await p_instance.get_langchain_object({**context, "node_id": memory_node["id"]}))
+
+
+def _as_memory(obj: Any) -> Any:
+    """Wraps a bare chat history in a buffer memory."""
+    if isinstance(obj, BaseChatMessageHistory):
+        return ConversationBufferMemory(chat_memory=obj, return_messages=True, memory_key="chat_history", output_key="output")
+    return obj
+
+
+class _FallbackRunnable:
+    """Plain LLM call used when the tool agent cannot be built."""
+
+    def __init__(self, llm: Any):
+        self.llm = llm
+
+    async def ainvoke(self, inputs: Dict[str, Any], config: Optional[Dict[str, Any]] = None) -> str:
+        # A str, like the chain it stands in for: memory's save_context rejects message objects
+        result = await self.llm.ainvoke(inputs["input"], config=config)
+        return getattr(result, "content", result)
+
+
+_react_prompt = None
+
+
+def _get_react_prompt():
+    """Pulls the ReAct prompt from the hub once per process (local template if offline)."""
+    global _react_prompt
+    if _react_prompt is not None:
+        return _react_prompt
+    try:
+        from langchain import hub
+        _react_prompt = hub.pull("hwchase17/react")
+    except:
+        pass
+    
+    if not _react_prompt:
+         _react_prompt = ChatPromptTemplate.from_template(
+             "Answer the following questions as best you can. You have access to the following tools:\n\n{tools}\n\n"
+             "Use the following format:\n\nQuestion: {input}\nThought: you should always think about what to do\n"
+             "Action: the action to take, one of [{tool_names}]\nAction Input: input to the action\n"
+             "Observation: result of the action\n... (Thought/Action/Action Input/Observation repeats)\n"
+             "Thought: I now know the final answer\nFinal Answer: final answer\n\nBegin!\n\nQuestion: {input}\nThought:{agent_scratchpad}"
+         )
+    return _react_prompt
+
 # Register legacy IDs
 from ..registry import NodeRegistry
 NodeRegistry.bulk_register([
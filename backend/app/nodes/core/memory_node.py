@@ -7,53 +7,74 @@ class MemoryNode(BaseNode):
     """
     LangChain Memory Node with configurable storage backends.
     Supports: In-Memory, Redis, Windowed Memory, and more.
+
+    The memory is built per run from the run context: in-memory and windowed
+    histories only outlive the run when the run carries a conversation id
+    (`session_id` in the run context), and are then kept per conversation.
     """
-    
-    def __init__(self, config: Dict[str, Any]):
-        super().__init__(config)
-        self.memory = self._build_memory()
 
-    def _build_memory(self):
+    def _build_memory(self, context: Optional[Dict[str, Any]] = None):
         """Build the appropriate memory backend based on configuration."""
         backend = self.config.get("backend", "in_memory")
         
         if backend == "redis":
-            return self._build_redis_memory()
+            return self._build_redis_memory(context)
         elif backend == "windowed":
-            return self._build_windowed_memory()
+            return self._build_windowed_memory(context)
         else:  # "in_memory" or default
-            return self._build_buffer_memory()
+            return self._build_buffer_memory(context)
+
+    def _conversation_id(self, context: Optional[Dict[str, Any]]) -> Optional[str]:
+        """History key of the run's conversation (scoped by the configured session_id); None without one."""
+        conversation = (context or {}).get("session_id")
+        if not conversation:
+            return None
+        configured = self.config.get("session_id")
+        return f"{configured}:{conversation}" if configured else str(conversation)
+
+    def _shared_history(self, context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """chat_memory kwarg: the conversation's shared history, or nothing (run-local history)."""
+        conversation_id = self._conversation_id(context)
+        if conversation_id is None:
+            return {}
+        from ...core.shared_state import get_shared_state
+        return {"chat_memory": get_shared_state().chat_history(conversation_id)}
 
-    def _build_buffer_memory(self):
-        """Standard in-memory conversation buffer."""
+    def _build_buffer_memory(self, context: Optional[Dict[str, Any]] = None):
+        """Conversation buffer, shared across runs (and workers) of the same conversation."""
         from langchain_classic.memory import ConversationBufferMemory
         return ConversationBufferMemory(
             memory_key="chat_history",
-            return_messages=True
+            return_messages=True,
+            output_key="output",
+            **self._shared_history(context)
         )
 
-    def _build_windowed_memory(self):
+    def _build_windowed_memory(self, context: Optional[Dict[str, Any]] = None):
         """Windowed memory that keeps only the last N messages."""
         from langchain_classic.memory import ConversationBufferWindowMemory
         k = int(self.config.get("window_size", 10))
         return ConversationBufferWindowMemory(
             memory_key="chat_history",
             return_messages=True,
-            k=k
+            output_key="output",
+            k=k,
+            **self._shared_history(context)
         )
 
-    def _build_redis_memory(self):
-        """Redis-backed persistent memory."""
+    def _build_redis_memory(self, context: Optional[Dict[str, Any]] = None):
+        """Redis-backed persistent memory (pooled client, pipelined writes)."""
         from langchain_classic.memory import ConversationBufferMemory
-        from langchain_community.chat_message_histories import RedisChatMessageHistory
+        from ...core.session_store import RedisSessionChatHistory
         
         redis_url = self.config.get("redis_url", "redis://localhost:6379/0")
-        session_id = self.config.get("session_id", "default_session")
         ttl = self.config.get("ttl")  # Optional: time-to-live in seconds
         
-        message_history = RedisChatMessageHistory(
-            url=redis_url,
+        # Without a conversation id, the configured session_id is the (persistent) key, as before
+        session_id = self._conversation_id(context) or str(self.config.get("session_id") or "default_session")
+        message_history = RedisSessionChatHistory(
             session_id=session_id,
+            url=redis_url,
             ttl=ttl
         )
         
@@ -67,7 +88,8 @@ class MemoryNode(BaseNode):
     async def execute(self, input_data: Any, context: Optional[Dict[str, Any]] = None) -> str:
         """Returns the current history as a string."""
         try:
-            history = self.memory.load_memory_variables({}).get("chat_history", [])
+            memory = self._build_memory(context)
+            history = (await memory.aload_memory_variables({})).get("chat_history", [])
             if not history:
                 return "No conversation history yet."
             
@@ -82,4 +104,4 @@ class MemoryNode(BaseNode):
 
     async def get_langchain_object(self, context: Optional[Dict[str, Any]] = None) -> Any:
         """Provide the memory object for Agent nodes."""
-        return self.memory
+        return self._build_memory(context)
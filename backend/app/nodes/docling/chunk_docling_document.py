@@ -1,3 +1,4 @@
+import logging
 import json
 
 import tiktoken
@@ -9,6 +10,8 @@ from lfx.custom import Component
 from lfx.io import DropdownInput, HandleInput, IntInput, MessageTextInput, Output, StrInput
 from lfx.schema import Data, DataFrame
 
+logger = logging.getLogger(__name__)
+
 
 class ChunkDoclingDocumentComponent(Component):
     display_name: str = "Chunk DoclingDocument"
@@ -166,7 +169,7 @@ class ChunkDoclingDocumentComponent(Component):
 
         results: list[Data] = []
         try:
-            print(f"📄 Chunking {len(documents)} document(s) with {self.chunker}")
+            logger.debug("📄 Chunking %s document(s) with %s", len(documents), self.chunker)
             for doc in documents:
                 chunk_count = 0
                 for chunk in chunker.chunk(dl_doc=doc):
@@ -183,11 +186,11 @@ class ChunkDoclingDocumentComponent(Component):
                         )
                     )
                     chunk_count += 1
-                print(f"✅ Generated {chunk_count} chunks from document {doc.origin.binary_hash[:8]}...")
+                logger.debug("✅ Generated %s chunks from document %s...", chunk_count, doc.origin.binary_hash[:8])
 
         except Exception as e:
             msg = f"Error splitting text: {e}"
-            print(f"❌ {msg}")
+            logger.error("❌ %s", msg)
             raise TypeError(msg) from e
 
         return DataFrame(results)
@@ -1,9 +1,12 @@
 import importlib
+import logging
 import os
 import sys
-from typing import Any, Dict, Optional, Type
+from typing import Any, Dict, Optional, Tuple, Type
 from .base import BaseNode
 
+logger = logging.getLogger(__name__)
+
 # Ensure the backend directory is in path for dynamic imports
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
 if project_root not in sys.path:
@@ -117,104 +120,162 @@ NODE_MAP = {
 
 from .registry import NodeRegistry
 
+_library_index: Dict[str, Any] = {"mtime": None, "nodes": {}}
+# node_type -> (class, how it was resolved) for legacy-map and library resolutions;
+# cleared whenever node_library.json changes
+_resolved: Dict[str, Tuple[Optional[Type[BaseNode]], str]] = {}
+
+
+def _refresh_library() -> None:
+    """Re-indexes node_library.json when the file changed since the last index."""
+    lib_path = os.path.join(project_root, "backend", "data", "node_library.json")
+    mtime = os.path.getmtime(lib_path) if os.path.exists(lib_path) else None
+    if _library_index["mtime"] == mtime:
+        return
+    nodes = {}
+    if mtime is not None:
+        import json
+        with open(lib_path, "r", encoding="utf-8") as f:
+            library = json.load(f)
+        for cat_nodes in library.values():
+            for n in cat_nodes:
+                nodes.setdefault(n["id"], n)
+    _library_index.update(mtime=mtime, nodes=nodes)
+    _resolved.clear()
+
+
+def _library_node(node_type: str) -> Optional[Dict[str, Any]]:
+    """Looks a node up in node_library.json, re-indexing only when the file changes."""
+    _refresh_library()
+    return _library_index["nodes"].get(node_type)
+
+
+def _auto_route(node_info: Dict[str, Any]) -> Optional[Type[BaseNode]]:
+    """Category/ID based routing of library nodes that have no dedicated class."""
+    category = node_info.get("category", "")
+    node_id = node_info.get("id", "")
+
+    # Routing Logic based on Category or ID patterns
+    # 1. Models, Embeddings & Agents
+    if category in ["Models & AI Providers", "Aiml", "Assemblyai", "Twelvelabs", "AI Services & Agents"] or any(x in node_id.lower() for x in ["openai_", "anthropic_", "google_", "embedding", "transcription", "agent"]):
+        from .models.litellm.litellm_node import LiteLLMNode
+        return LiteLLMNode
+
+    # 2. API Integrations & Tools
+    if category in ["CRM Systems", "ERP & Accounting", "Productivity", "Dev Tools", "Search & Scraping", "Tools & Utilities", "Cloudflare", "Wolframalpha", "IoT & Home", "Prototypes", "Tools & Analytics"] or "composio" in node_id.lower() or "integration" in node_id.lower():
+        from .integrations.universal_api_node import UniversalAPIConnectorNode
+        return UniversalAPIConnectorNode
+
+    # 3. Vector Stores & Databases
+    if category in ["Vector Stores & Databases", "Data Sources", "Data & Knowledge"]:
+        if "memory" in node_id.lower():
+            from .core.memory_node import MemoryNode
+            return MemoryNode
+        if "supabase" in node_id.lower() or "vector" in node_id.lower():
+            from .storage.supabase.supabase_node import SupabaseStoreNode
+            return SupabaseStoreNode
+        from .storage.nocodb.nocodb_node import SmartDBNode
+        return SmartDBNode
+
+    # 4. Data Processing
+    if category == "Data Processing" or "formatter" in node_id.lower() or "parser" in node_id.lower():
+        if "extractor" in node_id.lower() or "classifier" in node_id.lower() or "matcher" in node_id.lower():
+            from .processing.ai_extractor import AIExtractorNode
+            return AIExtractorNode
+
+    # 5. Logic & Flow
+    if category == "Logic & Flow" or category == "Input / Output":
+        from .generic_node import GenericNode
+        return GenericNode
+    return None
+
+
 class NodeFactory:
     def __init__(self):
         # Trigger an initial scan when factory is created
         NodeRegistry.scan_and_register()
 
     @staticmethod
-    def get_node(node_type: str, config: Dict[str, Any]) -> Optional[BaseNode]:
+    def resolve_node_class(node_type: str) -> Tuple[Optional[Type[BaseNode]], str]:
+        """
+        Resolves a node type to its class without instantiating it.
+        Returns (class, source) where source is "registry", "legacy_map",
+        "auto" (library auto-routing), "generic" (GenericNode fallback for
+        unknown types) or "unavailable" (GenericNode fallback because the
+        node's module failed to import).
+        Legacy-map and library resolutions are cached per node type until
+        node_library.json changes; GenericNode fallbacks are not cached, so a
+        node added to the library or a module that imports later is picked up.
+        """
         # 1. Try Digital Registry (Dynamic Discovery)
         node_class = NodeRegistry.get_node_class(node_type)
-        
-        # 2. Fallback to Legacy Map
-        if not node_class:
-            node_path = NODE_MAP.get(node_type)
-            if node_path:
-                try:
-                    module_path, class_name = node_path.rsplit(".", 1)
-                    module = importlib.import_module(module_path)
-                    node_class = getattr(module, class_name)
-                    print(f"[NodeFactory]: Loaded '{node_type}' from Legacy Map. Please move to Registry.")
-                except Exception as e:
-                    print(f"NodeFactory Error: Failed to load mapped node '{node_type}': {e}")
-
-        # 3. Instantiate if found
         if node_class:
+            return node_class, "registry"
+        try:
+            _refresh_library()
+        except Exception as e:
+            logger.error("NodeFactory Error: Failed to index node library: %s", e)
+        cached = _resolved.get(node_type)
+        if cached is not None:
+            return cached
+
+        load_failed = False
+
+        # 2. Fallback to Legacy Map
+        node_path = NODE_MAP.get(node_type)
+        if node_path:
             try:
-                return node_class(config=config)
+                module_path, class_name = node_path.rsplit(".", 1)
+                module = importlib.import_module(module_path)
+                node_class = getattr(module, class_name)
+                source = "legacy_map"
+                logger.debug("[NodeFactory]: Loaded '%s' from Legacy Map. Please move to Registry.", node_type)
             except Exception as e:
-                print(f"NodeFactory Error: Failed to instantiate {node_type}: {e}")
+                load_failed = True
+                logger.error("NodeFactory Error: Failed to load mapped node '%s': %s", node_type, e)
 
-        # 4. Smart Auto-Discovery from Library
-        try:
-            lib_path = os.path.join(project_root, "backend", "data", "node_library.json")
-            if os.path.exists(lib_path):
-                import json
-                with open(lib_path, "r", encoding="utf-8") as f:
-                    library = json.load(f)
-                
-                # Find node info in library
-                node_info = None
-                for cat_nodes in library.values():
-                    found = next((n for n in cat_nodes if n["id"] == node_type), None)
-                    if found:
-                        node_info = found
-                        break
-                
+        # 3. Smart Auto-Discovery from Library
+        if not node_class:
+            try:
+                node_info = _library_node(node_type)
                 if node_info:
-                    category = node_info.get("category", "")
-                    node_id = node_info.get("id", "")
-                    
-                    # Routing Logic based on Category or ID patterns
-                    # 1. Models, Embeddings & Agents
-                    if category in ["Models & AI Providers", "Aiml", "Assemblyai", "Twelvelabs", "AI Services & Agents"] or any(x in node_id.lower() for x in ["openai_", "anthropic_", "google_", "embedding", "transcription", "agent"]):
-                        from .models.litellm.litellm_node import LiteLLMNode
-                        print(f"[NodeFactory]: Auto-routing '{node_id}' ({category}) to LiteLLMNode")
-                        return LiteLLMNode(config=config)
-                    
-                    # 2. API Integrations & Tools
-                    if category in ["CRM Systems", "ERP & Accounting", "Productivity", "Dev Tools", "Search & Scraping", "Tools & Utilities", "Cloudflare", "Wolframalpha", "IoT & Home", "Prototypes", "Tools & Analytics"] or "composio" in node_id.lower() or "integration" in node_id.lower():
-                        from .integrations.universal_api_node import UniversalAPIConnectorNode
-                        print(f"[NodeFactory]: Auto-routing '{node_id}' ({category}) to UniversalAPIConnectorNode")
-                        return UniversalAPIConnectorNode(config=config)
-
-                    # 3. Vector Stores & Databases
-                    if category in ["Vector Stores & Databases", "Data Sources", "Data & Knowledge"]:
-                        if "memory" in node_id.lower():
-                            from .core.memory_node import MemoryNode
-                            print(f"[NodeFactory]: Auto-routing '{node_id}' to MemoryNode")
-                            return MemoryNode(config=config)
-                            
-                        if "supabase" in node_id.lower() or "vector" in node_id.lower():
-                            from .storage.supabase.supabase_node import SupabaseStoreNode
-                            print(f"[NodeFactory]: Auto-routing '{node_id}' to SupabaseStoreNode")
-                            return SupabaseStoreNode(config=config)
-                        else:
-                            from .storage.nocodb.nocodb_node import SmartDBNode
-                            print(f"[NodeFactory]: Auto-routing '{node_id}' to SmartDBNode")
-                            return SmartDBNode(config=config)
-                            
-                    # 4. Data Processing
-                    if category == "Data Processing" or "formatter" in node_id.lower() or "parser" in node_id.lower():
-                        if "extractor" in node_id.lower() or "classifier" in node_id.lower() or "matcher" in node_id.lower():
-                            from .processing.ai_extractor import AIExtractorNode
-                            print(f"[NodeFactory]: Auto-routing '{node_id}' to AIExtractorNode")
-                            return AIExtractorNode(config=config)
-                        
-                    # 5. Logic & Flow
-                    if category == "Logic & Flow" or category == "Input / Output":
-                         from .generic_node import GenericNode
-                         return GenericNode(node_type=node_type, config=config)
+                    node_class = _auto_route(node_info)
+                    source = "auto"
+                    if node_class:
+                        logger.debug("[NodeFactory]: Auto-routing '%s' (%s) to %s", node_type, node_info.get("category", ""), node_class.__name__)
+            except Exception as e:
+                load_failed = True
+                logger.error("NodeFactory Auto-Discovery Error: %s", e)
 
+        # 4. Final Fallback to GenericNode
+        if not node_class:
+            try:
+                from .generic_node import GenericNode
+                node_class, source = GenericNode, "unavailable" if load_failed else "generic"
+                logger.warning("[NodeFactory]: Node '%s' not found in registry or auto-routing. Falling back to GenericNode.", node_type)
+            except Exception as e:
+                logger.error("NodeFactory Generic Fallback Error: %s", e)
+                return None, "generic"
+
+        if source in ("legacy_map", "auto"):
+            _resolved[node_type] = (node_class, source)
+        return node_class, source
+
+    @staticmethod
+    def get_node(node_type: str, config: Dict[str, Any]) -> Optional[BaseNode]:
+        node_class, source = NodeFactory.resolve_node_class(node_type)
+        if not node_class:
+            return None
+        try:
+            if node_class.__name__ == "GenericNode":
+                return node_class(node_type=node_type, config=config)
+            return node_class(config=config)
         except Exception as e:
-            print(f"NodeFactory Auto-Discovery Error: {e}")
+            logger.error("NodeFactory Error: Failed to instantiate %s: %s", node_type, e)
 
-        # 5. Final Fallback to GenericNode
         try:
             from .generic_node import GenericNode
-            print(f"[NodeFactory]: Node '{node_type}' not found in registry or auto-routing. Falling back to GenericNode.")
             return GenericNode(node_type=node_type, config=config)
         except Exception as e:
-             print(f"NodeFactory Generic Fallback Error: {e}")
-             return None
+            logger.error("NodeFactory Generic Fallback Error: %s", e)
+            return None
@@ -1,9 +1,12 @@
+import logging
 import re
 
 from lfx.custom.custom_component.component import Component
 from lfx.io import BoolInput, DropdownInput, IntInput, MessageInput, MessageTextInput, Output
 from lfx.schema.message import Message
 
+logger = logging.getLogger(__name__)
+
 
 class ConditionalRouterComponent(Component):
     display_name = "If-Else"
@@ -196,8 +199,6 @@ class ConditionalRouterComponent(Component):
         return Message(content="")
 
     def evaluate_condition(self, input_text: str, match_text: str, operator: str, *, case_sensitive: bool) -> bool:
-        print(f"\n[ROUTER DEBUG] Evaluating Condition:")
-        print(f"  > Input Raw: '{input_text}' (Type: {type(input_text)})")
         
         # Handle dictionary input hack if needed
         if isinstance(input_text, dict):
@@ -207,10 +208,6 @@ class ConditionalRouterComponent(Component):
         input_text = str(input_text)
         match_text = str(match_text)
         
-        print(f"  > Input Final: '{input_text}'")
-        print(f"  > Match Text: '{match_text}'")
-        print(f"  > Operator: {operator}")
-        
         if not case_sensitive and operator != "regex":
             input_text = input_text.strip().lower()
             match_text = match_text.strip().lower()
@@ -250,7 +247,7 @@ class ConditionalRouterComponent(Component):
             except ValueError:
                 result = False
                 
-        print(f"  > Result: {result}\n")
+        logger.debug("[ROUTER] %r %s %r -> %s", input_text[:200], operator, match_text[:200], result, extra={"sample_every": 100})
         return result
     def update_build_config(self, build_config: dict, field_value: str, field_name: str | None = None) -> dict:
         if field_name == "operator":
@@ -61,9 +61,10 @@ class LoopComponent(Component):
         return convert_to_data(message, auto_parse=False)
 
     def _validate_data(self, data):
-        """Validate and return a list of Data objects. Message objects are auto-converted to Data."""
+        """Validate and return a list (or row view) of Data objects. Message objects are auto-converted to Data."""
         if isinstance(data, DataFrame):
-            return data.to_data_list()
+            # Rows become Data objects one at a time, as the loop reaches them
+            return data.to_data_view()
         if isinstance(data, Data):
             return [data]
         if isinstance(data, Message):
@@ -1,6 +1,10 @@
 from typing import Any, Dict, Optional
 from ..base import BaseNode
+from ...core.log import HOT_PATH
 import re
+import logging
+
+logger = logging.getLogger(__name__)
 
 class RouterNode(BaseNode):
     """
@@ -51,7 +55,7 @@ class RouterNode(BaseNode):
             except:
                 result = False
         
-        print(f"[RouterNode] Comparing '{input_text}' {operator} '{match_text}' -> {result}")
+        logger.debug("[RouterNode] Comparing '%s' %s '%s' -> %s", input_text, operator, match_text, result, extra=HOT_PATH)
         
         # Traversal Logic:
         # We need to find the specific target node ID for the 'True' or 'False' branch.
@@ -78,8 +82,8 @@ class RouterNode(BaseNode):
                 break
                 
         if not next_node_id:
-            print(f"[RouterNode] Warning: No target found for handle '{target_handle}'")
+            logger.warning("[RouterNode] Warning: No target found for handle '%s'", target_handle)
             return f"No path found for {target_handle}"
             
-        print(f"[RouterNode] Routing to node: {next_node_id}")
+        logger.debug("[RouterNode] Routing to node: %s", next_node_id, extra=HOT_PATH)
         return next_node_id
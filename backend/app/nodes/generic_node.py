@@ -1,5 +1,9 @@
 from typing import Any, Dict, List, Optional
 from .base import BaseNode
+from ..core.log import HOT_PATH
+import logging
+
+logger = logging.getLogger(__name__)
 
 class GenericNode(BaseNode):
     """
@@ -14,7 +18,7 @@ class GenericNode(BaseNode):
         self.output_types = [out.get("name") for out in config.get("outputs", [])]
 
     async def execute(self, input_data: Any, context: Dict[str, Any] = None) -> Any:
-        print(f"[{self.node_type}] Executing with input: {str(input_data)[:50]}...")
+        logger.debug("[%s] Executing with input: %s...", self.node_type, str(input_data)[:50], extra=HOT_PATH)
         
         # Simulate processing delay
         import asyncio
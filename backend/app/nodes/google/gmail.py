@@ -1,3 +1,4 @@
+import logging
 import base64
 import json
 import re
@@ -10,32 +11,31 @@ from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from langchain_core.chat_sessions import ChatSession
 from langchain_core.messages import HumanMessage
+
+logger = logging.getLogger(__name__)
+
 try:
     from langchain_google_community.gmail.loader import GMailLoader
 except ImportError:
-    print("⚠️ Warning: 'langchain_google_community' not found. Gmail Loader will be disabled, but Gmail Sender (gmailNode) remains available.")
+    logger.warning("⚠️ Warning: 'langchain_google_community' not found. Gmail Loader will be disabled, but Gmail Sender (gmailNode) remains available.")
     GMailLoader = object # Dummy for class definition
 
 try:
     from lfx.custom.custom_component.component import Component
     from lfx.inputs.inputs import MessageTextInput
     from lfx.io import SecretStrInput
-    from lfx.log.logger import logger
+    from lfx.log.logger import logger as lfx_logger
     from lfx.schema.data import Data
     from lfx.template.field.base import Output
     LFX_AVAILABLE = True
 except ImportError as e:
-    print(f"⚠️ Warning: 'lfx' dependencies missing ({e}). Gmail Loader component will be disabled.")
+    logger.warning("⚠️ Warning: 'lfx' dependencies missing (%s). Gmail Loader component will be disabled.", e)
     LFX_AVAILABLE = False
     # Create dummy classes to prevent NameError
     class Component: pass
     def MessageTextInput(**kwargs): return None
     def SecretStrInput(**kwargs): return None
-    class logger:
-        @staticmethod
-        def warning(msg): print(f"LOG: {msg}")
-        @staticmethod
-        def exception(msg): print(f"LOG: {msg}")
+    lfx_logger = logger
     class Data: pass
     def Output(**kwargs): return None
 
@@ -176,7 +176,7 @@ class GmailLoaderComponent(Component):
                 )
                 messages = results.get("messages", [])
                 if not messages:
-                    logger.warning("No messages found with the specified labels.")
+                    lfx_logger.warning("No messages found with the specified labels.")
                 for message in messages:
                     try:
                         yield self._get_message_data(service, message)
@@ -184,7 +184,7 @@ class GmailLoaderComponent(Component):
                         if self.raise_error:
                             raise
                         else:
-                            logger.exception(f"Error processing message {message['id']}")
+                            lfx_logger.exception(f"Error processing message {message['id']}")
 
         json_string = self.json_string
         label_ids = self.label_ids.split(",") if self.label_ids else ["INBOX"]
@@ -239,13 +239,13 @@ class GmailSendMessageNode(BaseNode):
         message = message or self.get_config("message")
         
         if not recipient or not message:
-             print(f"⚠️ GmailNode Blocked: Missing recipient ({recipient}) or message ({message})")
+             logger.warning("⚠️ GmailNode Blocked: Missing recipient (%s) or message (%s)", recipient, message)
              return "Error: Missing recipient or message for Gmail."
 
         # 2. Authentication
         json_string = self.get_config("json_string")
         if not json_string:
-             print("❌ GmailNode Error: 'json_string' (OAuth Token) is missing from config.")
+             logger.error("❌ GmailNode Error: 'json_string' (OAuth Token) is missing from config.")
              return "Error: Gmail credentials (json_string) not configured."
              
         try:
@@ -258,7 +258,7 @@ class GmailSendMessageNode(BaseNode):
             # HELPER: Check if user pasted 'installed' or 'web' from client_secrets.json (wrong format)
             if any(k in token_info for k in ["installed", "web", "client_id"]):
                  if "refresh_token" not in token_info and "token" not in token_info:
-                     print("❌ GmailNode Configuration Error: Detected Client Secrets instead of Token.")
+                     logger.error("❌ GmailNode Configuration Error: Detected Client Secrets instead of Token.")
                      return "Error: You pasted 'credentials.json' (Client Secret). Please provide the Authorized Token JSON (containing 'refresh_token')."
 
             creds = Credentials.from_authorized_user_info(token_info)
@@ -276,14 +276,14 @@ class GmailSendMessageNode(BaseNode):
             create_message = {'raw': encoded_message}
             
             # 4. Send
-            print(f"🚀 GmailNode: Sending email to {recipient}...")
+            logger.debug("🚀 GmailNode: Sending email to %s...", recipient)
             send_resp = service.users().messages().send(userId="me", body=create_message).execute()
             
             return f"✅ Gmail successfully sent to {recipient}. Message ID: {send_resp.get('id')}"
             
         except RefreshError:
-            print("❌ GmailNode Auth Error: Token expired. Please refresh OAuth credentials.")
+            logger.error("❌ GmailNode Auth Error: Token expired. Please refresh OAuth credentials.")
             return "Error: Gmail Authentication expired. Please update 'json_string'."
         except Exception as e:
-            print(f"❌ GmailNode System Error: {e}")
+            logger.error("❌ GmailNode System Error: %s", e)
             return f"Error: Gmail failed - {str(e)}"
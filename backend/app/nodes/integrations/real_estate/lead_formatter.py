@@ -1,8 +1,11 @@
+import logging
 from typing import Any, Dict, Optional
 from ...base import BaseNode
 import re
 import json
 
+logger = logging.getLogger(__name__)
+
 class LeadFormatterNode(BaseNode):
     """
     Formats scraped property data for Smart DB insertion.
@@ -24,7 +27,7 @@ class LeadFormatterNode(BaseNode):
             
             # If markdown is still a dict (from scraper nested output), extract recursively
             if isinstance(markdown, dict):
-                print(f"DEBUG [LeadFormatter]: Markdown input is a dict, extracting content...")
+                logger.debug("DEBUG [LeadFormatter]: Markdown input is a dict, extracting content...")
                 markdown = markdown.get("markdown") or markdown.get("content") or markdown.get("text") or json.dumps(markdown)
         elif isinstance(input_data, str):
             markdown = input_data
@@ -34,7 +37,7 @@ class LeadFormatterNode(BaseNode):
             markdown = ""
         
         if not isinstance(markdown, str):
-            print(f"DEBUG [LeadFormatter]: Markdown is {type(markdown)}, forcing to string.")
+            logger.debug("DEBUG [LeadFormatter]: Markdown is %s, forcing to string.", type(markdown))
             markdown = str(markdown)
             
         if not markdown.strip():
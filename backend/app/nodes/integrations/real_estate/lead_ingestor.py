@@ -1,3 +1,4 @@
+import logging
 from ...base import BaseNode
 from ...registry import register_node
 from typing import Any, Dict, Optional, List
@@ -7,6 +8,8 @@ from langchain_community.vectorstores import SupabaseVectorStore
 from langchain_core.documents import Document
 import json
 
+logger = logging.getLogger(__name__)
+
 @register_node("leadIngestorNode")
 class LeadIngestorNode(BaseNode):
     """
@@ -27,7 +30,7 @@ class LeadIngestorNode(BaseNode):
                 lead_data = input_data
 
             if not lead_data:
-                print("⚠️ Lead Ingestor: No lead data provided.")
+                logger.warning("⚠️ Lead Ingestor: No lead data provided.")
                 return "Error: No lead data provided for ingestion."
 
             # 2. Get Configs (with Env fallbacks)
@@ -65,7 +68,7 @@ class LeadIngestorNode(BaseNode):
             results = {"smartdb": None, "supabase": None}
             
             if nocodb_url and nocodb_key and nocodb_project and nocodb_table:
-                print(f"📡 SmartDB (Dual): Inserting lead into {nocodb_table}...")
+                logger.debug("📡 SmartDB (Dual): Inserting lead into %s...", nocodb_table)
                 headers = {"xc-token": nocodb_key, "Content-Type": "application/json"}
                 endpoint = f"{nocodb_url.rstrip('/')}/api/v1/db/data/noco/{nocodb_project}/{nocodb_table}"
                 
@@ -75,16 +78,16 @@ class LeadIngestorNode(BaseNode):
                 resp = requests.post(endpoint, headers=headers, json=noco_data, timeout=10)
                 if resp.status_code in [200, 201]:
                     results["smartdb"] = "Success"
-                    print("✅ SmartDB: Lead stored successfully.")
+                    logger.debug("✅ SmartDB: Lead stored successfully.")
                 else:
                     results["smartdb"] = f"Failed ({resp.status_code})"
-                    print(f"❌ SmartDB Error: {resp.text}")
+                    logger.error("❌ SmartDB Error: %s", resp.text)
             else:
-                print(f"⚠️ SmartDB Skip: Config missing (url={bool(nocodb_url)}, table={bool(nocodb_table)})")
+                logger.warning("⚠️ SmartDB Skip: Config missing (url=%s, table=%s)", bool(nocodb_url), bool(nocodb_table))
 
             # 5. Step 2: Ingest into Supabase (Vector Store)
             if supabase_url and supabase_key and supabase_table and embedding_model:
-                print(f"📡 Supabase (Dual): Vectorizing and storing lead in {supabase_table}...")
+                logger.debug("📡 Supabase (Dual): Vectorizing and storing lead in %s...", supabase_table)
                 
                 try:
                     # Create text content for embedding
@@ -119,23 +122,23 @@ class LeadIngestorNode(BaseNode):
                     }
 
                     # PERFROM MANUAL INSERT
-                    print(f"🚀 Supabase Manual Insert: Sending to table '{supabase_table}'...")
+                    logger.debug("🚀 Supabase Manual Insert: Sending to table '%s'...", supabase_table)
                     insert_resp = client.table(supabase_table).insert(supabase_payload).execute()
                     
                     results["supabase"] = "Success"
-                    print("✅ Supabase: Lead vectorized and stored successfully.")
+                    logger.debug("✅ Supabase: Lead vectorized and stored successfully.")
                 except Exception as ve:
-                    print(f"❌ Supabase Vector Store Error: {ve}")
+                    logger.error("❌ Supabase Vector Store Error: %s", ve)
                     results["supabase"] = f"Failed ({str(ve)})"
             else:
-                print(f"⚠️ Supabase Skip: url={bool(supabase_url)}, key={bool(supabase_key)}, table={bool(supabase_table)}, model={bool(embedding_model)}")
+                logger.warning("⚠️ Supabase Skip: url=%s, key=%s, table=%s, model=%s", bool(supabase_url), bool(supabase_key), bool(supabase_table), bool(embedding_model))
                 if not embedding_model:
                     results["supabase"] = "Failed (No Embedding Model connected)"
                 else:
                     results["supabase"] = "Failed (Missing Config)"
 
             summary = f"Lead Ingestion Summary:\n- SmartDB: {results['smartdb']}\n- Supabase: {results['supabase']}"
-            print(f"📋 Ingestion Summary: {summary}")
+            logger.debug("📋 Ingestion Summary: %s", summary)
             
             return {
                 "status": summary,
@@ -144,9 +147,7 @@ class LeadIngestorNode(BaseNode):
             }
 
         except Exception as e:
-            print(f"❌ Lead Ingestor Cluster Failure: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Lead Ingestor Cluster Failure: %s", e)
             return {"error": str(e), "status": "failed"}
 
     async def get_langchain_object(self, context: Optional[Dict[str, Any]] = None) -> Any:
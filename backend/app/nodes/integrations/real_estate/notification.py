@@ -1,8 +1,11 @@
+import logging
 from typing import Any, Dict, Optional
 from ...base import BaseNode
 import requests
 import json
 
+logger = logging.getLogger(__name__)
+
 class NotificationNode(BaseNode):
     """
     Sends notifications via WhatsApp, Email, or SMS.
@@ -29,7 +32,7 @@ class NotificationNode(BaseNode):
             channel = self.config.get("channel") or "whatsapp"
         
         if not recipient or not message:
-            print(f"⚠️ Notification Blocked: Missing recipient ({recipient}) or message ({message})")
+            logger.warning("⚠️ Notification Blocked: Missing recipient (%s) or message (%s)", recipient, message)
             return {
                 "status": "failed",
                 "error": "Missing recipient or message"
@@ -62,11 +65,7 @@ class NotificationNode(BaseNode):
         access_token = self.config.get("whatsapp_access_token")
         
         if not phone_number_id or not access_token:
-            print("\n" + "="*50)
-            print("🚀 WHATSAPP DEMO MODE (NOT CONFIGURED)")
-            print(f"TO:      {phone}")
-            print(f"MESSAGE: {message}")
-            print("="*50 + "\n")
+            logger.info("🚀 WHATSAPP DEMO MODE (NOT CONFIGURED) to=%s message=%s", phone, message)
             return {
                 "status": "sent (demo)",
                 "channel": "whatsapp",
@@ -112,7 +111,7 @@ class NotificationNode(BaseNode):
                     "error": f"API returned {response.status_code}: {response.text}"
                 }
         except Exception as e:
-            print(f"❌ Notification WhatsApp Channel Failure: {e}")
+            logger.error("❌ Notification WhatsApp Channel Failure: %s", e)
             return {
                 "status": "failed",
                 "channel": "whatsapp",
@@ -136,13 +135,10 @@ class NotificationNode(BaseNode):
         subject = self.config.get("email_subject", "EasySpace Notification")
         
         if not smtp_user or not smtp_password:
-            print("\n" + "="*50)
-            print("🚀 NOTIFICATION DEMO MODE (SMTP NOT CONFIGURED)")
-            print(f"TO:      {email}")
-            print(f"FROM:    {from_email or 'system@tyboo.ma'}")
-            print(f"SUBJECT: {subject}")
-            print(f"MESSAGE: {message}")
-            print("="*50 + "\n")
+            logger.info(
+                "🚀 NOTIFICATION DEMO MODE (SMTP NOT CONFIGURED) to=%s from=%s subject=%s message=%s",
+                email, from_email or 'system@tyboo.ma', subject, message,
+            )
             
             return {
                 "status": "sent (demo)",
@@ -172,7 +168,7 @@ class NotificationNode(BaseNode):
                 "recipient": email
             }
         except Exception as e:
-            print(f"❌ Notification Email Channel Failure: {e}")
+            logger.error("❌ Notification Email Channel Failure: %s", e)
             return {
                 "status": "failed",
                 "channel": "email",
@@ -189,11 +185,7 @@ class NotificationNode(BaseNode):
         from_phone = self.config.get("twilio_from_phone")
         
         if not account_sid or not auth_token or not from_phone:
-            print("\n" + "="*50)
-            print("🚀 SMS DEMO MODE (TWILIO NOT CONFIGURED)")
-            print(f"TO:      {phone}")
-            print(f"MESSAGE: {message}")
-            print("="*50 + "\n")
+            logger.info("🚀 SMS DEMO MODE (TWILIO NOT CONFIGURED) to=%s message=%s", phone, message)
             return {
                 "status": "sent (demo)",
                 "channel": "sms",
@@ -230,7 +222,7 @@ class NotificationNode(BaseNode):
                     "error": f"Twilio API returned {response.status_code}: {response.text}"
                 }
         except Exception as e:
-            print(f"❌ Notification SMS Channel Failure: {e}")
+            logger.error("❌ Notification SMS Channel Failure: %s", e)
             return {
                 "status": "failed",
                 "channel": "sms",
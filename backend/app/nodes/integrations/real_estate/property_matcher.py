@@ -1,7 +1,10 @@
+import logging
 from typing import Any, Dict, Optional, List
 from ...base import BaseNode
 import json
 
+logger = logging.getLogger(__name__)
+
 class PropertyMatcherNode(BaseNode):
     """
     Searches for matching properties in Smart DB and Supabase.
@@ -86,7 +89,7 @@ class PropertyMatcherNode(BaseNode):
                         elif isinstance(db_result, list):
                             matches.extend(db_result)
                     except Exception as e:
-                        print(f"Smart DB query error: {e}")
+                        logger.error("Smart DB query error: %s", e)
         
         # 2. Query Supabase for semantic search (if configured)
         if context and 'graph_data' in context:
@@ -128,7 +131,7 @@ class PropertyMatcherNode(BaseNode):
                                 # You could parse the results here
                                 pass
                     except Exception as e:
-                        print(f"Supabase search error: {e}")
+                        logger.error("Supabase search error: %s", e)
         
         # 3. Rank and return results
         # Remove duplicates based on URL
@@ -1,7 +1,11 @@
 from ..base import BaseNode
 from ..registry import register_node
+from ...core.tracing import get_tracer
 from typing import Any, Dict, Optional
 import json
+import logging
+
+logger = logging.getLogger(__name__)
 
 @register_node("universal_api_node")
 class UniversalAPIConnectorNode(BaseNode):
@@ -52,7 +56,7 @@ class UniversalAPIConnectorNode(BaseNode):
             if action:
                 payload["action"] = action
 
-            print(f"Universal API (Async): {method} {url}")
+            logger.debug("Universal API (Async): %s %s", method, url)
             
             timeout = aiohttp.ClientTimeout(total=30)
             async with aiohttp.ClientSession(timeout=timeout) as session:
@@ -68,17 +72,19 @@ class UniversalAPIConnectorNode(BaseNode):
                 else:
                     request_kwargs["json"] = payload
                 
-                async with session.request(method, url, **request_kwargs) as resp:
-                    status = resp.status
-                    text_result = await resp.text()
-                    
-                    if status >= 400:
-                        return f"API Error ({status}): {text_result}"
-                    
-                    try:
-                        return await resp.json()
-                    except:
-                        return text_result
+                with get_tracer().span(f"http:{method}", kind="http", url=url.split("?")[0]) as span:
+                    async with session.request(method, url, **request_kwargs) as resp:
+                        status = resp.status
+                        text_result = await resp.text()
+                        if span: span.attributes["http.status_code"] = status
+                        
+                        if status >= 400:
+                            return f"API Error ({status}): {text_result}"
+                        
+                        try:
+                            return await resp.json()
+                        except:
+                            return text_result
 
         except Exception as e:
             return f"Universal API Execution Failed: {str(e)}"
@@ -97,7 +103,7 @@ class UniversalAPIConnectorNode(BaseNode):
                 coroutine=lambda x: self.execute(x, context)
             )
         except Exception as e:
-            print(f"Error creating LangChain Tool for {self.__class__.__name__}: {e}")
+            logger.error("Error creating LangChain Tool for %s: %s", self.__class__.__name__, e)
             return None
 
 # Register common IDs that should use the Universal API Connector
@@ -2,6 +2,9 @@ from typing import Any, Dict, Optional
 from ..base import BaseNode
 from ..registry import register_node
 import os
+import logging
+
+logger = logging.getLogger(__name__)
 
 @register_node("anthropicNode")
 class AnthropicNode(BaseNode):
@@ -36,7 +39,7 @@ class AnthropicNode(BaseNode):
             # Create client
             client = AsyncAnthropic(api_key=api_key)
             
-            print(f"[AnthropicNode] Sending request to {model}...")
+            logger.debug("[AnthropicNode] Sending request to %s...", model)
             
             # Anthropic API structure
             response = await client.messages.create(
@@ -50,11 +53,11 @@ class AnthropicNode(BaseNode):
             )
             
             result = response.content[0].text
-            print(f"[AnthropicNode] Received response: {result[:50]}...")
+            logger.debug("[AnthropicNode] Received response: %s...", result[:50])
             return result
             
         except ImportError:
             return "Error: 'anthropic' package not installed. Please run: pip install anthropic"
         except Exception as e:
-            print(f"[AnthropicNode] Error: {e}")
+            logger.error("[AnthropicNode] Error: %s", e)
             return f"Anthropic Execution Error: {str(e)}"
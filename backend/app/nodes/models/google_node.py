@@ -2,6 +2,9 @@ from typing import Any, Dict, Optional
 from ..base import BaseNode
 from ..registry import register_node
 import os
+import logging
+
+logger = logging.getLogger(__name__)
 
 @register_node("googleNode")
 class GoogleNode(BaseNode):
@@ -40,7 +43,7 @@ class GoogleNode(BaseNode):
                 temperature=temperature
             )
             
-            print(f"[GoogleNode] Sending request to {model_name}...")
+            logger.debug("[GoogleNode] Sending request to %s...", model_name)
             
             # Execute
             response = await model.generate_content_async(
@@ -49,11 +52,11 @@ class GoogleNode(BaseNode):
             )
             
             result = response.text
-            print(f"[GoogleNode] Received response: {result[:50]}...")
+            logger.debug("[GoogleNode] Received response: %s...", result[:50])
             return result
             
         except ImportError:
             return "Error: 'google-generativeai' package not installed. Please run: pip install google-generativeai"
         except Exception as e:
-            print(f"[GoogleNode] Error: {e}")
+            logger.error("[GoogleNode] Error: %s", e)
             return f"Google Execution Error: {str(e)}"
@@ -4,10 +4,16 @@ This component consolidates Web Search, News Search, and RSS Reader into a singl
 component with tabs for different search modes.
 """
 
+import asyncio
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from urllib.parse import parse_qs, quote_plus, unquote, urlparse
 
+import httpx
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
@@ -15,8 +21,63 @@ from bs4 import BeautifulSoup
 from lfx.custom import Component
 from lfx.io import IntInput, MessageTextInput, Output, TabInput
 from lfx.schema import DataFrame
+from lfx.utils.http_client import get_http_client
 from lfx.utils.request_utils import get_user_agent
 
+# Result pages are fetched concurrently, at most this many at a time per host
+MAX_FETCHES_PER_HOST = 4
+# The whole page-fetch stage of one search must finish within this many seconds
+PAGE_FETCH_DEADLINE = 20.0
+# Extracted page text is reused across searches and runs for this long
+PAGE_CACHE_TTL = 15 * 60
+PAGE_CACHE_MAX_ENTRIES = 512
+
+# HTML parsing is CPU-bound, keep it off the event loop
+_parse_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="web-search-parse")
+_page_cache: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+_page_cache_lock = threading.Lock()
+
+
+def _cached_page(url: str) -> str | None:
+    with _page_cache_lock:
+        entry = _page_cache.get(url)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del _page_cache[url]
+            return None
+        _page_cache.move_to_end(url)
+        return entry[1]
+
+
+def _cache_page(url: str, text: str) -> None:
+    with _page_cache_lock:
+        _page_cache[url] = (time.monotonic() + PAGE_CACHE_TTL, text)
+        _page_cache.move_to_end(url)
+        while len(_page_cache) > PAGE_CACHE_MAX_ENTRIES:
+            _page_cache.popitem(last=False)
+
+
+def _page_text(content: bytes) -> str:
+    return BeautifulSoup(content, "lxml").get_text(separator=" ", strip=True)
+
+
+def _parse_results(html: str) -> list[tuple[str, str, str]]:
+    """(title, raw link, snippet) for each DuckDuckGo result."""
+    hits = []
+    for result in BeautifulSoup(html, "html.parser").select("div.result"):
+        title_tag = result.select_one("a.result__a")
+        snippet_tag = result.select_one("a.result__snippet")
+        if title_tag:
+            hits.append(
+                (
+                    title_tag.get_text(strip=True),
+                    title_tag.get("href", ""),
+                    snippet_tag.get_text(strip=True) if snippet_tag else "",
+                )
+            )
+    return hits
+
 
 class WebSearchComponent(Component):
     display_name = "Web Search"
@@ -151,7 +212,51 @@ class WebSearchComponent(Component):
         """Remove HTML tags from text."""
         return BeautifulSoup(html_string, "html.parser").get_text(separator=" ", strip=True)
 
-    def perform_web_search(self) -> DataFrame:
+    async def _fetch_pages(self, urls: list[str], headers: dict[str, str]) -> dict[str, str | Exception]:
+        """Fetch and extract the text of `urls` concurrently.
+
+        Pages come from the TTL cache when possible; the rest share one pooled
+        client, are limited per host and must finish within PAGE_FETCH_DEADLINE.
+        Failed fetches map to their exception.
+        """
+        loop = asyncio.get_running_loop()
+        client = get_http_client()
+        host_limits: dict[str, asyncio.Semaphore] = {}
+
+        async def fetch(url: str) -> str:
+            cached = _cached_page(url)
+            if cached is not None:
+                return cached
+            semaphore = host_limits.setdefault(urlparse(url).netloc, asyncio.Semaphore(MAX_FETCHES_PER_HOST))
+            async with semaphore:
+                page = await client.get(url, headers=headers, timeout=self.timeout, follow_redirects=True)
+                page.raise_for_status()
+            text = await loop.run_in_executor(_parse_pool, _page_text, page.content)
+            _cache_page(url, text)
+            return text
+
+        tasks = {url: asyncio.ensure_future(fetch(url)) for url in dict.fromkeys(urls)}
+        if not tasks:
+            return {}
+        try:
+            _, pending = await asyncio.wait(tasks.values(), timeout=max(PAGE_FETCH_DEADLINE, self.timeout))
+        finally:
+            for task in tasks.values():
+                task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        pages: dict[str, str | Exception] = {}
+        for url, task in tasks.items():
+            if task in pending:
+                pages[url] = TimeoutError("page fetch deadline exceeded")
+            elif task.exception() is not None:
+                # Any failure (HTTP error, invalid URL, decoding...) only fails its page
+                pages[url] = task.exception()
+            else:
+                pages[url] = task.result()
+        return pages
+
+    async def perform_web_search(self) -> DataFrame:
         """Perform DuckDuckGo web search."""
         query = self._sanitize_query(self.query)
         if not query:
@@ -163,9 +268,11 @@ class WebSearchComponent(Component):
         url = "https://html.duckduckgo.com/html/"
 
         try:
-            response = requests.get(url, params=params, headers=headers, timeout=self.timeout)
+            response = await get_http_client().get(
+                url, params=params, headers=headers, timeout=self.timeout, follow_redirects=True
+            )
             response.raise_for_status()
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             self.status = f"Failed request: {e!s}"
             return DataFrame(pd.DataFrame([{"title": "Error", "link": "", "snippet": str(e), "content": ""}]))
 
@@ -175,35 +282,23 @@ class WebSearchComponent(Component):
                 pd.DataFrame([{"title": "Error", "link": "", "snippet": "No results found", "content": ""}])
             )
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        results = []
+        hits = await asyncio.get_running_loop().run_in_executor(_parse_pool, _parse_results, response.text)
+        links = []
+        for _, raw_link, _ in hits:
+            parsed = urlparse(raw_link)
+            uddg = parse_qs(parsed.query).get("uddg", [""])[0]
+            decoded_link = unquote(uddg) if uddg else raw_link
+            links.append((decoded_link, self.ensure_url(decoded_link)))
 
-        for result in soup.select("div.result"):
-            title_tag = result.select_one("a.result__a")
-            snippet_tag = result.select_one("a.result__snippet")
-            if title_tag:
-                raw_link = title_tag.get("href", "")
-                parsed = urlparse(raw_link)
-                uddg = parse_qs(parsed.query).get("uddg", [""])[0]
-                decoded_link = unquote(uddg) if uddg else raw_link
-
-                try:
-                    final_url = self.ensure_url(decoded_link)
-                    page = requests.get(final_url, headers=headers, timeout=self.timeout)
-                    page.raise_for_status()
-                    content = BeautifulSoup(page.text, "lxml").get_text(separator=" ", strip=True)
-                except requests.RequestException as e:
-                    final_url = decoded_link
-                    content = f"(Failed to fetch: {e!s}"
-
-                results.append(
-                    {
-                        "title": title_tag.get_text(strip=True),
-                        "link": final_url,
-                        "snippet": snippet_tag.get_text(strip=True) if snippet_tag else "",
-                        "content": content,
-                    }
-                )
+        pages = await self._fetch_pages([final_url for _, final_url in links], headers)
+
+        results = []
+        for (title, _, snippet), (decoded_link, final_url) in zip(hits, links, strict=True):
+            content = pages[final_url]
+            if isinstance(content, Exception):
+                final_url = decoded_link
+                content = f"(Failed to fetch: {content!s}"
+            results.append({"title": title, "link": final_url, "snippet": snippet, "content": content})
 
         return DataFrame(pd.DataFrame(results))
 
@@ -312,15 +407,15 @@ class WebSearchComponent(Component):
         self.log(f"Fetched {len(df_articles)} articles.")
         return DataFrame(df_articles)
 
-    def perform_search(self) -> DataFrame:
+    async def perform_search(self) -> DataFrame:
         """Main search method that routes to appropriate search function based on mode."""
         search_mode = getattr(self, "search_mode", "Web")
 
         if search_mode == "Web":
-            return self.perform_web_search()
+            return await self.perform_web_search()
         if search_mode == "News":
-            return self.perform_news_search()
+            return await asyncio.to_thread(self.perform_news_search)
         if search_mode == "RSS":
-            return self.perform_rss_read()
+            return await asyncio.to_thread(self.perform_rss_read)
         # Fallback to web search
-        return self.perform_web_search()
+        return await self.perform_web_search()
@@ -1,9 +1,12 @@
+import logging
 import re
 
 from lfx.custom.custom_component.component import Component
 from lfx.io import BoolInput, DropdownInput, IntInput, MessageInput, MessageTextInput, Output
 from lfx.schema.message import Message
 
+logger = logging.getLogger(__name__)
+
 
 class ConditionalRouterComponent(Component):
     display_name = "If-Else"
@@ -93,10 +96,6 @@ class ConditionalRouterComponent(Component):
         self.__iteration_updated = False
 
     def evaluate_condition(self, input_text: str, match_text: str, operator: str, *, case_sensitive: bool) -> bool:
-        print(f"\n[ROUTER DEBUG] Evaluating Router: {self.display_name}")
-        print(f"  > Input Raw: '{input_text}' (Type: {type(input_text)})")
-        print(f"  > Match Raw: '{match_text}'")
-        
         # Handle dictionary input hack if needed
         if isinstance(input_text, dict):
              input_text = input_text.get("intent") or input_text.get("text") or str(input_text)
@@ -108,10 +107,6 @@ class ConditionalRouterComponent(Component):
             input_text = str(input_text).strip()
             match_text = str(match_text).strip()
 
-        print(f"  > Input Final: '{input_text}'")
-        print(f"  > Match Final: '{match_text}'")
-        print(f"  > Operator: {operator}")
-
         result = False
         if operator == "equals":
             result = input_text == match_text
@@ -143,7 +138,7 @@ class ConditionalRouterComponent(Component):
             except ValueError:
                 result = False
         
-        print(f"  > Result: {result}\n")
+        logger.debug("[ROUTER] %r %s %r -> %s", input_text[:200], operator, match_text[:200], result, extra={"sample_every": 100})
         return result
 
     def iterate_and_stop_once(self, route_to_stop: str):
@@ -1,15 +1,24 @@
-import ast
 import json
 from typing import TYPE_CHECKING, Any
 
-import jq
 from json_repair import repair_json
 
+from lfx.base.processing.data_query import (
+    OPERATORS,
+    compile_filter,
+    compile_jq,
+    compile_key_remover,
+    compile_key_renamer,
+    filter_conditions,
+    filter_frame,
+    literal_eval_strings,
+)
 from lfx.custom import Component
 from lfx.inputs import DictInput, DropdownInput, MessageTextInput, SortableListInput
 from lfx.io import DataInput, MultilineInput, Output
 from lfx.log.logger import logger
 from lfx.schema import Data
+from lfx.schema.dataframe import DataFrame
 from lfx.schema.dotdict import dotdict
 from lfx.utils.component_utils import set_current_fields, set_field_display
 
@@ -27,13 +36,6 @@ ACTION_CONFIG = {
     "Path Selection": {"is_list": False, "log_msg": "setting mapped key extractor fields"},
     "JQ Expression": {"is_list": False, "log_msg": "setting parse json fields"},
 }
-OPERATORS = {
-    "equals": lambda a, b: str(a) == str(b),
-    "not equals": lambda a, b: str(a) != str(b),
-    "contains": lambda a, b: str(b) in str(a),
-    "starts with": lambda a, b: str(a).startswith(str(b)),
-    "ends with": lambda a, b: str(a).endswith(str(b)),
-}
 
 
 class DataOperationsComponent(Component):
@@ -97,29 +99,24 @@ class DataOperationsComponent(Component):
 
     @staticmethod
     def remove_keys_recursive(obj, keys_to_remove):
-        if isinstance(obj, dict):
-            return {
-                k: DataOperationsComponent.remove_keys_recursive(v, keys_to_remove)
-                for k, v in obj.items()
-                if k not in keys_to_remove
-            }
-        if isinstance(obj, list):
-            return [DataOperationsComponent.remove_keys_recursive(item, keys_to_remove) for item in obj]
-        return obj
+        return compile_key_remover(keys_to_remove)(obj)
 
     @staticmethod
     def rename_keys_recursive(obj, rename_map):
-        if isinstance(obj, dict):
-            return {
-                rename_map.get(k, k): DataOperationsComponent.rename_keys_recursive(v, rename_map)
-                for k, v in obj.items()
-            }
-        if isinstance(obj, list):
-            return [DataOperationsComponent.rename_keys_recursive(item, rename_map) for item in obj]
-        return obj
+        return compile_key_renamer(rename_map)(obj)
 
     inputs = [
-        DataInput(name="data", display_name="Data", info="Data object to filter.", required=True, is_list=True),
+        DataInput(
+            name="data",
+            display_name="Data",
+            info=(
+                "Data object to filter. A DataFrame is read as {'results': [rows]}; "
+                "Filter Values on 'results' then filters its columns directly."
+            ),
+            input_types=["Data", "DataFrame"],
+            required=True,
+            is_list=True,
+        ),
         SortableListInput(
             name="operations",
             display_name="Operations",
@@ -229,13 +226,16 @@ class DataOperationsComponent(Component):
     def get_data_dict(self) -> dict:
         """Extract data dictionary from Data object."""
         data = self.data[0] if isinstance(self.data, list) and len(self.data) == 1 else self.data
+        if isinstance(data, DataFrame):
+            data = data.to_data()
         return data.model_dump()
 
-    def json_query(self) -> Data:
-        import json
-
-        import jq
+    def get_input_frame(self) -> DataFrame | None:
+        """The input DataFrame, when the input is a single DataFrame."""
+        data = self.data[0] if isinstance(self.data, list) and len(self.data) == 1 else self.data
+        return data if isinstance(data, DataFrame) else None
 
+    def json_query(self) -> Data:
         if not self.query or not self.query.strip():
             msg = "JSON Query is required and cannot be blank."
             raise ValueError(msg)
@@ -245,7 +245,7 @@ class DataOperationsComponent(Component):
             repaired = repair_json(input_str)
             data_json = json.loads(repaired)
             jq_input = data_json["data"] if isinstance(data_json, dict) and "data" in data_json else data_json
-            results = jq.compile(self.query).input(jq_input).all()
+            results = compile_jq(self.query).input(jq_input).all()
             if not results:
                 msg = "No result from JSON query."
                 raise ValueError(msg)
@@ -261,6 +261,16 @@ class DataOperationsComponent(Component):
             msg = f"JSON Query error: {e}"
             raise ValueError(msg) from e
 
+    def get_top_level_data(self) -> dict:
+        """Shallow copy of the input's data, for operations that only replace top-level values.
+
+        Skips the deep copy `model_dump` makes of every nested record.
+        """
+        data = self.data[0] if isinstance(self.data, list) and len(self.data) == 1 else self.data
+        if isinstance(data, DataFrame):
+            data = data.to_data()
+        return dict(data.data)
+
     def get_normalized_data(self) -> dict:
         """Get normalized data dictionary, handling the 'data' key if present."""
         data_dict = self.get_data_dict()
@@ -310,7 +320,7 @@ class DataOperationsComponent(Component):
         data_dict = self.get_normalized_data()
         remove_keys_input: list[str] = self.remove_keys_input
 
-        filtered = DataOperationsComponent.remove_keys_recursive(data_dict, set(remove_keys_input))
+        filtered = compile_key_remover(remove_keys_input)(data_dict)
         return Data(data=filtered)
 
     def rename_keys(self) -> Data:
@@ -319,7 +329,7 @@ class DataOperationsComponent(Component):
         data_dict = self.get_normalized_data()
         rename_keys_input: dict[str, str] = self.rename_keys_input
 
-        renamed = DataOperationsComponent.rename_keys_recursive(data_dict, rename_keys_input)
+        renamed = compile_key_renamer(rename_keys_input)(data_dict)
         return Data(data=renamed)
 
     def recursive_eval(self, data: Any) -> Any:
@@ -328,26 +338,7 @@ class DataOperationsComponent(Component):
         If the value is a string that can be evaluated, it will be evaluated.
         Otherwise, the original value is returned.
         """
-        if isinstance(data, dict):
-            return {k: self.recursive_eval(v) for k, v in data.items()}
-        if isinstance(data, list):
-            return [self.recursive_eval(item) for item in data]
-        if isinstance(data, str):
-            try:
-                # Only attempt to evaluate strings that look like Python literals
-                if (
-                    data.strip().startswith(("{", "[", "(", "'", '"'))
-                    or data.strip().lower() in ("true", "false", "none")
-                    or data.strip().replace(".", "").isdigit()
-                ):
-                    return ast.literal_eval(data)
-                # return data
-            except (ValueError, SyntaxError, TypeError, MemoryError):
-                # If evaluation fails for any reason, return the original string
-                return data
-            else:
-                return data
-        return data
+        return literal_eval_strings(data)
 
     def evaluate_data(self) -> Data:
         """Evaluate string values in the data dictionary."""
@@ -365,7 +356,8 @@ class DataOperationsComponent(Component):
             msg = "Combine operation requires multiple data inputs."
             raise ValueError(msg)
 
-        data_dicts = [data.model_dump().get("data", data.model_dump()) for data in self.data]
+        dumps = [(data.to_data() if isinstance(data, DataFrame) else data).model_dump() for data in self.data]
+        data_dicts = [dump.get("data", dump) for dump in dumps]
         combined_data = {}
 
         for data_dict in data_dicts:
@@ -399,15 +391,9 @@ class DataOperationsComponent(Component):
             self.status = "Filter key or value is missing."
             return input_data
 
-        # Filter the data
-        filtered_data = []
-        for item in input_data:
-            if isinstance(item, dict) and filter_key in item:
-                if self.compare_values(item[filter_key], filter_value, operator):
-                    filtered_data.append(item)
-            else:
-                self.status = f"Warning: Some items don't have the key '{filter_key}' or are not dictionaries."
-
+        filtered_data, missing_key = compile_filter([(filter_key, str(filter_value))], operator)(input_data)
+        if missing_key is not None:
+            self.status = f"Warning: Some items don't have the key '{filter_key}' or are not dictionaries."
         return filtered_data
 
     def compare_values(self, item_value: Any, filter_value: str, operator: str) -> bool:
@@ -417,31 +403,44 @@ class DataOperationsComponent(Component):
         return False
 
     def multi_filter_data(self) -> Data:
-        """Apply multiple filters to the data."""
-        self.validate_single_data("Filter Values")
-        data_filtered = self.get_normalized_data()
+        """Apply multiple filters to the data.
 
+        The filter values are compiled once into a single predicate, so each
+        list is filtered in one pass however many values are set.
+        """
+        self.validate_single_data("Filter Values")
+        conditions = filter_conditions(self.filter_values)
+        frame = self.get_input_frame()
+        if frame is not None and list(self.filter_key) == ["results"]:
+            # Columnar path: filter the DataFrame before turning rows into records
+            filtered, missing_key = filter_frame(frame, conditions, self.operator)
+            self._warn_missing_key(missing_key)
+            return Data(data={"results": filtered.to_dict(orient="records")})
+
+        data_filtered = self.get_top_level_data()
+        run_filter = compile_filter(conditions, self.operator)
         for filter_key in self.filter_key:
             if filter_key not in data_filtered:
                 msg = f"Filter key '{filter_key}' not found in data. Available keys: {list(data_filtered.keys())}"
                 raise ValueError(msg)
 
-            if isinstance(data_filtered[filter_key], list):
-                for filter_data in self.filter_values:
-                    filter_value = self.filter_values.get(filter_data)
-                    if filter_value is not None:
-                        data_filtered[filter_key] = self.filter_data(
-                            input_data=data_filtered[filter_key],
-                            filter_key=filter_data,
-                            filter_value=filter_value,
-                            operator=self.operator,
-                        )
-            else:
+            if not isinstance(data_filtered[filter_key], list):
                 msg = f"Filter key '{filter_key}' is not a list."
                 raise TypeError(msg)
+            if not data_filtered[filter_key]:
+                self.status = "Input data is empty."
+            elif conditions:
+                data_filtered[filter_key], missing_key = run_filter(data_filtered[filter_key])
+                self._warn_missing_key(missing_key)
+            if len(conditions) < sum(value is not None for value in self.filter_values.values()):
+                self.status = "Filter key or value is missing."
 
         return Data(**data_filtered)
 
+    def _warn_missing_key(self, missing_key: str | None) -> None:
+        if missing_key is not None:
+            self.status = f"Warning: Some items don't have the key '{missing_key}' or are not dictionaries."
+
     def append_update(self) -> Data:
         """Append or Update with new key-value pairs."""
         self.validate_single_data("Append or Update")
@@ -488,7 +487,7 @@ class DataOperationsComponent(Component):
                 msg = "Missing input data or selected key."
                 raise ValueError(msg)
             input_payload = self.data[0].data if isinstance(self.data, list) else self.data.data
-            compiled = jq.compile(self.selected_key)
+            compiled = compile_jq(self.selected_key)
             result = compiled.input(input_payload).first()
             if isinstance(result, dict):
                 return Data(data=result)
@@ -1,5 +1,8 @@
 from ..base import BaseNode
 from typing import Any, Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
 
 class ParseDataNode(BaseNode):
     """
@@ -24,7 +27,7 @@ class ParseDataNode(BaseNode):
                     source_id = input_edge["source"]
                     source_node = next((n for n in nodes if n["id"] == source_id), None)
                     if source_node and engine:
-                        print(f"🔄 ParseData: Pulling data from node {source_id}...")
+                        logger.debug("🔄 ParseData: Pulling data from node %s...", source_id)
                         data_to_parse = await engine.execute_node(
                             source_node["data"].get("id"), 
                             None, 
@@ -53,16 +56,15 @@ class ParseDataNode(BaseNode):
                         formatted_parts.append(template.format(**full_dict))
                     except KeyError as e:
                         # Fallback if key missing
-                        print(f"⚠️ ParseData Warning: Missing key {e} for template.")
+                        logger.warning("⚠️ ParseData Warning: Missing key %s for template.", e)
                         formatted_parts.append(str(item.get("text") or item))
                 else:
                     formatted_parts.append(str(item))
             
             result = sep.join(formatted_parts)
-            print(f"✅ Formatted {len(formatted_parts)} items into a single message.")
+            logger.debug("✅ Formatted %s items into a single message.", len(formatted_parts))
             return result
             
         except Exception as e:
-            import traceback
-            print(traceback.format_exc())
+            logger.exception("ParseData failed")
             return f"Parse Error: {str(e)}"
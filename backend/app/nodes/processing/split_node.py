@@ -1,6 +1,9 @@
 from ..base import BaseNode
 from typing import Any, Dict, Optional
 from langchain_text_splitters import RecursiveCharacterTextSplitter
+import logging
+
+logger = logging.getLogger(__name__)
 
 class SplitTextNode(BaseNode):
     async def execute(self, input_data: Any = None, context: Optional[Dict[str, Any]] = None) -> Any:
@@ -21,7 +24,7 @@ class SplitTextNode(BaseNode):
                     source_id = input_edge["source"]
                     source_node = next((n for n in nodes if n["id"] == source_id), None)
                     if source_node and engine:
-                        print(f"🔄 SplitText: Pulling data from node {source_id}...")
+                        logger.debug("🔄 SplitText: Pulling data from node %s...", source_id)
                         data_to_split = await engine.execute_node(
                             source_node["data"].get("id"), 
                             None, 
@@ -62,10 +65,9 @@ class SplitTextNode(BaseNode):
                         "metadata": {**metadata, "chunk_index": i}
                     })
             
-            print(f"✅ Split text into {len(results)} chunks.")
+            logger.debug("✅ Split text into %s chunks.", len(results))
             return results
             
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            logger.exception("SplitText failed")
             raise e
@@ -1,11 +1,14 @@
 import importlib
 import pkgutil
 import inspect
+import logging
 import os
 import sys
 from typing import Dict, Type, Any, Optional, List
 from .base import BaseNode
 
+logger = logging.getLogger(__name__)
+
 def register_node(node_id: str):
     """
     Decorator to explicitly register a node with a specific ID.
@@ -58,7 +61,7 @@ class NodeRegistry:
                             if "BaseNode" not in content and "@register_node" not in content:
                                 continue
                     except Exception as e:
-                        print(f"NodeRegistry Error reading {file}: {e}")
+                        logger.error("NodeRegistry Error reading %s: %s", file, e)
                         continue
 
                     # Convert file path to module path
@@ -70,14 +73,14 @@ class NodeRegistry:
                         module_count += 1
                         cls._extract_nodes_from_module(module)
                     except (ImportError, ModuleNotFoundError) as e:
-                        print(f"NodeRegistry Warning: Could not load {module_name} (likely missing dependency: {e})")
+                        logger.warning("NodeRegistry Warning: Could not load %s (likely missing dependency: %s)", module_name, e)
                         pass
                     except Exception as e:
-                        print(f"NodeRegistry Warning: Error loading {module_name}: {e}")
+                        logger.warning("NodeRegistry Warning: Error loading %s: %s", module_name, e)
                         pass
 
         cls._is_scanned = True
-        print(f"NodeRegistry: Scanned {module_count} modules. Registered {len(cls._nodes)} nodes.")
+        logger.info("NodeRegistry: Scanned %s modules. Registered %s nodes.", module_count, len(cls._nodes))
 
     @classmethod
     def _extract_nodes_from_module(cls, module):
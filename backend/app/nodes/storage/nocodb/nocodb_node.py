@@ -1,10 +1,13 @@
 import json
+import logging
 import requests
 from ...base import BaseNode
 from ...registry import register_node
 from typing import Any, Dict, Optional, List
 from langchain_core.tools import Tool
 
+logger = logging.getLogger(__name__)
+
 class NocoDBAPIWrapper:
     def __init__(self, base_url: str, api_key: str):
         self.base_url = base_url.rstrip("/")
@@ -20,35 +23,35 @@ class NocoDBAPIWrapper:
     def fetch_projects(self):
         # NocoDB V1 for projects
         url = f"{self.base_url}/api/v1/db/meta/projects"
-        print(f"📡 NocoDB API: Fetching Projects from {url}")
+        logger.debug("📡 NocoDB API: Fetching Projects from %s", url)
         try:
             response = requests.get(url, headers=self._get_headers(), timeout=10)
             if response.status_code != 200:
                  # Try V2 projects path if V1 fails
                  url = f"{self.base_url}/api/v2/meta/bases"
-                 print(f"📡 NocoDB API: Trying V2 Bases {url}")
+                 logger.debug("📡 NocoDB API: Trying V2 Bases %s", url)
                  response = requests.get(url, headers=self._get_headers(), timeout=10)
             
             response.raise_for_status()
             data = response.json()
             return data.get("list", data) if isinstance(data, dict) else data
         except Exception as e:
-            print(f"❌ NocoDB API Error: {e}")
+            logger.error("❌ NocoDB API Error: %s", e)
             return []
 
     def fetch_tables(self, project_id: str):
         # NocoDB V2 for tables
         url = f"{self.base_url}/api/v2/meta/bases/{project_id}/tables"
-        print(f"📡 NocoDB API: Fetching Tables from {url}")
+        logger.debug("📡 NocoDB API: Fetching Tables from %s", url)
         response = requests.get(url, headers=self._get_headers(), timeout=10)
         
         if response.status_code != 200:
              # Try V1 path fallback
              url = f"{self.base_url}/api/v1/db/meta/projects/{project_id}/tables"
-             print(f"📡 NocoDB API: Trying V1 Tables {url}")
+             logger.debug("📡 NocoDB API: Trying V1 Tables %s", url)
              response = requests.get(url, headers=self._get_headers(), timeout=10)
 
-        print(f"📥 NocoDB API: Status {response.status_code}")
+        logger.debug("📥 NocoDB API: Status %s", response.status_code)
         response.raise_for_status()
         data = response.json()
         return data.get("list", data) if isinstance(data, dict) else data
@@ -67,7 +70,7 @@ class NocoDBAPIWrapper:
         
         # Robust operation normalization
         op_norm = str(operation).strip().lower()
-        print(f"📡 NocoDB API Query: {operation} (Norm: {op_norm}) on {endpoint}")
+        logger.debug("📡 NocoDB API Query: %s (Norm: %s) on %s", operation, op_norm, endpoint)
         
         # Determine method
         if op_norm in ["read", "all", "list", "search"]:
@@ -113,7 +116,7 @@ class NocoDBAPIWrapper:
         else:
             raise ValueError(f"Unsupported operation: {operation}")
             
-        print(f"📥 NocoDB API Query: Status {response.status_code}")
+        logger.debug("📥 NocoDB API Query: Status %s", response.status_code)
         response.raise_for_status()
         return response.json()
 
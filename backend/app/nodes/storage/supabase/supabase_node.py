@@ -1,8 +1,12 @@
 from ...base import BaseNode
 from ...registry import register_node
+from ....core.tracing import get_tracer
 from typing import Any, Dict, Optional
 import uuid
 from supabase import create_client
+import logging
+
+logger = logging.getLogger(__name__)
 
 @register_node("supabase_SupabaseVectorStore")
 class SupabaseStoreNode(BaseNode):
@@ -33,7 +37,7 @@ class SupabaseStoreNode(BaseNode):
                     source_id = ingest_edge["source"]
                     source_node = next((n for n in nodes if n["id"] == source_id), None)
                     if source_node and engine:
-                        print(f"🔄 Supabase: Pulling data from node {source_id}...")
+                        logger.debug("🔄 Supabase: Pulling data from node %s...", source_id)
                         data_to_ingest = await engine.execute_node(
                             source_node["data"].get("id"), 
                             None, 
@@ -95,19 +99,20 @@ class SupabaseStoreNode(BaseNode):
                  docs.append(Document(page_content=str(data_to_ingest)))
 
             if docs:
-                print(f"📡 Supabase: Ingesting {len(docs)} documents into '{table_name}'...")
-                SupabaseVectorStore.from_documents(
-                    docs,
-                    embedding_model,
-                    client=supabase_client,
-                    table_name=table_name,
-                    query_name=self.config.get("query_name", "match_documents")
-                )
+                logger.debug("📡 Supabase: Ingesting %s documents into '%s'...", len(docs), table_name)
+                with get_tracer().span("embedding:supabase.ingest", kind="embedding", documents=len(docs), table=str(table_name)):
+                    SupabaseVectorStore.from_documents(
+                        docs,
+                        embedding_model,
+                        client=supabase_client,
+                        table_name=table_name,
+                        query_name=self.config.get("query_name", "match_documents")
+                    )
                 return f"✅ Success: {len(docs)} documents ingested into '{table_name}'."
             
             return "Supabase Status: ⚠️ Documents list was empty."
         except Exception as e:
-            print(f"❌ Supabase Ingestion Error: {str(e)}")
+            logger.error("❌ Supabase Ingestion Error: %s", e)
             raise e
 
     async def get_langchain_object(self, context: Optional[Dict[str, Any]] = None) -> Any:
@@ -148,7 +153,7 @@ class SupabaseStoreNode(BaseNode):
             
         if not target_tables:
             # Fetch ALL available tables if none selected
-            print(f"🔄 Supabase: No specific table selected. Fetching all available tables...")
+            logger.debug("🔄 Supabase: No specific table selected. Fetching all available tables...")
             all_available = self.fetch_tables(url, key)
             target_tables = [t["value"] for t in all_available]
             
@@ -165,34 +170,36 @@ class SupabaseStoreNode(BaseNode):
                     """Synchronous search function bypassing LangChain for reliability."""
                     from langchain_core.documents import Document
                     
-                    print(f"🔎 Supabase Search Tool invoked for table '{t_name}' with query: '{query}'")
+                    logger.debug("🔎 Supabase Search Tool invoked for table '%s' with query: '%s'", t_name, query)
                     try:
                         if not embedding_model:
                             return f"Error: Search tool for {t_name} lacks a connected embedding model."
                         
                         normalized_query = query.lower().replace("graphique", "figure")
-                        print("Calculating embedding...")
-                        vector = embedding_model.embed_query(normalized_query)
+                        logger.debug("Calculating embedding...")
+                        with get_tracer().span("embedding:embed_query", kind="embedding", model=type(embedding_model).__name__):
+                            vector = embedding_model.embed_query(normalized_query)
                         
-                        print(f"Connecting to Supabase and running RPC '{query_name}' on table '{t_name}'...")
+                        logger.debug("Connecting to Supabase and running RPC '%s' on table '%s'...", query_name, t_name)
                         client = create_client(url, key)
                         
                         # Direct RPC call
-                        response = client.rpc(
-                            query_name,
-                            params={
-                                "query_embedding": vector,
-                                "match_threshold": 0.2,
-                                "match_count": 10,
-                                "table_name": t_name 
-                            }
-                        ).execute()
+                        with get_tracer().span(f"http:supabase.rpc:{query_name}", kind="http", table=t_name):
+                            response = client.rpc(
+                                query_name,
+                                params={
+                                    "query_embedding": vector,
+                                    "match_threshold": 0.2,
+                                    "match_count": 10,
+                                    "table_name": t_name 
+                                }
+                            ).execute()
                         
                         matches = response.data
                         if not matches:
                              return f"No relevant information found in table '{t_name}'."
 
-                        print(f"Found {len(matches)} matches in {t_name}.")
+                        logger.debug("Found %s matches in %s.", len(matches), t_name)
                         
                         import re
                         numbers_in_query = re.findall(r"\d+", query)
@@ -213,7 +220,7 @@ class SupabaseStoreNode(BaseNode):
                         return "\n\n".join([f"--- Context (Table: {t_name}) ---\n{doc.page_content}" for doc in docs])
                         
                     except Exception as e:
-                        print(f"🔄 Supabase Search: Primary call failed ({e}). Starting fallback chain...")
+                        logger.warning("🔄 Supabase Search: Primary call failed (%s). Starting fallback chain...", e)
                         
                         # Fallback Chain: match_properties -> match_documents
                         fallbacks = ["match_properties", "match_documents"]
@@ -228,7 +235,7 @@ class SupabaseStoreNode(BaseNode):
                             
                             for params in param_variations:
                                 try:
-                                    print(f"♻️ Supabase Fallback: Trying '{fallback_func}' with params {list(params.keys())}...")
+                                    logger.warning("♻️ Supabase Fallback: Trying '%s' with params %s...", fallback_func, list(params.keys()))
                                     response = client.rpc(fallback_func, params=params).execute()
                                     matches = response.data
                                     
@@ -238,10 +245,10 @@ class SupabaseStoreNode(BaseNode):
                                             text = match.get("content") or match.get("text") or str(match)
                                             docs.append(Document(page_content=text, metadata=match.get("metadata", {})))
                                         
-                                        print(f"✅ Supabase Search: Success using '{fallback_func}'")
+                                        logger.debug("✅ Supabase Search: Success using '%s'", fallback_func)
                                         return "\n\n".join([f"--- Context (Table: {t_name}) ---\n{doc.page_content}" for doc in docs])
                                     else:
-                                        print(f"ℹ️ Supabase: '{fallback_func}' (params: {list(params.keys())}) returned 0 results.")
+                                        logger.debug("ℹ️ Supabase: '%s' (params: %s) returned 0 results.", fallback_func, list(params.keys()))
                                         # If it returned no results (but didn't error), it's a valid function but no matches.
                                         # We'll continue to see if another function/param-set finds something.
                                         
@@ -263,7 +270,7 @@ class SupabaseStoreNode(BaseNode):
                 func=create_search_func(current_table)
             ))
             
-        print(f"✅ Supabase: Generated {len(tools)} search tools.")
+        logger.debug("✅ Supabase: Generated %s search tools.", len(tools))
         return tools
 
     @staticmethod
@@ -279,7 +286,7 @@ class SupabaseStoreNode(BaseNode):
         elif not base_url.endswith("/"):
              base_url = f"{base_url}/"
             
-        print(f"📡 Supabase: Introspecting tables from {base_url}")
+        logger.debug("📡 Supabase: Introspecting tables from %s", base_url)
         
         headers = {
             "apikey": key.strip(),
@@ -305,19 +312,19 @@ class SupabaseStoreNode(BaseNode):
                         continue
                     tables.append({"label": table_name, "value": table_name})
                     
-                print(f"✅ Supabase Import: Found {len(tables)} tables via OpenAPI.")
+                logger.debug("✅ Supabase Import: Found %s tables via OpenAPI.", len(tables))
             
             # 2. Fallback: If OpenAPI is disabled (common in prod), try querying information_schema via RPC?
             # Creating a generic RPC function 'get_tables' is the safest fallback if this fails.
             # But let's assume the user has standard PostgREST access.
             
             if not tables:
-                print("⚠️ Supabase: No tables found via introspection. Check permissions.")
+                logger.warning("⚠️ Supabase: No tables found via introspection. Check permissions.")
                 # We return an empty list rather than hardcoded values, forcing the user to fix permissions or config.
                 return []
                 
             return tables
             
         except Exception as e:
-            print(f"❌ Supabase Introspection Failed: {e}")
+            logger.error("❌ Supabase Introspection Failed: %s", e)
             return []
@@ -1,3 +1,4 @@
+import logging
 from langchain_community.vectorstores import SupabaseVectorStore
 from supabase.client import Client, create_client
 
@@ -6,6 +7,8 @@ from lfx.helpers.data import docs_to_data
 from lfx.io import HandleInput, IntInput, SecretStrInput, StrInput, DropdownInput
 from lfx.schema.data import Data
 
+logger = logging.getLogger(__name__)
+
 class SupabaseVectorStoreComponent(LCVectorStoreComponent):
     display_name = "Supabase"
     description = "Supabase Vector Store with search capabilities"
@@ -14,7 +17,7 @@ class SupabaseVectorStoreComponent(LCVectorStoreComponent):
     
     @staticmethod
     def fetch_tables_from_supabase(base_url: str, api_key: str):
-        print(f"📡 Debug: Dynamically fetching tables from {base_url}")
+        logger.debug("📡 Debug: Dynamically fetching tables from %s", base_url)
         import requests
         try:
             headers = {
@@ -29,13 +32,13 @@ class SupabaseVectorStoreComponent(LCVectorStoreComponent):
             if response.status_code == 200:
                 data = response.json()
                 tables = list(data.get("definitions", {}).keys())
-                print(f"✅ Found tables: {tables}")
+                logger.debug("✅ Found tables: %s", tables)
                 return tables
             
             # Fallback to hardcoded list if discovery fails
             return ["test", "documents", "vectors", "embeddings"]
         except Exception as e:
-             print(f"❌ Error fetching tables: {str(e)}")
+             logger.error("❌ Error fetching tables: %s", str(e))
              return ["test", "documents", "vectors", "embeddings"]
 
     inputs = [
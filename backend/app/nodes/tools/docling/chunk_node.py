@@ -1,7 +1,9 @@
+import logging
 from ...base import BaseNode
 from typing import Any, Dict, Optional
 import json
-import traceback
+
+logger = logging.getLogger(__name__)
 
 class ChunkDoclingNode(BaseNode):
     async def execute(self, input_data: Any = None, context: Optional[Dict[str, Any]] = None) -> Any:
@@ -51,7 +53,7 @@ class ChunkDoclingNode(BaseNode):
             )
 
             for index, item in enumerate(data_to_chunk):
-                print(f"📦 Chunk Processing Item {index}: Type={type(item)}")
+                logger.debug("📦 Chunk Processing Item %s: Type=%s", index, type(item))
                 
                 if isinstance(item, dict):
                     text_content = item.get("text", "")
@@ -64,7 +66,7 @@ class ChunkDoclingNode(BaseNode):
 
                 # Intelligent Choice:
                 if text_content and ("![" in text_content or self.config.get("force_text_chunking")):
-                    print("🧠 ChunkDocling: Using Enriched Text splitting...")
+                    logger.debug("🧠 ChunkDocling: Using Enriched Text splitting...")
                     chunks = splitter.split_text(text_content)
                     for i, chunk_text in enumerate(chunks):
                         results.append({
@@ -79,7 +81,7 @@ class ChunkDoclingNode(BaseNode):
                 elif doc_obj:
                     from docling_core.transforms.chunker.hierarchical_chunker import HierarchicalChunker
                     chunker = HierarchicalChunker()
-                    print(f"📄 ChunkDocling: Using Hierarchical Chunker...")
+                    logger.debug("📄 ChunkDocling: Using Hierarchical Chunker...")
                     
                     c_idx = 0
                     for chunk in chunker.chunk(dl_doc=doc_obj):
@@ -99,7 +101,7 @@ class ChunkDoclingNode(BaseNode):
             return results
             
         except Exception as e:
-            traceback.print_exc()
+            logger.exception("Chunking failed")
             return f"Chunking Error: {str(e)}"
 
     async def get_langchain_object(self, context: Optional[Dict[str, Any]] = None) -> Any:
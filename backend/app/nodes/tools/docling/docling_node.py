@@ -1,10 +1,12 @@
+import logging
 from ...base import BaseNode
 from typing import Any, Dict, Optional
 import os
 import urllib.parse
-import traceback
 import uuid
 
+logger = logging.getLogger(__name__)
+
 class DoclingNode(BaseNode):
     async def execute(self, input_data: Any = None, context: Optional[Dict[str, Any]] = None) -> Any:
         try:
@@ -52,7 +54,7 @@ class DoclingNode(BaseNode):
             if not os.path.exists(path):
                 return f"Error: File not found for Docling at {path}"
 
-            print(f"📄 Docling: Vision Processing {path}...")
+            logger.debug("📄 Docling: Vision Processing %s...", path)
             
             from docling.datamodel.base_models import InputFormat
             from docling.document_converter import DocumentConverter, PdfFormatOption
@@ -132,7 +134,7 @@ class DoclingNode(BaseNode):
                         markdown_parts.append(img_markdown)
                         
                     except Exception as e:
-                        print(f"⚠️ Docling: Figure save failed: {e}")
+                        logger.warning("⚠️ Docling: Figure save failed: %s", e)
                 
                 # If it's a structural element (Text, Table, Header)
                 else:
@@ -162,7 +164,7 @@ class DoclingNode(BaseNode):
             }]
             
         except Exception as e:
-            traceback.print_exc()
+            logger.exception("Docling conversion failed")
             raise e
 
     async def get_langchain_object(self, context: Optional[Dict[str, Any]] = None) -> Any:
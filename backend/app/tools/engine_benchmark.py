@@ -0,0 +1,367 @@
+"""
+Offline benchmark for the workflow engine.
+
+Builds synthetic graphs of a configurable size and shape and runs them
+through `AgentEngine.process_workflow` with stub LLM, embedding and
+vector-store nodes whose latency is controlled, so no network or API keys
+are needed. Reported per shape:
+
+- overhead: engine time per hop with zero-latency stubs
+- latency:  p50/p95/p99 of whole runs with the configured stub latency
+- throughput: runs/s with N runs in flight
+- memory: peak traced allocation per in-flight run
+
+Shapes: linear (chain of LLM nodes), fanout (a merge node pulling N branches
+concurrently), router (N router levels picking one of two branches), rag
+(split -> embed -> vector store ingest of an N-chunk document). The engine
+stops after 20 hops, so linear/router graphs deeper than that are cut short;
+the report records the hops actually executed.
+
+Usage (from backend/):
+    python -m app.tools.engine_benchmark --shapes linear,router --size 10 \\
+        --runs 200 --concurrency 32 --latency-ms 5 --output bench.json \\
+        --baseline baseline.json --tolerance 0.2
+
+With --baseline the exit code is 1 when a metric regresses by more than
+--tolerance, so CI can gate on it.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+if __name__ == "__main__":
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from app.nodes.base import BaseNode
+from app.nodes.registry import register_node
+
+SHAPES = ("linear", "fanout", "router", "rag")
+
+
+class _StubNode(BaseNode):
+    """Base for benchmark stubs: sleeps for `latency_ms` (+/- `jitter`)."""
+
+    async def _wait(self):
+        latency = float(self.config.get("latency_ms") or 0) / 1000.0
+        if latency <= 0:
+            return
+        jitter = float(self.config.get("jitter") or 0)
+        if jitter:
+            latency *= 1 + random.uniform(-jitter, jitter)
+        await asyncio.sleep(latency)
+
+
+@register_node("benchLLM")
+class BenchLLMNode(_StubNode):
+    async def execute(self, input_data: Any, context: Optional[Dict[str, Any]] = None) -> Any:
+        await self._wait()
+        text = input_data if isinstance(input_data, str) else str(input_data)
+        return f"{self.config.get('label', 'llm')}: {text[:256]}"
+
+
+@register_node("benchEmbedding")
+class BenchEmbeddingNode(_StubNode):
+    async def execute(self, input_data: Any, context: Optional[Dict[str, Any]] = None) -> Any:
+        await self._wait()
+        chunks = input_data if isinstance(input_data, list) else [input_data]
+        dim = int(self.config.get("dimensions") or 384)
+        vectors = []
+        for chunk in chunks:
+            seed = int.from_bytes(hashlib.blake2b(str(chunk).encode(), digest_size=8).digest(), "big")
+            vectors.append([((seed >> (i % 56)) & 0xFF) / 255.0 for i in range(dim)])
+        return {"chunks": chunks, "vectors": vectors}
+
+
+_vector_stores: Dict[str, deque] = {}
+
+
+@register_node("benchVectorStore")
+class BenchVectorStoreNode(_StubNode):
+    async def execute(self, input_data: Any, context: Optional[Dict[str, Any]] = None) -> Any:
+        await self._wait()
+        store = _vector_stores.setdefault(self.config.get("collection", "default"), deque(maxlen=10000))
+        if isinstance(input_data, dict) and "vectors" in input_data:
+            store.extend(zip(input_data["chunks"], input_data["vectors"]))
+            return f"Ingested {len(input_data['vectors'])} chunks."
+        top_k = int(self.config.get("top_k") or 4)
+        return "\n".join(str(chunk) for chunk, _ in list(store)[-top_k:])
+
+
+@register_node("benchSplitter")
+class BenchSplitterNode(BaseNode):
+    async def execute(self, input_data: Any, context: Optional[Dict[str, Any]] = None) -> Any:
+        text = input_data if isinstance(input_data, str) else str(input_data)
+        size = int(self.config.get("chunk_size") or 500)
+        return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@register_node("benchRouter")
+class BenchRouterNode(BaseNode):
+    """Picks one of the outgoing routes deterministically from the input."""
+
+    async def execute(self, input_data: Any, context: Optional[Dict[str, Any]] = None) -> Any:
+        routes = (context or {}).get("routes") or []
+        if not routes:
+            return input_data
+        digest = hashlib.blake2b(str(input_data).encode(), digest_size=4).digest()
+        return routes[int.from_bytes(digest, "big") % len(routes)]["target_id"]
+
+
+@register_node("benchMerge")
+class BenchMergeNode(BaseNode):
+    """Fan-out/fan-in: pulls every node wired into its 'branch' handle concurrently."""
+
+    async def execute(self, input_data: Any, context: Optional[Dict[str, Any]] = None) -> Any:
+        context = context or {}
+        graph = context.get("graph_data", {})
+        engine = context.get("engine")
+        nodes = {n["id"]: n for n in graph.get("nodes", [])}
+        sources = [e["source"] for e in graph.get("edges", [])
+                   if e["target"] == context.get("node_id") and e.get("targetHandle") == "branch"]
+        results = await asyncio.gather(*[
+            engine.execute_node(nodes[s]["data"]["id"], input_data, config=nodes[s]["data"],
+                                context={**context, "node_id": s})
+            for s in sources if s in nodes
+        ])
+        return "\n".join(str(r) for r in results)
+
+
+def _node(node_id: str, reg_id: str, **data) -> Dict[str, Any]:
+    return {"id": node_id, "type": "genericNode", "data": {"id": reg_id, **data}}
+
+
+def _edge(source: str, target: str, **extra) -> Dict[str, Any]:
+    return {"id": f"{source}->{target}", "source": source, "target": target, **extra}
+
+
+def build_graph(shape: str, size: int, latency_ms: float, jitter: float = 0.0) -> Dict[str, Any]:
+    """Returns a graph of `shape` with `size` stub stages."""
+    stub = {"latency_ms": latency_ms, "jitter": jitter}
+    nodes = [_node("input", "chatInput")]
+    edges = []
+
+    if shape == "linear":
+        prev = "input"
+        for i in range(size):
+            nodes.append(_node(f"llm-{i}", "benchLLM", label=f"llm-{i}", **stub))
+            edges.append(_edge(prev, f"llm-{i}"))
+            prev = f"llm-{i}"
+
+    elif shape == "fanout":
+        nodes.append(_node("merge", "benchMerge"))
+        edges.append(_edge("input", "merge"))
+        for i in range(size):
+            nodes.append(_node(f"branch-{i}", "benchLLM", label=f"branch-{i}", **stub))
+            edges.append(_edge(f"branch-{i}", "merge", targetHandle="branch"))
+        nodes.append(_node("summary", "benchLLM", label="summary", **stub))
+        edges.append(_edge("merge", "summary"))
+
+    elif shape == "router":
+        prev = "input"
+        for i in range(size):
+            nodes.append(_node(f"router-{i}", "benchRouter"))
+            if prev:
+                edges.append(_edge(prev, f"router-{i}"))
+            for side in ("a", "b"):
+                nodes.append(_node(f"llm-{i}{side}", "benchLLM", label=f"llm-{i}{side}", **stub))
+                edges.append(_edge(f"router-{i}", f"llm-{i}{side}", label=side))
+                if i + 1 < size:
+                    edges.append(_edge(f"llm-{i}{side}", f"router-{i + 1}"))
+            prev = None
+
+    elif shape == "rag":
+        nodes += [
+            _node("splitter", "benchSplitter", chunk_size=500),
+            _node("embedding", "benchEmbedding", **stub),
+            _node("store", "benchVectorStore", collection="bench", **stub),
+        ]
+        edges += [_edge("input", "splitter"), _edge("splitter", "embedding"), _edge("embedding", "store")]
+
+    else:
+        raise ValueError(f"Unknown shape '{shape}' (expected one of {', '.join(SHAPES)})")
+
+    return {"nodes": nodes, "edges": edges}
+
+
+def build_message(shape: str, size: int, index: int) -> str:
+    if shape == "rag":
+        # One 500-char chunk per stage
+        return " ".join(f"doc{index} sentence {i}." for i in range(size * 25))
+    return f"benchmark message {index}"
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100.0 * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class EngineBenchmark:
+    def __init__(self, engine=None):
+        if engine is None:
+            from app.core.engine import engine
+        self.engine = engine
+
+    async def _run_once(self, graph: Dict[str, Any], message: str) -> Dict[str, float]:
+        hops = 0
+
+        async def count_hops(event_type, node_id, data=None):
+            nonlocal hops
+            if event_type == "node_end":
+                hops += 1
+
+        started = time.perf_counter()
+        await self.engine.process_workflow(graph, message, broadcaster=count_hops)
+        return {"seconds": time.perf_counter() - started, "hops": hops}
+
+    async def _run_many(self, make_run: Callable[[int], Any], runs: int, concurrency: int) -> List[Dict[str, float]]:
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def bounded(i):
+            async with semaphore:
+                return await make_run(i)
+
+        return await asyncio.gather(*[bounded(i) for i in range(runs)])
+
+    async def run_shape(self, shape: str, size: int, runs: int, concurrency: int,
+                        latency_ms: float, jitter: float = 0.0, warmup: int = 5) -> Dict[str, Any]:
+        # Engine overhead: zero-latency stubs, one run at a time
+        bare = build_graph(shape, size, 0.0)
+        for i in range(warmup):
+            await self._run_once(bare, build_message(shape, size, i))
+        samples = await self._run_many(lambda i: self._run_once(bare, build_message(shape, size, i)), runs, 1)
+        hops = max(s["hops"] for s in samples) or 1
+        per_hop = [s["seconds"] / max(s["hops"], 1) for s in samples]
+
+        # Latency and throughput with the configured stub latency
+        graph = build_graph(shape, size, latency_ms, jitter)
+        started = time.perf_counter()
+        loaded = await self._run_many(lambda i: self._run_once(graph, build_message(shape, size, i)), runs, concurrency)
+        wall = time.perf_counter() - started
+        latencies = [s["seconds"] * 1000 for s in loaded]
+
+        # Memory: peak traced allocation with `concurrency` runs in flight
+        tracemalloc.start()
+        try:
+            base_current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            await self._run_many(lambda i: self._run_once(bare, build_message(shape, size, i)), concurrency, concurrency)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return {
+            "shape": shape,
+            "size": size,
+            "hops": hops,
+            "runs": runs,
+            "concurrency": concurrency,
+            "stub_latency_ms": latency_ms,
+            "overhead_per_hop_us": {
+                "p50": round(percentile(per_hop, 50) * 1e6, 1),
+                "p95": round(percentile(per_hop, 95) * 1e6, 1),
+                "mean": round(sum(per_hop) / len(per_hop) * 1e6, 1),
+            },
+            "latency_ms": {
+                "p50": round(percentile(latencies, 50), 3),
+                "p95": round(percentile(latencies, 95), 3),
+                "p99": round(percentile(latencies, 99), 3),
+                "max": round(max(latencies), 3),
+            },
+            "throughput_rps": round(runs / wall, 1) if wall else 0.0,
+            "memory_per_run_kb": round(max(peak - base_current, 0) / max(concurrency, 1) / 1024, 1),
+        }
+
+    async def run(self, shapes: List[str], size: int, runs: int, concurrency: int,
+                  latency_ms: float, jitter: float = 0.0) -> Dict[str, Any]:
+        results = []
+        for shape in shapes:
+            results.append(await self.run_shape(shape, size, runs, concurrency, latency_ms, jitter))
+        return {
+            "meta": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            },
+            "results": results,
+        }
+
+
+# Metrics compared against a baseline and whether higher values are worse
+BASELINE_METRICS = {
+    ("overhead_per_hop_us", "p50"): True,
+    ("latency_ms", "p95"): True,
+    ("latency_ms", "p99"): True,
+    ("throughput_rps",): False,
+    ("memory_per_run_kb",): True,
+}
+
+
+def compare_to_baseline(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Returns a description of every metric that regressed by more than `tolerance`."""
+    previous = {(r["shape"], r["size"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for result in report["results"]:
+        base = previous.get((result["shape"], result["size"]))
+        if not base:
+            continue
+        for path, higher_is_worse in BASELINE_METRICS.items():
+            new, old = result, base
+            for key in path:
+                new, old = new.get(key), (old or {}).get(key)
+            if not isinstance(new, (int, float)) or not isinstance(old, (int, float)) or old <= 0:
+                continue
+            change = (new - old) / old
+            if (change if higher_is_worse else -change) > tolerance:
+                regressions.append(f"{result['shape']}: {'.'.join(path)} {old} -> {new} ({change:+.0%})")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline engine overhead benchmark.")
+    parser.add_argument("--shapes", default=",".join(SHAPES), help="Comma-separated: " + ", ".join(SHAPES))
+    parser.add_argument("--size", type=int, default=8, help="Stages per graph")
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Stub model latency")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Relative stub latency jitter, e.g. 0.2")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", help="Previous JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(stream=sys.stderr, level=logging.ERROR)
+    shapes = [s.strip() for s in args.shapes.split(",") if s.strip()]
+    report = asyncio.run(EngineBenchmark().run(shapes, args.size, args.runs, args.concurrency, args.latency_ms, args.jitter))
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare_to_baseline(report, json.load(f), args.tolerance)
+        report["regressions"] = regressions
+        exit_code = 1 if regressions else 0
+
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload)
+    else:
+        print(payload)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
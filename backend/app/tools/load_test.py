@@ -0,0 +1,322 @@
+"""
+In-process load generator for the Studio API.
+
+Drives the FastAPI app directly over ASGI (no sockets, no server process)
+with scripted scenarios, using the stub nodes from `engine_benchmark` so no
+model provider is called:
+
+- chat:    bursts of POST /run (sync or job mode) on stub graphs
+- editors: many clients connected to /ws while a chat burst is broadcast
+- library: concurrent GET /nodes and /workflows/list
+
+For each endpoint the report gives request count, errors, throughput and
+p50/p95/p99 latency; for each scenario it gives event-loop lag sampled while
+the scenario ran.
+
+Usage (from backend/):
+    python -m app.tools.load_test --scenarios chat,editors,library \\
+        --requests 500 --concurrency 50 --editors 200 --output load.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+if __name__ == "__main__":
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from app.core.run_queue import FINISHED
+from app.tools.engine_benchmark import build_graph, build_message, percentile
+
+SCENARIOS = ("chat", "editors", "library")
+
+
+class AsgiClient:
+    """Minimal in-process ASGI client for HTTP requests, WebSockets and lifespan."""
+
+    def __init__(self, app):
+        self.app = app
+        self._lifespan_queue: Optional[asyncio.Queue] = None
+        self._lifespan_task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _scope(kind: str, path: str, method: str = "GET", headers: Optional[List[Tuple[bytes, bytes]]] = None) -> Dict[str, Any]:
+        path, _, query = path.partition("?")
+        return {
+            "type": kind, "asgi": {"version": "3.0"}, "http_version": "1.1",
+            "method": method, "scheme": "http" if kind == "http" else "ws",
+            "path": path, "raw_path": path.encode(), "query_string": query.encode(),
+            "root_path": "", "headers": [(b"host", b"loadtest")] + (headers or []),
+            "client": ("127.0.0.1", 50000), "server": ("loadtest", 80), "subprotocols": [],
+        }
+
+    async def request(self, method: str, path: str, body: Any = None) -> Tuple[int, bytes]:
+        payload = json.dumps(body).encode() if body is not None else b""
+        headers = [(b"content-type", b"application/json"), (b"content-length", str(len(payload)).encode())]
+        scope = self._scope("http", path, method, headers)
+        sent_body = False
+        disconnected = asyncio.Event()
+        status, chunks = 0, []
+
+        async def receive():
+            nonlocal sent_body
+            if not sent_body:
+                sent_body = True
+                return {"type": "http.request", "body": payload, "more_body": False}
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            disconnected.set()
+        return status, b"".join(chunks)
+
+    async def websocket(self, path: str) -> "AsgiWebSocket":
+        ws = AsgiWebSocket()
+        ws.task = asyncio.create_task(self.app(self._scope("websocket", path), ws._from_client.get, ws._on_send))
+        await ws._from_client.put({"type": "websocket.connect"})
+        await ws.accepted.wait()
+        return ws
+
+    async def startup(self):
+        self._lifespan_queue = asyncio.Queue()
+        done = asyncio.Event()
+
+        async def send(message):
+            if message["type"].startswith("lifespan.startup"):
+                done.set()
+
+        self._lifespan_task = asyncio.create_task(self.app({"type": "lifespan", "asgi": {"version": "3.0"}}, self._lifespan_queue.get, send))
+        await self._lifespan_queue.put({"type": "lifespan.startup"})
+        await done.wait()
+
+    async def shutdown(self):
+        if self._lifespan_task is None:
+            return
+        await self._lifespan_queue.put({"type": "lifespan.shutdown"})
+        try:
+            await asyncio.wait_for(self._lifespan_task, timeout=10)
+        except asyncio.TimeoutError:
+            self._lifespan_task.cancel()
+
+
+class AsgiWebSocket:
+    def __init__(self):
+        self._from_client: asyncio.Queue = asyncio.Queue()
+        self.accepted = asyncio.Event()
+        self.closed = asyncio.Event()
+        self.received = 0
+        self.task: Optional[asyncio.Task] = None
+
+    async def _on_send(self, message):
+        kind = message["type"]
+        if kind == "websocket.accept":
+            self.accepted.set()
+        elif kind == "websocket.send":
+            self.received += 1
+        elif kind == "websocket.close":
+            self.accepted.set()
+            self.closed.set()
+
+    async def close(self):
+        await self._from_client.put({"type": "websocket.disconnect", "code": 1000})
+        try:
+            await asyncio.wait_for(self.task, timeout=5)
+        except (asyncio.TimeoutError, Exception):
+            self.task.cancel()
+
+
+class LoopLagSampler:
+    """Measures how late a periodic sleep wakes up while a scenario runs."""
+
+    def __init__(self, interval: float = 0.02):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _sample(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - expected) * 1000)
+
+    def __enter__(self):
+        self._task = asyncio.get_running_loop().create_task(self._sample())
+        return self
+
+    def __exit__(self, *exc):
+        self._task.cancel()
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "p50_ms": round(percentile(self.samples, 50), 3),
+            "p99_ms": round(percentile(self.samples, 99), 3),
+            "max_ms": round(max(self.samples, default=0.0), 3),
+        }
+
+
+class LoadTest:
+    def __init__(self, app, requests: int, concurrency: int, editors: int, shape: str, size: int,
+                 latency_ms: float, run_mode: str = "sync"):
+        self.client = AsgiClient(app)
+        self.requests = requests
+        self.concurrency = concurrency
+        self.editors = editors
+        self.graph = build_graph(shape, size, latency_ms)
+        self.shape, self.size = shape, size
+        self.run_mode = run_mode
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    async def _timed(self, name: str, method: str, path: str, body: Any = None) -> Tuple[int, bytes]:
+        started = time.perf_counter()
+        try:
+            status, data = await self.client.request(method, path, body)
+        except Exception:
+            status, data = 599, b""
+        self.latencies[name].append((time.perf_counter() - started) * 1000)
+        if status >= 400:
+            self.errors[name] += 1
+        return status, data
+
+    async def _burst(self, calls, count: int):
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+
+        async def bounded(i):
+            async with semaphore:
+                await calls(i)
+
+        await asyncio.gather(*[bounded(i) for i in range(count)])
+
+    async def _chat(self, i: int):
+        body = {"message": build_message(self.shape, self.size, i), "graph": self.graph, "mode": self.run_mode}
+        if self.run_mode != "job":
+            await self._timed("POST /run", "POST", "/run", body)
+            return
+        started = time.perf_counter()
+        status, data = await self._timed("POST /run (enqueue)", "POST", "/run", body)
+        if status >= 400:
+            return
+        run_id = json.loads(data).get("run_id")
+        while True:
+            status, data = await self.client.request("GET", f"/runs/{run_id}")
+            if status >= 400 or json.loads(data).get("status") in FINISHED:
+                break
+            await asyncio.sleep(0.01)
+        self.latencies["run (job, end to end)"].append((time.perf_counter() - started) * 1000)
+
+    async def scenario_chat(self) -> Dict[str, Any]:
+        await self._burst(self._chat, self.requests)
+        return {}
+
+    async def scenario_editors(self) -> Dict[str, Any]:
+        connect_ms = []
+        sockets = []
+        for _ in range(self.editors):
+            started = time.perf_counter()
+            sockets.append(await self.client.websocket("/ws"))
+            connect_ms.append((time.perf_counter() - started) * 1000)
+        try:
+            await self._burst(self._chat, self.requests)
+            await asyncio.sleep(0.2)  # let the relay drain
+        finally:
+            await asyncio.gather(*[ws.close() for ws in sockets])
+        received = [ws.received for ws in sockets]
+        return {
+            "editors": self.editors,
+            "ws_connect_ms": {"p50": round(percentile(connect_ms, 50), 3), "p99": round(percentile(connect_ms, 99), 3)},
+            "events_per_editor": {"min": min(received, default=0), "max": max(received, default=0)},
+            "events_delivered": sum(received),
+        }
+
+    async def scenario_library(self) -> Dict[str, Any]:
+        async def fetch(i):
+            if i % 4 == 3:
+                await self._timed("GET /workflows/list", "GET", "/workflows/list")
+            else:
+                await self._timed("GET /nodes", "GET", "/nodes")
+
+        await self._burst(fetch, self.requests)
+        return {}
+
+    async def run(self, scenarios: List[str]) -> Dict[str, Any]:
+        report: Dict[str, Any] = {"scenarios": {}}
+        await self.client.startup()
+        try:
+            for name in scenarios:
+                handler = getattr(self, f"scenario_{name}", None)
+                if handler is None:
+                    raise ValueError(f"Unknown scenario '{name}' (expected one of {', '.join(SCENARIOS)})")
+                self.latencies.clear()
+                self.errors.clear()
+                started = time.perf_counter()
+                with LoopLagSampler() as lag:
+                    extra = await handler()
+                wall = time.perf_counter() - started
+                report["scenarios"][name] = {
+                    "seconds": round(wall, 3),
+                    "loop_lag": lag.summary(),
+                    "endpoints": {
+                        endpoint: {
+                            "requests": len(values),
+                            "errors": self.errors.get(endpoint, 0),
+                            "throughput_rps": round(len(values) / wall, 1) if wall else 0.0,
+                            "p50_ms": round(percentile(values, 50), 3),
+                            "p95_ms": round(percentile(values, 95), 3),
+                            "p99_ms": round(percentile(values, 99), 3),
+                        }
+                        for endpoint, values in self.latencies.items()
+                    },
+                    **extra,
+                }
+        finally:
+            await self.client.shutdown()
+        return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="In-process load test of the Studio API.")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Comma-separated: " + ", ".join(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--editors", type=int, default=50, help="WebSocket clients in the editors scenario")
+    parser.add_argument("--shape", default="linear", help="Stub graph shape used by /run (see engine_benchmark)")
+    parser.add_argument("--size", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Stub model latency")
+    parser.add_argument("--run-mode", choices=("sync", "job"), default="sync")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    # Keep the app's own logging out of the report
+    os.environ.setdefault("LOG_LEVEL", "ERROR")
+    from app.api.main import app
+
+    load_test = LoadTest(app, args.requests, args.concurrency, args.editors, args.shape, args.size,
+                         args.latency_ms, args.run_mode)
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    report = asyncio.run(load_test.run(scenarios))
+
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload)
+    else:
+        print(payload)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,19 @@
 import os
-import json
-import shutil
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from app.core.serialization import dumps, loads
+
+
+def _dump_json(obj: Dict, path: str):
+    with open(path, "wb") as f:
+        f.write(dumps(obj, indent=True))
+
+
+def _load_json(path: str):
+    with open(path, "rb") as f:
+        return loads(f.read())
+
 class WorkflowStore:
     """
     Manages persistence of React Flow workflows.
@@ -14,6 +24,8 @@ class WorkflowStore:
         # backend/scripts/store.py -> backend/workflows/
         self.storage_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "workflows"))
         os.makedirs(self.storage_dir, exist_ok=True)
+        # filename -> (mtime, listing entry); avoids re-parsing whole graphs on every list
+        self._listing_cache: Dict[str, tuple] = {}
         
     def save_workflow(self, name: str, graph: Dict) -> Dict:
         """Saves a workflow to a JSON file."""
@@ -27,9 +39,8 @@ class WorkflowStore:
             "graph": graph
         }
         
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
-            
+        _dump_json(metadata, path)
+
         return {"status": "success", "file": filename, "path": path}
         
     def list_workflows(self) -> List[Dict]:
@@ -39,13 +50,19 @@ class WorkflowStore:
             if filename.endswith(".json"):
                 path = os.path.join(self.storage_dir, filename)
                 try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        workflows.append({
-                            "name": data.get("name", filename.replace(".json", "")),
-                            "last_modified": data.get("last_modified"),
-                            "filename": filename
-                        })
+                    mtime = os.path.getmtime(path)
+                    cached = self._listing_cache.get(filename)
+                    if cached and cached[0] == mtime:
+                        workflows.append(cached[1])
+                        continue
+                    data = _load_json(path)
+                    entry = {
+                        "name": data.get("name", filename.replace(".json", "")),
+                        "last_modified": data.get("last_modified"),
+                        "filename": filename
+                    }
+                    self._listing_cache[filename] = (mtime, entry)
+                    workflows.append(entry)
                 except Exception:
                     continue # Skip corrupted files
         
@@ -57,8 +74,7 @@ class WorkflowStore:
         if not os.path.exists(path):
             return None
             
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return _load_json(path)
 
 # Global singleton
 workflow_store = WorkflowStore()